@@ -6,7 +6,6 @@ from typing import List, Optional
 
 import typer
 from importlib.metadata import version as _version
-from bfcl_eval._llm_response_generation import main as generation_main
 from bfcl_eval.constants.category_mapping import TEST_COLLECTION_MAPPING
 from bfcl_eval.constants.eval_config import (
     DOTENV_PATH,
@@ -15,7 +14,9 @@ from bfcl_eval.constants.eval_config import (
     SCORE_PATH,
 )
 from bfcl_eval.constants.model_config import MODEL_CONFIG_MAPPING
-from bfcl_eval.eval_checker.eval_runner import main as evaluation_main
+from bfcl_eval.model_handler.generation_metrics import DEFAULT_METRICS_INTERVAL
+from bfcl_eval.model_handler.response_cache import PASSTHROUGH
+from bfcl_eval.model_handler.result_writer import DEFAULT_FSYNC_INTERVAL
 from dotenv import load_dotenv
 from tabulate import tabulate
 
@@ -120,6 +121,21 @@ def generate(
     ),
     num_gpus: int = typer.Option(1, help="The number of GPUs to use."),
     num_threads: Optional[int] = typer.Option(None, help="The number of threads to use."),
+    max_parallel_models: int = typer.Option(
+        1,
+        "--max-parallel-models",
+        help="Number of models whose results are generated at the same time. Each of them uses up to `--num-threads` threads.",
+    ),
+    max_local_servers: int = typer.Option(
+        1,
+        "--max-local-servers",
+        help="Number of local inference servers running at the same time, each on its own port and `--num-gpus` GPUs.",
+    ),
+    use_async: bool = typer.Option(
+        False,
+        "--use-async",
+        help="Run the inference on an asyncio event loop instead of a thread pool; `--num-threads` then caps the number of concurrent requests.",
+    ),
     gpu_memory_utilization: float = typer.Option(0.9, help="The GPU memory utilization."),
     backend: str = typer.Option("vllm", help="The backend to use for the model."),
     skip_server_setup: bool = typer.Option(
@@ -143,11 +159,46 @@ def generate(
         "-o",
         help="Allow overwriting existing results for regeneration.",
     ),
+    no_turn_checkpoints: bool = typer.Option(
+        False,
+        "--no-turn-checkpoints",
+        help="Don't checkpoint the multi-turn entries after every turn; an interrupted entry then starts over in the next run.",
+    ),
     run_ids: bool = typer.Option(
         False,
         "--run-ids",
         help="If true, also run the test entry mentioned in the test_case_ids_to_generate.json file, in addition to the --test_category argument.",
     ),
+    prefix_aware_scheduling: bool = typer.Option(
+        False,
+        "--prefix-aware-scheduling",
+        help="Send the test cases that share a prompt prefix (system prompt, function docs) one after the other, so that they hit the prefix cache of the inference server. Mostly useful for locally-hosted models.",
+    ),
+    response_cache: str = typer.Option(
+        PASSTHROUGH,
+        "--response-cache",
+        help="Cache of the model responses, keyed on the exact request. `record` reuses the recorded responses and records the new ones, `replay` only uses the recorded responses (and works offline), `passthrough` disables the cache.",
+    ),
+    fsync_interval: float = typer.Option(
+        DEFAULT_FSYNC_INTERVAL,
+        "--fsync-interval",
+        help="Seconds between two fsyncs of the result files during generation. Results are always flushed to the OS within a second; fsync only protects them against a machine crash.",
+    ),
+    metrics_file: Optional[str] = typer.Option(
+        None,
+        "--metrics-file",
+        help="Append a snapshot of the live generation metrics (request latency, tokens, queue depth, retries, per-category progress) to this JSONL file every `--metrics-interval` seconds. Path should be relative to the `berkeley-function-call-leaderboard` root folder.",
+    ),
+    metrics_port: Optional[int] = typer.Option(
+        None,
+        "--metrics-port",
+        help="Serve the live generation metrics in the Prometheus text format on http://localhost:PORT/metrics.",
+    ),
+    metrics_interval: float = typer.Option(
+        DEFAULT_METRICS_INTERVAL,
+        "--metrics-interval",
+        help="Seconds between two snapshots written to `--metrics-file`.",
+    ),
     enable_lora: bool = typer.Option(
         False,
         "--enable-lora",
@@ -176,17 +227,31 @@ def generate(
         exclude_state_log=exclude_state_log,
         num_gpus=num_gpus,
         num_threads=num_threads,
+        max_parallel_models=max_parallel_models,
+        max_local_servers=max_local_servers,
+        use_async=use_async,
         gpu_memory_utilization=gpu_memory_utilization,
         backend=backend,
         skip_server_setup=skip_server_setup,
         local_model_path=local_model_path,
         result_dir=result_dir,
         allow_overwrite=allow_overwrite,
+        turn_checkpoints=not no_turn_checkpoints,
         run_ids=run_ids,
+        fsync_interval=fsync_interval,
+        prefix_aware_scheduling=prefix_aware_scheduling,
+        response_cache=response_cache,
+        metrics_file=metrics_file,
+        metrics_port=metrics_port,
+        metrics_interval=metrics_interval,
         enable_lora=enable_lora,
         max_lora_rank=max_lora_rank,
         lora_modules=lora_modules,
     )
+    # The generation and evaluation pipelines are imported by their own command only, so that the other commands
+    # start fast
+    from bfcl_eval._llm_response_generation import main as generation_main
+
     load_dotenv(dotenv_path=DOTENV_PATH, verbose=True, override=True)  # Load the .env file
     generation_main(args)
 
@@ -274,13 +339,33 @@ def evaluate(
         "--partial-eval",
         help="Run evaluation on a partial set of benchmark entries (eg. entries present in the model result files) without raising for missing IDs.",
     ),
+    num_workers: int = typer.Option(
+        1,
+        "--num-workers",
+        help="The number of worker processes used to evaluate the entries in parallel. The default (1) evaluates serially.",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Re-check every entry instead of reusing the cached verdicts from previous evaluation runs.",
+    ),
 ):
     """
     Evaluate results from run of one or more models on a test-category (same as eval_runner.py).
     """
 
+    from bfcl_eval.eval_checker.eval_runner import main as evaluation_main
+
     load_dotenv(dotenv_path=DOTENV_PATH, verbose=True, override=True)  # Load the .env file
-    evaluation_main(model, test_category, result_dir, score_dir, partial_eval)
+    evaluation_main(
+        model,
+        test_category,
+        result_dir,
+        score_dir,
+        partial_eval,
+        num_workers,
+        use_cache=not no_cache,
+    )
 
 
 @cli.command()
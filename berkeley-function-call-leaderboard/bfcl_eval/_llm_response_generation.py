@@ -1,5 +1,8 @@
 import argparse
+import asyncio
+import hashlib
 import heapq
+import json
 import multiprocessing as mp
 import os
 import queue
@@ -13,6 +16,7 @@ from typing import Optional
 
 from bfcl_eval.constants.eval_config import (
     PROJECT_ROOT,
+    RESPONSE_CACHE_PATH,
     RESULT_FILE_PATTERN,
     RESULT_PATH,
     TEST_IDS_TO_GENERATE_PATH,
@@ -20,7 +24,28 @@ from bfcl_eval.constants.eval_config import (
 from bfcl_eval.constants.model_config import MODEL_CONFIG_MAPPING
 from bfcl_eval.eval_checker.eval_runner_helper import load_file
 from bfcl_eval.model_handler.base_handler import BaseHandler
+from bfcl_eval.model_handler.generation_metrics import (
+    DEFAULT_METRICS_INTERVAL,
+    configure_generation_metrics,
+    get_generation_metrics,
+    shutdown_generation_metrics,
+)
 from bfcl_eval.model_handler.local_inference.base_oss_handler import OSSHandler
+from bfcl_eval.model_handler.response_cache import (
+    PASSTHROUGH,
+    REPLAY,
+    RESPONSE_CACHE_MODES,
+    configure_response_cache,
+)
+from bfcl_eval.model_handler.result_writer import (
+    DEFAULT_FSYNC_INTERVAL,
+    ResultWriter,
+    compact_update_log,
+)
+from bfcl_eval.model_handler.turn_checkpoint import (
+    TURN_CHECKPOINT_DIR_NAME,
+    TurnCheckpointStore,
+)
 from bfcl_eval.utils import *
 from tqdm import tqdm
 
@@ -37,12 +62,74 @@ def get_args():
     parser.add_argument("--include-input-log", action="store_true", default=False)
     parser.add_argument("--exclude-state-log", action="store_true", default=False)
     parser.add_argument("--num-threads", required=False, type=int)
+    parser.add_argument(
+        "--use-async",
+        action="store_true",
+        default=False,
+        help="Run the inference on an asyncio event loop instead of a thread pool; `--num-threads` then caps the number of concurrent requests.",
+    )
+    parser.add_argument(
+        "--prefix-aware-scheduling",
+        action="store_true",
+        default=False,
+        help="Send the test cases that share a prompt prefix (system prompt, function docs) one after the other, so that they hit the prefix cache of the inference server. Mostly useful for locally-hosted models.",
+    )
+    parser.add_argument(
+        "--response-cache",
+        default=PASSTHROUGH,
+        type=str,
+        choices=RESPONSE_CACHE_MODES,
+        help="Cache of the model responses, keyed on the exact request. `record` reuses the recorded responses and records the new ones, `replay` only uses the recorded responses (and works offline), `passthrough` disables the cache.",
+    )
+    parser.add_argument(
+        "--max-parallel-models",
+        default=1,
+        type=int,
+        help="Number of models whose results are generated at the same time. Each of them uses up to `--num-threads` threads.",
+    )
+    parser.add_argument(
+        "--max-local-servers",
+        default=1,
+        type=int,
+        help="Number of local inference servers running at the same time, each on its own port and `--num-gpus` GPUs.",
+    )
     parser.add_argument("--num-gpus", default=1, type=int)
     parser.add_argument("--backend", default="vllm", type=str, choices=["vllm"])
     parser.add_argument("--gpu-memory-utilization", default=0.9, type=float)
     parser.add_argument("--result-dir", default=None, type=str)
     parser.add_argument("--run-ids", action="store_true", default=False)
+    parser.add_argument(
+        "--fsync-interval",
+        default=DEFAULT_FSYNC_INTERVAL,
+        type=float,
+        help="Seconds between two fsyncs of the result files during generation. Results are always flushed to the OS within a second; fsync only protects them against a machine crash.",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        default=None,
+        type=str,
+        help="Append a snapshot of the live generation metrics (request latency, tokens, queue depth, retries, per-category progress) to this JSONL file every `--metrics-interval` seconds.",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        default=None,
+        type=int,
+        help="Serve the live generation metrics in the Prometheus text format on http://localhost:PORT/metrics.",
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        default=DEFAULT_METRICS_INTERVAL,
+        type=float,
+        help="Seconds between two snapshots written to `--metrics-file`.",
+    )
     parser.add_argument("--allow-overwrite", "-o", action="store_true", default=False)
+    parser.add_argument(
+        "--no-turn-checkpoints",
+        dest="turn_checkpoints",
+        action="store_false",
+        default=True,
+        help="Don't checkpoint the multi-turn entries after every turn; an interrupted entry then starts over in the next run.",
+    )
     parser.add_argument(
         "--skip-server-setup",
         action="store_true",
@@ -83,7 +170,7 @@ def get_args():
 
 def build_handler(model_name, temperature):
     config = MODEL_CONFIG_MAPPING[model_name]
-    handler = config.model_handler(
+    handler = config.handler_class(
         model_name=config.model_name,
         temperature=temperature,
         registry_name=model_name,
@@ -131,6 +218,8 @@ def collect_test_cases(args, model_name, all_test_categories, all_test_entries_i
             )
 
         for file_path in result_file_paths:
+            # Recover the results left in an update log by an interrupted `--run-ids` run
+            compact_update_log(file_path)
             if file_path.exists():
                 # Not allowing overwrite, we will load the existing results
                 if not args.allow_overwrite:
@@ -155,7 +244,12 @@ def collect_test_cases(args, model_name, all_test_categories, all_test_entries_i
                     # It's not implemented yet, but it won't affect the accuracy, as those files will be overwritten anyway (assume generation success)
                     pass
 
-    existing_ids = [entry["id"] for entry in existing_result]
+    # Regenerated entries start from scratch, not from the turn checkpoints of a previous run
+    checkpoint_folder = model_result_dir / TURN_CHECKPOINT_DIR_NAME
+    if args.allow_overwrite and checkpoint_folder.exists():
+        shutil.rmtree(checkpoint_folder)
+
+    existing_ids = {entry["id"] for entry in existing_result}
 
     test_cases_to_generate = [
         test_case
@@ -195,21 +289,30 @@ def multi_threaded_inference(handler, test_case, include_input_log, exclude_stat
             test_case, include_input_log, exclude_state_log
         )
     except Exception as e:
-        # This is usually the case when the model getting stuck on one particular test case.
-        # For example, timeout error or FC model returning invalid JSON response.
-        # Since temperature is already set to 0.001, retrying the same test case will not help.
-        # So we continue the generation process and record the error message as the model response
-        error_block = (
-            "-" * 100
-            + "\n❗️❗️ Error occurred during inference. Continuing to next test case.\n"
-            + f"❗️❗️ Test case ID: {test_case['id']}, Error: {str(e)}\n"
-            + traceback.format_exc(limit=10)
-            + "-" * 100
-        )
-        tqdm.write(error_block)
+        result, metadata = _handle_inference_error(handler, test_case, e)
+
+    result_to_write = {
+        "id": test_case["id"],
+        "result": result,
+        **metadata,
+    }
+
+    return result_to_write
+
+
+async def async_inference(handler, test_case, include_input_log, exclude_state_log):
+    """
+    Async counterpart of `multi_threaded_inference`, used when generating with `--use-async`.
+    """
+
+    assert type(test_case["function"]) is list
 
-        result = f"Error during inference: {str(e)}"
-        metadata = {"traceback": traceback.format_exc()}
+    try:
+        result, metadata = await handler.ainference(
+            test_case, include_input_log, exclude_state_log
+        )
+    except Exception as e:
+        result, metadata = _handle_inference_error(handler, test_case, e)
 
     result_to_write = {
         "id": test_case["id"],
@@ -220,7 +323,267 @@ def multi_threaded_inference(handler, test_case, include_input_log, exclude_stat
     return result_to_write
 
 
-def generate_results(args, model_name, test_cases_total):
+def _handle_inference_error(handler, test_case, e):
+    # This is usually the case when the model getting stuck on one particular test case.
+    # For example, timeout error or FC model returning invalid JSON response.
+    # Since temperature is already set to 0.001, retrying the same test case will not help.
+    # So we continue the generation process and record the error message as the model response
+    error_block = (
+        "-" * 100
+        + "\n❗️❗️ Error occurred during inference. Continuing to next test case.\n"
+        + f"❗️❗️ Test case ID: {test_case['id']}, Error: {str(e)}\n"
+        + traceback.format_exc(limit=10)
+        + "-" * 100
+    )
+    tqdm.write(error_block)
+
+    # The entry is recorded with the error as its result and won't be generated again (unless overwritten, which
+    # starts from scratch anyway), so its checkpoint would never be resumed
+    if handler.turn_checkpoint_store is not None:
+        handler.turn_checkpoint_store.discard(test_case["id"])
+
+    result = f"Error during inference: {str(e)}"
+    metadata = {"traceback": traceback.format_exc()}
+    return result, metadata
+
+
+def _hash_prefix_segment(segment) -> str:
+    return hashlib.blake2b(
+        json.dumps(segment, sort_keys=True, ensure_ascii=False).encode("utf-8"),
+        digest_size=8,
+    ).hexdigest()
+
+
+def get_prompt_prefix_segments(test_case: dict, is_fc_model: bool) -> list:
+    """
+    Split the prompt of a test case into the parts it is rendered from, in prompt order: the system prompt format
+    (prompting models only, as the system prompt starts with format-dependent instructions and ends with the function
+    docs), the function docs, and then the messages of the first turn.
+    """
+    segments = []
+    if not is_fc_model:
+        segments.append(extract_prompt_format_from_id(test_case["id"]))
+    segments.append(test_case.get("function", []))
+    question = test_case.get("question") or [[]]
+    segments.extend(question[0])
+    return segments
+
+
+def get_prefix_aware_order(test_cases: list[dict], is_fc_model: bool) -> dict[str, tuple]:
+    """
+    Compute an ordering key for each test case that puts the test cases sharing a prompt prefix next to each other.
+
+    The prompts are inserted, in `sort_key` order, into a trie keyed by the hashes of their segments (see
+    `get_prompt_prefix_segments`), with the `sort_key` priority as the first level. The children of each node are ranked
+    by first appearance, and the key of a test case is the path of ranks to its leaf. Sorting by it walks the trie
+    depth-first: the test cases with the same first `k` segments are contiguous for every `k`, the priorities are still
+    handled in order (so the dependencies between categories are resolved first), and test cases that don't share
+    anything keep their `sort_key` order.
+    """
+    trie = {}
+    order = {}
+    for test_case in sorted(test_cases, key=sort_key):
+        path = []
+        node = trie
+        for segment in [sort_key(test_case)[0]] + [
+            _hash_prefix_segment(segment)
+            for segment in get_prompt_prefix_segments(test_case, is_fc_model)
+        ]:
+            if segment not in node:
+                node[segment] = (len(node), {})
+            rank, node = node[segment]
+            path.append(rank)
+        order[test_case["id"]] = (tuple(path), sort_key(test_case))
+    return order
+
+
+class _DependencyScheduler:
+    """
+    Hands out the test cases in `sort_key` order (or by their value in `order_keys`, if given), holding back each one
+    until all the entries listed in its `depends_on` field have completed.
+    """
+
+    def __init__(self, test_cases_total, order_keys: Optional[dict[str, tuple]] = None):
+        # ───── dependency bookkeeping ──────────────────────────────
+        self.dependencies = {
+            test_case["id"]: set(test_case.get("depends_on", []))
+            for test_case in test_cases_total
+        }
+        self.children_of = defaultdict(list)
+        for test_case in test_cases_total:
+            for dependency_id in test_case.get("depends_on", []):
+                self.children_of[dependency_id].append(test_case["id"])
+
+        self.id_to_test_case = {
+            test_case["id"]: test_case for test_case in test_cases_total
+        }
+        if order_keys is None:
+            order_keys = {
+                test_case["id"]: sort_key(test_case) for test_case in test_cases_total
+            }
+        self.order_keys = order_keys
+
+        self.ready_queue = [
+            (self.order_keys[test_case_id], test_case_id)
+            for test_case_id, dependency_ids in self.dependencies.items()
+            if not dependency_ids
+        ]
+        heapq.heapify(self.ready_queue)
+        self.completed = set()
+
+    def has_ready(self) -> bool:
+        return len(self.ready_queue) > 0
+
+    def num_blocked(self, num_in_flight: int) -> int:
+        """
+        Number of test cases still waiting for the entries they depend on.
+        """
+        return (
+            len(self.dependencies)
+            - len(self.completed)
+            - len(self.ready_queue)
+            - num_in_flight
+        )
+
+    def pop_ready(self) -> dict:
+        _, test_case_id = heapq.heappop(self.ready_queue)
+        return self.id_to_test_case[test_case_id]
+
+    def mark_completed(self, test_case_id: str) -> None:
+        self.completed.add(test_case_id)
+
+        # unlock children
+        for child_id in self.children_of[test_case_id]:
+            self.dependencies[child_id].discard(test_case_id)
+            if not self.dependencies[child_id]:
+                heapq.heappush(
+                    self.ready_queue,
+                    (self.order_keys[child_id], child_id),
+                )
+
+
+def _report_scheduler_metrics(handler, scheduler, num_in_flight, completed_results=()):
+    metrics = get_generation_metrics()
+    if metrics is None:
+        return
+    for result_dict in completed_results:
+        metrics.observe_entry(handler.registry_name, result_dict)
+    metrics.set_scheduler_state(
+        handler.registry_name,
+        queue_depth=len(scheduler.ready_queue),
+        blocked_entries=scheduler.num_blocked(num_in_flight),
+        in_flight=num_in_flight,
+    )
+
+
+def _run_thread_pool_scheduler(args, handler, scheduler, num_threads, write_queue, pbar):
+    in_flight: dict[Future, str] = {}  # future -> test_case_id
+
+    with ThreadPoolExecutor(max_workers=num_threads) as pool:
+
+        def _submit_ready():
+            # refill the pool up to max_workers
+            while scheduler.has_ready() and len(in_flight) < num_threads:
+                test_case = scheduler.pop_ready()
+                future = pool.submit(
+                    multi_threaded_inference,
+                    handler,
+                    test_case,
+                    args.include_input_log,
+                    args.exclude_state_log,
+                )
+                in_flight[future] = test_case["id"]
+
+        # seed initial ready tasks
+        _submit_ready()
+        _report_scheduler_metrics(handler, scheduler, len(in_flight))
+
+        # main scheduler loop
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            completed_results = []
+            for future in done:
+                test_case_id = in_flight.pop(future)
+                result_dict = future.result()
+                completed_results.append(result_dict)
+
+                # Enqueue the result for the writer thread to handle file IO
+                write_queue.put(result_dict)
+
+                # Update progress bar right after inference completes
+                pbar.update()
+                scheduler.mark_completed(test_case_id)
+
+            _submit_ready()
+            _report_scheduler_metrics(handler, scheduler, len(in_flight), completed_results)
+
+
+async def _run_async_scheduler(args, handler, scheduler, max_concurrency, write_queue, pbar):
+    """
+    Same scheduling as `_run_thread_pool_scheduler`, but every in-flight test case is a task on a single event loop
+    instead of an OS thread, so `max_concurrency` can go far beyond a reasonable thread count.
+    """
+    in_flight: dict[asyncio.Task, str] = {}  # task -> test_case_id
+
+    def _submit_ready():
+        while scheduler.has_ready() and len(in_flight) < max_concurrency:
+            test_case = scheduler.pop_ready()
+            task = asyncio.create_task(
+                async_inference(
+                    handler,
+                    test_case,
+                    args.include_input_log,
+                    args.exclude_state_log,
+                )
+            )
+            in_flight[task] = test_case["id"]
+
+    _submit_ready()
+    _report_scheduler_metrics(handler, scheduler, len(in_flight))
+
+    while in_flight:
+        done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+        completed_results = []
+        for task in done:
+            test_case_id = in_flight.pop(task)
+            result_dict = task.result()
+            completed_results.append(result_dict)
+
+            # The writer thread still owns all the file IO
+            write_queue.put(result_dict)
+
+            pbar.update()
+            scheduler.mark_completed(test_case_id)
+
+        _submit_ready()
+        _report_scheduler_metrics(handler, scheduler, len(in_flight), completed_results)
+
+
+def needs_local_server(args, model_name) -> bool:
+    """
+    Whether generating the results of a model starts a local inference server.
+    """
+    return (
+        issubclass(MODEL_CONFIG_MAPPING[model_name].handler_class, OSSHandler)
+        and not args.skip_server_setup
+        and args.response_cache != REPLAY
+    )
+
+
+def get_local_server_slot_devices(args, server_slot: int) -> str:
+    """
+    GPUs of the local server running in `server_slot`, when several local servers run side by side: each slot gets its
+    own `--num-gpus` GPUs, out of `CUDA_VISIBLE_DEVICES` (or all the GPUs if it isn't set).
+    """
+    visible_devices = os.getenv("CUDA_VISIBLE_DEVICES")
+    if visible_devices:
+        devices = visible_devices.split(",")
+    else:
+        devices = [str(i) for i in range(args.num_gpus * args.max_local_servers)]
+    return ",".join(devices[server_slot * args.num_gpus : (server_slot + 1) * args.num_gpus])
+
+
+def generate_results(args, model_name, test_cases_total, position=0, server_slot=None):
     handler = build_handler(model_name, args.temperature)
 
     if isinstance(handler, OSSHandler):
@@ -238,15 +601,39 @@ def generate_results(args, model_name, test_cases_total):
         is_oss_model = False
         num_threads = args.num_threads if args.num_threads is not None else 1
 
+    # Multi-turn entries interrupted in a previous run resume from their last completed turn
+    if args.turn_checkpoints:
+        handler.turn_checkpoint_store = TurnCheckpointStore(
+            args.result_dir / handler.registry_dir_name / TURN_CHECKPOINT_DIR_NAME
+        )
+
+    metrics = get_generation_metrics()
+    if metrics is not None:
+        metrics.add_scheduled_entries(
+            handler.registry_name, [test_case["id"] for test_case in test_cases_total]
+        )
+
+    result_writer = ResultWriter(
+        handler,
+        args.result_dir,
+        update_mode=args.run_ids,
+        fsync_interval=args.fsync_interval,
+    )
+
     # Use a separate thread to write the results to the file to avoid concurrent IO issues
     def _writer():
         """Consume result dicts from the queue and write them with exclusive access."""
-        while True:
-            item = write_queue.get()
-            if item is None:
-                break
-            handler.write(item, result_dir=args.result_dir, update_mode=args.run_ids)
-            write_queue.task_done()
+        with result_writer:
+            while True:
+                try:
+                    item = write_queue.get(timeout=result_writer.flush_interval)
+                except queue.Empty:
+                    result_writer.flush_if_due()
+                    continue
+                if item is None:
+                    break
+                result_writer.write(item)
+                write_queue.task_done()
 
     write_queue: queue.Queue = queue.Queue()
 
@@ -254,7 +641,15 @@ def generate_results(args, model_name, test_cases_total):
     writer_thread.start()
 
     try:
-        if is_oss_model:
+        if is_oss_model and args.response_cache == REPLAY:
+            # Replayed responses don't need a server, so that replay also works offline
+            handler.model_path_or_id = args.local_model_path or handler.model_name_huggingface
+        elif is_oss_model:
+            cuda_visible_devices = None
+            if server_slot is not None and args.max_local_servers > 1:
+                # Side-by-side servers each get their own port and GPUs
+                handler.set_local_server_port(int(handler.local_server_port) + server_slot)
+                cuda_visible_devices = get_local_server_slot_devices(args, server_slot)
             handler.spin_up_local_server(
                 num_gpus=args.num_gpus,
                 gpu_memory_utilization=args.gpu_memory_utilization,
@@ -264,98 +659,141 @@ def generate_results(args, model_name, test_cases_total):
                 lora_modules=args.lora_modules,
                 enable_lora=args.enable_lora,
                 max_lora_rank=args.max_lora_rank,
+                cuda_visible_devices=cuda_visible_devices,
             )
 
-        # ───── dependency bookkeeping ──────────────────────────────
-        dependencies = {
-            test_case["id"]: set(test_case.get("depends_on", []))
-            for test_case in test_cases_total
-        }
-        children_of = defaultdict(list)
-        for test_case in test_cases_total:
-            for dependency_id in test_case.get("depends_on", []):
-                children_of[dependency_id].append(test_case["id"])
-
-        id_to_test_case = {test_case["id"]: test_case for test_case in test_cases_total}
-
-        ready_queue = [
-            (sort_key(id_to_test_case[test_case_id]), test_case_id)
-            for test_case_id, dependency_ids in dependencies.items()
-            if not dependency_ids
-        ]
-        heapq.heapify(ready_queue)
-        in_flight: dict[Future, str] = {}  # future -> test_case_id
-        completed = set()
+        scheduler = _DependencyScheduler(
+            test_cases_total,
+            order_keys=(
+                get_prefix_aware_order(test_cases_total, handler.is_fc_model)
+                if args.prefix_aware_scheduling
+                else None
+            ),
+        )
 
-        with ThreadPoolExecutor(max_workers=num_threads) as pool, tqdm(
+        with tqdm(
             total=len(test_cases_total),
             desc=f"Generating results for {model_name}",
-            position=0,
+            position=position,
             leave=True,
             dynamic_ncols=True,
             mininterval=0.2,
             smoothing=0.1,
             bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]",
         ) as pbar:
-
-            # seed initial ready tasks
-            while ready_queue and len(in_flight) < num_threads:
-                _, test_case_id = heapq.heappop(ready_queue)
-                test_case = id_to_test_case[test_case_id]
-                future = pool.submit(
-                    multi_threaded_inference,
-                    handler,
-                    test_case,
-                    args.include_input_log,
-                    args.exclude_state_log,
-                )
-                in_flight[future] = test_case_id
-
-            # main scheduler loop
-            while in_flight:
-                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
-                for future in done:
-                    test_case_id = in_flight.pop(future)
-                    result_dict = future.result()
-
-                    # Enqueue the result for the writer thread to handle file IO
-                    write_queue.put(result_dict)
-
-                    # Update progress bar right after inference completes
-                    pbar.update()
-                    completed.add(test_case_id)
-
-                    # unlock children
-                    for child_id in children_of[test_case_id]:
-                        dependencies[child_id].discard(test_case_id)
-                        if not dependencies[child_id]:
-                            heapq.heappush(
-                                ready_queue,
-                                (sort_key(id_to_test_case[child_id]), child_id),
-                            )
-
-                # refill the pool up to max_workers
-                while ready_queue and len(in_flight) < num_threads:
-                    _, test_case_id = heapq.heappop(ready_queue)
-                    test_case = id_to_test_case[test_case_id]
-                    future = pool.submit(
-                        multi_threaded_inference,
-                        handler,
-                        test_case,
-                        args.include_input_log,
-                        args.exclude_state_log,
+            if args.use_async:
+                asyncio.run(
+                    _run_async_scheduler(
+                        args, handler, scheduler, num_threads, write_queue, pbar
                     )
-                    in_flight[future] = test_case_id
+                )
+            else:
+                _run_thread_pool_scheduler(
+                    args, handler, scheduler, num_threads, write_queue, pbar
+                )
 
     finally:
         # Signal writer thread to finish and wait for it
         write_queue.put(None)
         writer_thread.join()
 
+        if handler.turn_checkpoint_store is not None:
+            handler.turn_checkpoint_store.remove_if_empty()
+
         if is_oss_model:
             handler.shutdown_local_server()
 
 
+def generate_model_results(
+    args,
+    model_name,
+    all_test_categories,
+    all_test_entries_involved,
+    position=0,
+    server_slot=None,
+):
+    test_cases_total = collect_test_cases(
+        args,
+        model_name,
+        all_test_categories,
+        deepcopy(all_test_entries_involved),
+    )
+
+    if len(test_cases_total) == 0:
+        tqdm.write(
+            f"✅ All selected test cases have been previously generated for {model_name}. No new test cases to generate."
+        )
+        return
+
+    generate_results(args, model_name, test_cases_total, position, server_slot)
+    # Sort the result files by id at the end
+    model_result_dir = args.result_dir / model_name.replace("/", "_")
+    for model_result_json in model_result_dir.rglob(RESULT_FILE_PATTERN):
+        sort_file_content_by_id(model_result_json)
+
+
+def run_generation_jobs(args, all_test_categories, all_test_entries_involved):
+    """
+    Generate the results of every model in `args.model`, with up to `args.max_parallel_models` models in progress at
+    the same time, of which up to `args.max_local_servers` with their own local inference server.
+
+    With a single model at a time (the default), the models run one after the other in the given order. Otherwise the
+    models that need a local server are started first, as their server takes the longest to start, and the other
+    models fill the remaining slots in the meantime. If a model fails, the models already in progress are completed
+    and the error is raised, without starting the remaining ones.
+    """
+    pending = list(args.model)
+    if args.max_parallel_models > 1:
+        pending.sort(key=lambda model_name: not needs_local_server(args, model_name))
+
+    # Each model in progress gets its own progress bar position, and its own server slot if it needs one
+    free_positions = list(range(args.max_parallel_models))
+    free_server_slots = list(range(args.max_local_servers))
+    in_progress: dict[Future, tuple[str, int, Optional[int]]] = {}
+    errors = []
+
+    with ThreadPoolExecutor(max_workers=args.max_parallel_models) as pool:
+        while True:
+            for model_name in list(pending):
+                if errors or not free_positions:
+                    break
+                needs_server = needs_local_server(args, model_name)
+                if needs_server and not free_server_slots:
+                    continue
+                pending.remove(model_name)
+                position = free_positions.pop(0)
+                server_slot = free_server_slots.pop(0) if needs_server else None
+                future = pool.submit(
+                    generate_model_results,
+                    args,
+                    model_name,
+                    all_test_categories,
+                    all_test_entries_involved,
+                    position,
+                    server_slot,
+                )
+                in_progress[future] = (model_name, position, server_slot)
+
+            if not in_progress:
+                break
+
+            done, _ = wait(in_progress, return_when=FIRST_COMPLETED)
+            for future in done:
+                model_name, position, server_slot = in_progress.pop(future)
+                free_positions = sorted(free_positions + [position])
+                if server_slot is not None:
+                    free_server_slots = sorted(free_server_slots + [server_slot])
+                try:
+                    future.result()
+                except Exception as e:
+                    if args.max_parallel_models > 1:
+                        tqdm.write(f"❗️❗️ Generation failed for {model_name}: {e}")
+                    errors.append(e)
+
+    if errors:
+        raise errors[0]
+
+
 def main(args):
 
     # Note: The following environment variables are needed for the memory vector store implementation
@@ -404,20 +842,21 @@ def main(args):
     else:
         args.result_dir = RESULT_PATH
 
-    for model_name in args.model:
-        test_cases_total = collect_test_cases(
-            args,
-            model_name,
-            all_test_categories,
-            deepcopy(all_test_entries_involved),
-        )
+    response_cache = configure_response_cache(args.response_cache, RESPONSE_CACHE_PATH)
+    configure_generation_metrics(
+        metrics_file=(
+            PROJECT_ROOT / args.metrics_file if args.metrics_file is not None else None
+        ),
+        metrics_port=args.metrics_port,
+        interval=args.metrics_interval,
+    )
 
-        if len(test_cases_total) == 0:
-            tqdm.write(
-                f"✅ All selected test cases have been previously generated for {model_name}. No new test cases to generate."
-            )
-        else:
-            generate_results(args, model_name, test_cases_total)
-            # Sort the result files by id at the end
-            for model_result_json in args.result_dir.rglob(RESULT_FILE_PATTERN):
-                sort_file_content_by_id(model_result_json)
+    try:
+        run_generation_jobs(args, all_test_categories, all_test_entries_involved)
+    finally:
+        shutdown_generation_metrics()
+
+    if response_cache is not None:
+        tqdm.write(
+            f"Response cache: {response_cache.num_hits} responses reused, {response_cache.num_misses} not found ({response_cache.db_path})."
+        )
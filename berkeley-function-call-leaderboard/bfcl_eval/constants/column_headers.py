@@ -97,3 +97,18 @@ COLUMNS_OVERALL = [
     "Organization",
     "License",
 ]
+
+
+# Latency statistics are reported for the whole model, each test category and each multi-turn turn
+COLUMNS_LATENCY = [
+    "Model",
+    "Scope",
+    "Count",
+    "Latency Mean (s)",
+    "Latency Standard Deviation (s)",
+    "Latency 50th Percentile (s)",
+    "Latency 90th Percentile (s)",
+    "Latency 95th Percentile (s)",
+    "Latency 99th Percentile (s)",
+    "Output Tokens per Second",
+]
@@ -25,6 +25,14 @@ DOTENV_PATH = PROJECT_ROOT / ".env"
 TEST_IDS_TO_GENERATE_PATH = PROJECT_ROOT / "test_case_ids_to_generate.json"
 # Directory that stores all lock files (kept out of the results tree)
 LOCK_DIR = PROJECT_ROOT / ".file_locks"
+# Directory that stores the preprocessed dataset entries (see `load_dataset_entry`)
+DATASET_CACHE_PATH = PROJECT_ROOT / ".dataset_cache"
+# SQLite database of the recorded model responses (see `--response-cache`)
+RESPONSE_CACHE_PATH = PROJECT_ROOT / ".response_cache" / "responses.sqlite"
+# Embeddings of the texts stored in the vector memory backend (see `memory_embedding.py`)
+EMBEDDING_CACHE_PATH = PROJECT_ROOT / ".embedding_cache"
+# Ground truth execution of the multi-turn entries, shared by all the evaluated models (see `ground_truth_cache.py`)
+GROUND_TRUTH_CACHE_PATH = PROJECT_ROOT / ".ground_truth_cache"
 
 PROMPT_PATH = PACKAGE_ROOT / "data"
 MULTI_TURN_FUNC_DOC_PATH = PROMPT_PATH / "multi_turn_func_doc"
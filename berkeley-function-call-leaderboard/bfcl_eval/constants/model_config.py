@@ -1,72 +1,10 @@
+import importlib
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Union
 
-from bfcl_eval.model_handler.api_inference.claude import ClaudeHandler
-from bfcl_eval.model_handler.api_inference.cohere import CohereHandler
-from bfcl_eval.model_handler.api_inference.deepseek import DeepSeekAPIHandler
-from bfcl_eval.model_handler.api_inference.dm_cito import DMCitoHandler
-from bfcl_eval.model_handler.api_inference.fireworks import FireworksHandler
-from bfcl_eval.model_handler.api_inference.functionary import FunctionaryHandler
-from bfcl_eval.model_handler.api_inference.gemini import GeminiHandler
-from bfcl_eval.model_handler.api_inference.glm import GLMAPIHandler
-from bfcl_eval.model_handler.api_inference.gogoagent import GoGoAgentHandler
-from bfcl_eval.model_handler.api_inference.gorilla import GorillaHandler
-from bfcl_eval.model_handler.api_inference.grok import GrokHandler
-from bfcl_eval.model_handler.api_inference.kimi import KimiHandler
-from bfcl_eval.model_handler.api_inference.ling import LingAPIHandler
-from bfcl_eval.model_handler.api_inference.mining import MiningHandler
-from bfcl_eval.model_handler.api_inference.mistral import MistralHandler
-from bfcl_eval.model_handler.api_inference.nemotron import NemotronHandler
-from bfcl_eval.model_handler.api_inference.nova import NovaHandler
-from bfcl_eval.model_handler.api_inference.novita import NovitaHandler
-from bfcl_eval.model_handler.api_inference.nvidia import NvidiaHandler
-from bfcl_eval.model_handler.api_inference.openai_completion import (
-    OpenAICompletionsHandler,
-)
-from bfcl_eval.model_handler.api_inference.openai_response import OpenAIResponsesHandler
-from bfcl_eval.model_handler.api_inference.qwen import (
-    QwenAgentNoThinkHandler,
-    QwenAgentThinkHandler,
-    QwenAPIHandler,
-)
-from bfcl_eval.model_handler.api_inference.nanbeige import NanbeigeAPIHandler
-from bfcl_eval.model_handler.api_inference.writer import WriterHandler
-from bfcl_eval.model_handler.local_inference.arch import ArchHandler
-from bfcl_eval.model_handler.local_inference.bielik import BielikHandler
-from bfcl_eval.model_handler.local_inference.bitagent import BitAgentHandler
-from bfcl_eval.model_handler.local_inference.deepseek_reasoning import (
-    DeepseekReasoningHandler,
-)
-from bfcl_eval.model_handler.local_inference.falcon_fc import Falcon3FCHandler
-from bfcl_eval.model_handler.local_inference.gemma import GemmaHandler
-from bfcl_eval.model_handler.local_inference.functiongemma import FunctionGemmaHandler
-from bfcl_eval.model_handler.local_inference.glm import GLMHandler
-from bfcl_eval.model_handler.local_inference.granite import (
-    GraniteFunctionCallingHandler,
-)
-from bfcl_eval.model_handler.local_inference.granite_3 import Granite3FCHandler
-from bfcl_eval.model_handler.local_inference.granite_4 import Granite4FCHandler
-from bfcl_eval.model_handler.local_inference.hammer import HammerHandler
-from bfcl_eval.model_handler.local_inference.llama import LlamaHandler
-from bfcl_eval.model_handler.local_inference.llama_3_1 import LlamaHandler_3_1
-from bfcl_eval.model_handler.local_inference.minicpm import MiniCPMHandler
-from bfcl_eval.model_handler.local_inference.minicpm_fc import MiniCPMFCHandler
-from bfcl_eval.model_handler.local_inference.mistral_fc import MistralFCHandler
-from bfcl_eval.model_handler.local_inference.phi import PhiHandler
-from bfcl_eval.model_handler.local_inference.phi_fc import PhiFCHandler
-from bfcl_eval.model_handler.local_inference.quick_testing_oss import (
-    QuickTestingOSSHandler,
-)
-from bfcl_eval.model_handler.local_inference.qwen import QwenHandler
-from bfcl_eval.model_handler.local_inference.qwen_fc import QwenFCHandler
-from bfcl_eval.model_handler.local_inference.nanbeige_fc import NanbeigeFCHandler
-from bfcl_eval.model_handler.local_inference.salesforce_llama import (
-    SalesforceLlamaHandler,
-)
-from bfcl_eval.model_handler.local_inference.salesforce_qwen import (
-    SalesforceQwenHandler,
-)
-from bfcl_eval.model_handler.local_inference.think_agent import ThinkAgentHandler
+if TYPE_CHECKING:
+    from bfcl_eval.model_handler.base_handler import BaseHandler
 
 # -----------------------------------------------------------------------------
 # A mapping of model identifiers to their respective model configurations.
@@ -87,7 +25,7 @@ class ModelConfig:
         url (str): Reference URL for the model or hosting service.
         org (str): Organization providing the model.
         license (str): License under which the model is released.
-        model_handler (str): Handler name for invoking the model.
+        model_handler (str): Dotted path of the handler class for invoking the model (e.g., `bfcl_eval.model_handler.api_inference.claude.ClaudeHandler`). The handler module is only imported when `handler_class` is first accessed, so that listing or looking up models doesn't import every provider SDK.
         input_price (Optional[float]): USD per million input tokens (None for open source models).
         output_price (Optional[float]): USD per million output tokens (None for open source models).
         is_fc_model (bool): True if this model is used in Function-Calling mode, otherwise False for Prompt-based mode.
@@ -101,7 +39,7 @@ class ModelConfig:
     org: str
     license: str
 
-    model_handler: str
+    model_handler: Union[str, type["BaseHandler"]]
 
     # Prices are in USD per million tokens; open source models have None
     input_price: Optional[float] = None
@@ -113,6 +51,21 @@ class ModelConfig:
     # True if this model does not allow '.' in function names
     underscore_to_dot: bool = False
 
+    @property
+    def handler_class(self) -> type["BaseHandler"]:
+        return import_model_handler(self.model_handler)
+
+
+@lru_cache(maxsize=None)
+def import_model_handler(model_handler: Union[str, type["BaseHandler"]]) -> type["BaseHandler"]:
+    """
+    Import a handler class from its dotted path. Handler classes given directly are returned as-is.
+    """
+    if not isinstance(model_handler, str):
+        return model_handler
+    module_name, _, class_name = model_handler.rpartition(".")
+    return getattr(importlib.import_module(module_name), class_name)
+
 
 # Inference through API calls
 api_inference_model_map = {
@@ -122,7 +75,7 @@ api_inference_model_map = {
         url="https://gorilla.cs.berkeley.edu/blogs/7_open_functions_v2.html",
         org="Gorilla LLM",
         license="Apache 2.0",
-        model_handler=GorillaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gorilla.GorillaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -134,7 +87,7 @@ api_inference_model_map = {
         url="https://api-docs.deepseek.com/news/news250528",
         org="DeepSeek",
         license="MIT",
-        model_handler=DeepSeekAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.deepseek.DeepSeekAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -146,7 +99,7 @@ api_inference_model_map = {
         url="https://api-docs.deepseek.com/news/news250528",
         org="DeepSeek",
         license="MIT",
-        model_handler=DeepSeekAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.deepseek.DeepSeekAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -158,7 +111,7 @@ api_inference_model_map = {
         url="https://api-docs.deepseek.com/news/news250528",
         org="DeepSeek",
         license="MIT",
-        model_handler=DeepSeekAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.deepseek.DeepSeekAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -170,7 +123,7 @@ api_inference_model_map = {
         url="https://openai.com/zh-Hans-CN/index/introducing-gpt-5-2/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=1.75,
         output_price=14,
         is_fc_model=True,
@@ -182,7 +135,7 @@ api_inference_model_map = {
         url="https://openai.com/zh-Hans-CN/index/introducing-gpt-5-2/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=1.75,
         output_price=14,
         is_fc_model=False,
@@ -194,7 +147,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-5/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.25,
         output_price=2,
         is_fc_model=True,
@@ -206,7 +159,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-5/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.25,
         output_price=2,
         is_fc_model=False,
@@ -218,7 +171,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-5/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.05,
         output_price=0.4,
         is_fc_model=True,
@@ -230,7 +183,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-5/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.05,
         output_price=0.4,
         is_fc_model=False,
@@ -242,7 +195,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=2,
         output_price=8,
         is_fc_model=True,
@@ -254,7 +207,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=2,
         output_price=8,
         is_fc_model=False,
@@ -266,7 +219,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.4,
         output_price=1.6,
         is_fc_model=True,
@@ -278,7 +231,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.4,
         output_price=1.6,
         is_fc_model=False,
@@ -290,7 +243,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.1,
         output_price=0.4,
         is_fc_model=True,
@@ -302,7 +255,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.1,
         output_price=0.4,
         is_fc_model=False,
@@ -314,7 +267,7 @@ api_inference_model_map = {
         url="https://openai.com/index/hello-gpt-4o/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=2.5,
         output_price=10,
         is_fc_model=False,
@@ -326,7 +279,7 @@ api_inference_model_map = {
         url="https://openai.com/index/hello-gpt-4o/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=2.5,
         output_price=10,
         is_fc_model=True,
@@ -338,7 +291,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4o-mini-advancing-cost-efficient-intelligence/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.15,
         output_price=0.6,
         is_fc_model=False,
@@ -350,7 +303,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4o-mini-advancing-cost-efficient-intelligence/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=0.15,
         output_price=0.6,
         is_fc_model=True,
@@ -362,7 +315,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-o3-and-o4-mini/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=2,
         output_price=8,
         is_fc_model=False,
@@ -374,7 +327,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-o3-and-o4-mini/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=2,
         output_price=8,
         is_fc_model=True,
@@ -386,7 +339,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-o3-and-o4-mini/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=1.10,
         output_price=4.40,
         is_fc_model=False,
@@ -398,7 +351,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-o3-and-o4-mini/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.openai_response.OpenAIResponsesHandler",
         input_price=1.10,
         output_price=4.40,
         is_fc_model=True,
@@ -410,7 +363,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-4",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.claude.ClaudeHandler",
         input_price=5,
         output_price=25,
         is_fc_model=False,
@@ -422,7 +375,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-4",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.claude.ClaudeHandler",
         input_price=5,
         output_price=25,
         is_fc_model=True,
@@ -434,7 +387,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-sonnet-4-5",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.claude.ClaudeHandler",
         input_price=3,
         output_price=15,
         is_fc_model=False,
@@ -446,7 +399,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-sonnet-4-5",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.claude.ClaudeHandler",
         input_price=3,
         output_price=15,
         is_fc_model=True,
@@ -458,7 +411,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-haiku-4-5",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.claude.ClaudeHandler",
         input_price=0.8,
         output_price=4,
         is_fc_model=False,
@@ -470,7 +423,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-haiku-4-5",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.claude.ClaudeHandler",
         input_price=0.8,
         output_price=4,
         is_fc_model=True,
@@ -482,7 +435,7 @@ api_inference_model_map = {
         url="https://aws.amazon.com/cn/ai/generative-ai/nova/",
         org="Amazon",
         license="Proprietary",
-        model_handler=NovaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.nova.NovaHandler",
         input_price=0.8,
         output_price=3.2,
         is_fc_model=True,
@@ -494,7 +447,7 @@ api_inference_model_map = {
         url="https://aws.amazon.com/cn/ai/generative-ai/nova/",
         org="Amazon",
         license="Proprietary",
-        model_handler=NovaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.nova.NovaHandler",
         input_price=0.3,
         output_price=2.5,
         is_fc_model=True,
@@ -506,7 +459,7 @@ api_inference_model_map = {
         url="https://aws.amazon.com/cn/ai/generative-ai/nova/",
         org="Amazon",
         license="Proprietary",
-        model_handler=NovaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.nova.NovaHandler",
         input_price=0.035,
         output_price=0.14,
         is_fc_model=True,
@@ -518,7 +471,7 @@ api_inference_model_map = {
         url="https://mistral.ai/news/mistral-nemo/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=0.15,
         output_price=0.15,
         is_fc_model=False,
@@ -530,7 +483,7 @@ api_inference_model_map = {
         url="https://mistral.ai/news/mistral-nemo/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=0.15,
         output_price=0.15,
         is_fc_model=True,
@@ -542,7 +495,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=2,
         output_price=6,
         is_fc_model=False,
@@ -554,7 +507,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=2,
         output_price=6,
         is_fc_model=True,
@@ -566,7 +519,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=0.1,
         output_price=0.3,
         is_fc_model=False,
@@ -578,7 +531,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=0.1,
         output_price=0.3,
         is_fc_model=True,
@@ -590,7 +543,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=0.4,
         output_price=2,
         is_fc_model=False,
@@ -602,7 +555,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mistral.MistralHandler",
         input_price=0.4,
         output_price=2,
         is_fc_model=True,
@@ -614,7 +567,7 @@ api_inference_model_map = {
         url="https://huggingface.co/fireworks-ai/firefunction-v2",
         org="Fireworks",
         license="Apache 2.0",
-        model_handler=FireworksHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.fireworks.FireworksHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -626,7 +579,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/flash-lite/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gemini.GeminiHandler",
         input_price=0.1,
         output_price=0.4,
         is_fc_model=True,
@@ -638,7 +591,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/flash-lite/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gemini.GeminiHandler",
         input_price=0.1,
         output_price=0.4,
         is_fc_model=False,
@@ -650,7 +603,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/flash/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gemini.GeminiHandler",
         input_price=0.3,
         output_price=2.5,
         is_fc_model=True,
@@ -662,7 +615,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/flash/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gemini.GeminiHandler",
         input_price=0.3,
         output_price=2.5,
         is_fc_model=False,
@@ -674,7 +627,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/pro/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gemini.GeminiHandler",
         input_price=2,
         output_price=12,
         is_fc_model=True,
@@ -686,7 +639,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/pro/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gemini.GeminiHandler",
         input_price=2,
         output_price=12,
         is_fc_model=False,
@@ -698,7 +651,7 @@ api_inference_model_map = {
         url="https://huggingface.co/meetkai/functionary-small-v3.1",
         org="MeetKai",
         license="MIT",
-        model_handler=FunctionaryHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.functionary.FunctionaryHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -710,7 +663,7 @@ api_inference_model_map = {
         url="https://huggingface.co/meetkai/functionary-medium-v3.1",
         org="MeetKai",
         license="MIT",
-        model_handler=FunctionaryHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.functionary.FunctionaryHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -722,7 +675,7 @@ api_inference_model_map = {
         url="https://cohere.com/blog/command-r7b",
         org="Cohere",
         license="cc-by-nc-4.0",
-        model_handler=CohereHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.cohere.CohereHandler",
         input_price=0.0375,
         output_price=0.15,
         is_fc_model=True,
@@ -734,7 +687,7 @@ api_inference_model_map = {
         url="https://cohere.com/blog/command-a",
         org="Cohere",
         license="CC-BY-NC 4.0 License (w/ Acceptable Use Addendum)",
-        model_handler=CohereHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.cohere.CohereHandler",
         input_price=2.5,
         output_price=10,
         is_fc_model=True,
@@ -746,7 +699,7 @@ api_inference_model_map = {
         url="https://cohere.com/blog/command-a-reasoning",
         org="Cohere",
         license="CC-BY-NC 4.0 License (w/ Acceptable Use Addendum)",
-        model_handler=CohereHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.cohere.CohereHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -758,7 +711,7 @@ api_inference_model_map = {
         url="https://huggingface.co/nvidia/Llama-3_1-Nemotron-Ultra-253B-v1",
         org="NVIDIA",
         license="nvidia-open-model-license",
-        model_handler=NemotronHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.nemotron.NemotronHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -770,7 +723,7 @@ api_inference_model_map = {
         url="https://huggingface.co/nvidia/nemotron-4-340b-instruct",
         org="NVIDIA",
         license="nvidia-open-model-license",
-        model_handler=NvidiaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.nvidia.NvidiaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -782,7 +735,7 @@ api_inference_model_map = {
         url="https://gogoagent.ai",
         org="BitAgent",
         license="Proprietary",
-        model_handler=GoGoAgentHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.gogoagent.GoGoAgentHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -794,7 +747,7 @@ api_inference_model_map = {
         url="https://writer.com/engineering/actions-with-palmyra-x-004/",
         org="Writer",
         license="Proprietary",
-        model_handler=WriterHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.writer.WriterHandler",
         input_price=5,
         output_price=12,
         is_fc_model=True,
@@ -806,7 +759,7 @@ api_inference_model_map = {
         url="https://docs.x.ai/docs/models",
         org="xAI",
         license="Proprietary",
-        model_handler=GrokHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.grok.GrokHandler",
         input_price=3,
         output_price=15,
         is_fc_model=True,
@@ -818,7 +771,7 @@ api_inference_model_map = {
         url="https://docs.x.ai/docs/models",
         org="xAI",
         license="Proprietary",
-        model_handler=GrokHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.grok.GrokHandler",
         input_price=3,
         output_price=15,
         is_fc_model=False,
@@ -830,7 +783,7 @@ api_inference_model_map = {
         url="https://docs.x.ai/docs/models",
         org="xAI",
         license="Proprietary",
-        model_handler=GrokHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.grok.GrokHandler",
         input_price=0.2,
         output_price=0.5,
         is_fc_model=True,
@@ -842,7 +795,7 @@ api_inference_model_map = {
         url="https://docs.x.ai/docs/models",
         org="xAI",
         license="Proprietary",
-        model_handler=GrokHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.grok.GrokHandler",
         input_price=0.2,
         output_price=0.5,
         is_fc_model=True,
@@ -854,7 +807,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-0.6B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -866,7 +819,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-0.6B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -878,7 +831,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-1.7B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -890,7 +843,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-1.7B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -902,7 +855,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -914,7 +867,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -926,7 +879,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-8B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -938,7 +891,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-8B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -950,7 +903,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-14B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -962,7 +915,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-14B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -974,7 +927,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -986,7 +939,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -998,7 +951,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-30B-A3B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1010,7 +963,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-30B-A3B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1022,7 +975,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-235B-A22B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1034,7 +987,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-235B-A22B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1046,7 +999,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/QwQ-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1058,7 +1011,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/QwQ-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1070,7 +1023,7 @@ api_inference_model_map = {
         url="https://www.mininglamp.com/",
         org="Mininglamp",
         license="Proprietary",
-        model_handler=MiningHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.mining.MiningHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1082,7 +1035,7 @@ api_inference_model_map = {
         url="https://www.mininglamp.com/",
         org="Mininglamp",
         license="Proprietary",
-        model_handler=DMCitoHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.dm_cito.DMCitoHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1094,7 +1047,7 @@ api_inference_model_map = {
         url="https://www.mininglamp.com/",
         org="Mininglamp",
         license="Proprietary",
-        model_handler=DMCitoHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.dm_cito.DMCitoHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1106,7 +1059,7 @@ api_inference_model_map = {
         url="https://huggingface.co/inclusionAI/Ling-lite-1.5",
         org="Ling",
         license="MIT",
-        model_handler=LingAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.ling.LingAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1118,7 +1071,7 @@ api_inference_model_map = {
         url="https://huggingface.co/zai-org/GLM-4.6",
         org="Zhipu AI",
         license="MIT",
-        model_handler=GLMAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.glm.GLMAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1130,7 +1083,7 @@ api_inference_model_map = {
         url="https://huggingface.co/zai-org/GLM-4.5",
         org="Zhipu AI",
         license="MIT",
-        model_handler=GLMAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.glm.GLMAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1142,7 +1095,7 @@ api_inference_model_map = {
         url="https://huggingface.co/zai-org/GLM-4.5-Air",
         org="Zhipu AI",
         license="MIT",
-        model_handler=GLMAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.glm.GLMAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1154,7 +1107,7 @@ api_inference_model_map = {
         url="https://huggingface.co/moonshotai/Kimi-K2-Instruct",
         org="MoonshotAI",
         license="modified-mit",
-        model_handler=KimiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.kimi.KimiHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1166,7 +1119,7 @@ api_inference_model_map = {
         url="https://huggingface.co/moonshotai/Kimi-K2-Instruct",
         org="MoonshotAI",
         license="modified-mit",
-        model_handler=KimiHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.kimi.KimiHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1178,7 +1131,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Nanbeige",
         org="Nanbeige",
         license="apache-2.0",
-        model_handler=NanbeigeAPIHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.nanbeige.NanbeigeAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1194,7 +1147,7 @@ local_inference_model_map = {
         url="https://huggingface.co/deepseek-ai/DeepSeek-R1",
         org="DeepSeek",
         license="MIT",
-        model_handler=DeepseekReasoningHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.deepseek_reasoning.DeepseekReasoningHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1206,7 +1159,7 @@ local_inference_model_map = {
         url="https://blog.google/technology/developers/gemma-3/",
         org="Google",
         license="gemma-terms-of-use",
-        model_handler=GemmaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.gemma.GemmaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1218,7 +1171,7 @@ local_inference_model_map = {
         url="https://blog.google/technology/developers/gemma-3/",
         org="Google",
         license="gemma-terms-of-use",
-        model_handler=GemmaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.gemma.GemmaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1230,7 +1183,7 @@ local_inference_model_map = {
         url="https://blog.google/technology/developers/gemma-3/",
         org="Google",
         license="gemma-terms-of-use",
-        model_handler=GemmaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.gemma.GemmaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1242,7 +1195,7 @@ local_inference_model_map = {
         url="https://blog.google/technology/developers/gemma-3/",
         org="Google",
         license="gemma-terms-of-use",
-        model_handler=GemmaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.gemma.GemmaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1254,7 +1207,7 @@ local_inference_model_map = {
         url="https://ai.google.dev/gemma/docs/functiongemma",
         org="Google",
         license="gemma-terms-of-use",
-        model_handler=FunctionGemmaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.functiongemma.FunctionGemmaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1266,7 +1219,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler_3_1,
+        model_handler="bfcl_eval.model_handler.local_inference.llama_3_1.LlamaHandler_3_1",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1278,7 +1231,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1290,7 +1243,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler_3_1,
+        model_handler="bfcl_eval.model_handler.local_inference.llama_3_1.LlamaHandler_3_1",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1302,7 +1255,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1314,7 +1267,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1326,7 +1279,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1338,7 +1291,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1350,7 +1303,7 @@ local_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Scout-17B-16E-Instruct",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1362,7 +1315,7 @@ local_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Maverick-17B-128E-Instruct-FP8",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1374,7 +1327,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/Llama-xLAM-2-70b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceLlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.salesforce_llama.SalesforceLlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1386,7 +1339,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/Llama-xLAM-2-8b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceLlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.salesforce_llama.SalesforceLlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1398,7 +1351,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/xLAM-2-32b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceQwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.salesforce_qwen.SalesforceQwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1410,7 +1363,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/xLAM-2-3b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceQwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.salesforce_qwen.SalesforceQwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1422,7 +1375,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/xLAM-2-1b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceQwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.salesforce_qwen.SalesforceQwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1434,7 +1387,7 @@ local_inference_model_map = {
         url="https://huggingface.co/mistralai/Ministral-8B-Instruct-2410",
         org="Mistral AI",
         license="Mistral AI Research License",
-        model_handler=MistralFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.mistral_fc.MistralFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1446,7 +1399,7 @@ local_inference_model_map = {
         url="https://huggingface.co/microsoft/phi-4",
         org="Microsoft",
         license="MIT",
-        model_handler=PhiHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.phi.PhiHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1458,7 +1411,7 @@ local_inference_model_map = {
         url="https://huggingface.co/microsoft/Phi-4-mini-instruct",
         org="Microsoft",
         license="MIT",
-        model_handler=PhiHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.phi.PhiHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1470,7 +1423,7 @@ local_inference_model_map = {
         url="https://huggingface.co/microsoft/Phi-4-mini-instruct",
         org="Microsoft",
         license="MIT",
-        model_handler=PhiFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.phi_fc.PhiFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1482,7 +1435,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ibm-granite/granite-3.2-8b-instruct",
         org="IBM",
         license="Apache-2.0",
-        model_handler=Granite3FCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.granite_3.Granite3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1494,7 +1447,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ibm-granite/granite-3.1-8b-instruct",
         org="IBM",
         license="Apache-2.0",
-        model_handler=Granite3FCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.granite_3.Granite3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1506,7 +1459,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ibm-granite/granite-4.0-350m",
         org="IBM",
         license="Apache-2.0",
-        model_handler=Granite4FCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.granite_4.Granite4FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1518,7 +1471,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ibm-granite/granite-20b-functioncalling",
         org="IBM",
         license="Apache-2.0",
-        model_handler=GraniteFunctionCallingHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.granite.GraniteFunctionCallingHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1530,7 +1483,7 @@ local_inference_model_map = {
         url="https://huggingface.co/MadeAgents/Hammer2.1-7b",
         org="MadeAgents",
         license="cc-by-nc-4.0",
-        model_handler=HammerHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.hammer.HammerHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1542,7 +1495,7 @@ local_inference_model_map = {
         url="https://huggingface.co/MadeAgents/Hammer2.1-3b",
         org="MadeAgents",
         license="qwen-research",
-        model_handler=HammerHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.hammer.HammerHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1554,7 +1507,7 @@ local_inference_model_map = {
         url="https://huggingface.co/MadeAgents/Hammer2.1-1.5b",
         org="MadeAgents",
         license="cc-by-nc-4.0",
-        model_handler=HammerHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.hammer.HammerHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1566,7 +1519,7 @@ local_inference_model_map = {
         url="https://huggingface.co/MadeAgents/Hammer2.1-0.5b",
         org="MadeAgents",
         license="cc-by-nc-4.0",
-        model_handler=HammerHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.hammer.HammerHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1578,7 +1531,7 @@ local_inference_model_map = {
         url="https://huggingface.co/THUDM/glm-4-9b-chat",
         org="THUDM",
         license="glm-4",
-        model_handler=GLMHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.glm.GLMHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1590,7 +1543,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-0.6B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1602,7 +1555,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-0.6B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1614,7 +1567,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-1.7B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1626,7 +1579,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-1.7B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1638,7 +1591,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1650,7 +1603,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1662,7 +1615,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-8B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1674,7 +1627,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-8B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1686,7 +1639,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-14B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1698,7 +1651,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-14B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1710,7 +1663,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1722,7 +1675,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1734,7 +1687,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-30B-A3B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1746,7 +1699,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-30B-A3B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1758,7 +1711,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-235B-A22B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1770,7 +1723,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-235B-A22B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1782,7 +1735,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Team-ACE/ToolACE-2-8B",
         org="Huawei Noah & USTC",
         license="Apache-2.0",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1794,7 +1747,7 @@ local_inference_model_map = {
         url="https://huggingface.co/openbmb/MiniCPM3-4B",
         org="openbmb",
         license="Apache-2.0",
-        model_handler=MiniCPMHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.minicpm.MiniCPMHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1806,7 +1759,7 @@ local_inference_model_map = {
         url="https://huggingface.co/openbmb/MiniCPM3-4B",
         org="openbmb",
         license="Apache-2.0",
-        model_handler=MiniCPMFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.minicpm_fc.MiniCPMFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1818,7 +1771,7 @@ local_inference_model_map = {
         url="https://huggingface.co/watt-ai/watt-tool-8B/",
         org="Watt AI Lab",
         license="Apache-2.0",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1830,7 +1783,7 @@ local_inference_model_map = {
         url="https://huggingface.co/watt-ai/watt-tool-70B/",
         org="Watt AI Lab",
         license="Apache-2.0",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1842,7 +1795,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ZJared/Haha-7B",
         org="TeleAI",
         license="Apache 2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1854,7 +1807,7 @@ local_inference_model_map = {
         url="https://huggingface.co/speakleash/Bielik-11B-v2.3-Instruct",
         org="SpeakLeash & ACK Cyfronet AGH",
         license="Apache 2.0",
-        model_handler=BielikHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.bielik.BielikHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1866,7 +1819,7 @@ local_inference_model_map = {
         url="https://huggingface.co/NovaSky-AI/Sky-T1-32B-Preview",
         org="NovaSky-AI",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1878,7 +1831,7 @@ local_inference_model_map = {
         url="https://huggingface.co/tiiuae/Falcon3-10B-Instruct",
         org="TII UAE",
         license="falcon-llm-license",
-        model_handler=Falcon3FCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.falcon_fc.Falcon3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1890,7 +1843,7 @@ local_inference_model_map = {
         url="https://huggingface.co/tiiuae/Falcon3-7B-Instruct",
         org="TII UAE",
         license="falcon-llm-license",
-        model_handler=Falcon3FCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.falcon_fc.Falcon3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1902,7 +1855,7 @@ local_inference_model_map = {
         url="https://huggingface.co/tiiuae/Falcon3-3B-Instruct",
         org="TII UAE",
         license="falcon-llm-license",
-        model_handler=Falcon3FCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.falcon_fc.Falcon3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1914,7 +1867,7 @@ local_inference_model_map = {
         url="https://huggingface.co/tiiuae/Falcon3-1B-Instruct",
         org="TII UAE",
         license="falcon-llm-license",
-        model_handler=Falcon3FCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.falcon_fc.Falcon3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1926,7 +1879,7 @@ local_inference_model_map = {
         url="https://huggingface.co/uiuc-convai/CoALM-8B",
         org="UIUC + Oumi",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1938,7 +1891,7 @@ local_inference_model_map = {
         url="https://huggingface.co/uiuc-convai/CoALM-70B",
         org="UIUC + Oumi",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1950,7 +1903,7 @@ local_inference_model_map = {
         url="https://huggingface.co/uiuc-convai/CoALM-405B",
         org="UIUC + Oumi",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1962,7 +1915,7 @@ local_inference_model_map = {
         url="https://huggingface.co/katanemo/Arch-Agent-1.5B",
         org="katanemo",
         license="katanemo-research",
-        model_handler=ArchHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.arch.ArchHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1974,7 +1927,7 @@ local_inference_model_map = {
         url="https://huggingface.co/katanemo/Arch-Agent-3B",
         org="katanemo",
         license="katanemo-research",
-        model_handler=ArchHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.arch.ArchHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1986,7 +1939,7 @@ local_inference_model_map = {
         url="https://huggingface.co/katanemo/Arch-Agent-7B",
         org="katanemo",
         license="katanemo-research",
-        model_handler=ArchHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.arch.ArchHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1998,7 +1951,7 @@ local_inference_model_map = {
         url="https://huggingface.co/katanemo/Arch-Agent-32B",
         org="katanemo",
         license="katanemo-research",
-        model_handler=ArchHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.arch.ArchHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2010,7 +1963,7 @@ local_inference_model_map = {
         url="https://huggingface.co/BitAgent/BitAgent-8B/",
         org="Bittensor",
         license="Apache-2.0",
-        model_handler=LlamaHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -2022,7 +1975,7 @@ local_inference_model_map = {
         url="https://huggingface.co/BitAgent/BitAgent-Bounty-8B",
         org="Bittensor",
         license="Apache-2.0",
-        model_handler=BitAgentHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.bitagent.BitAgentHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2034,7 +1987,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ThinkAgents/ThinkAgent-1B",
         org="ThinkAgents",
         license="apache-2.0",
-        model_handler=ThinkAgentHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.think_agent.ThinkAgentHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2046,7 +1999,7 @@ local_inference_model_map = {
         url="https://huggingface.co/phronetic-ai/RZN-T",
         org="Phronetic AI",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -2058,7 +2011,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Nanbeige/Nanbeige4-3B-Thinking-2511",
         org="Nanbeige",
         license="apache-2.0",
-        model_handler=NanbeigeFCHandler,
+        model_handler="bfcl_eval.model_handler.local_inference.nanbeige_fc.NanbeigeFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2075,7 +2028,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Maverick-17B-128E-Instruct-FP8",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=NovitaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.novita.NovitaHandler",
         input_price=0.2,
         output_price=0.85,
         is_fc_model=False,
@@ -2087,7 +2040,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Maverick-17B-128E-Instruct-FP8",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=NovitaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.novita.NovitaHandler",
         input_price=0.2,
         output_price=0.85,
         is_fc_model=True,
@@ -2099,7 +2052,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Scout-17B-16E-Instruct",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=NovitaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.novita.NovitaHandler",
         input_price=0.1,
         output_price=0.5,
         is_fc_model=False,
@@ -2111,7 +2064,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Scout-17B-16E-Instruct",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=NovitaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.novita.NovitaHandler",
         input_price=0.1,
         output_price=0.5,
         is_fc_model=True,
@@ -2123,7 +2076,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/Qwen/QwQ-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=NovitaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.novita.NovitaHandler",
         input_price=0.18,
         output_price=0.2,
         is_fc_model=True,
@@ -2135,7 +2088,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/Qwen/QwQ-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=NovitaHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.novita.NovitaHandler",
         input_price=0.18,
         output_price=0.2,
         is_fc_model=False,
@@ -2148,7 +2101,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAgentThinkHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAgentThinkHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2160,7 +2113,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAgentNoThinkHandler,
+        model_handler="bfcl_eval.model_handler.api_inference.qwen.QwenAgentNoThinkHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -565,59 +565,143 @@ def parallel_function_checker_no_order(
             "error_type": "parallel_function_checker_no_order:wrong_count",
         }
 
-    matched_indices = []
-
-    # We go throught the possible answers one by one, and eliminate the model output that matches the possible answer
-    # It must be this way because we need ground truth to fetch the correct function description
-    for i in range(len(possible_answers)):
-        # possible_answers[i] is a dictionary with only one key
-        func_name_expected = list(possible_answers[i].keys())[0]
-        func_description = find_description(func_descriptions, func_name_expected)
-
-        all_errors = []
-
-        for index in range(len(model_output)):
-            if index in matched_indices:
-                continue
-
-            result = simple_function_checker(
-                func_description,
+    # The possible answers are matched to the model outputs as a bipartite matching problem: any assignment where every
+    # possible answer validates a distinct model output is accepted, even when matching them greedily in order would
+    # give a model output to the wrong possible answer first.
+
+    # A model output can only match a possible answer with the same function name, so the others are never checked
+    output_indices_by_name = {}
+    for index, output in enumerate(model_output):
+        for func_name in output:
+            output_indices_by_name.setdefault(func_name, []).append(index)
+
+    relevant_func_descriptions = []
+    candidate_indices = []
+    # (possible answer index, model output index) -> checker result
+    check_results = {}
+
+    def check(i: int, index: int) -> dict:
+        result = check_results.get((i, index))
+        if result is None:
+            result = check_results[(i, index)] = simple_function_checker(
+                relevant_func_descriptions[i],
                 model_output[index],
                 possible_answers[i],
                 language,
                 model_name,
             )
+        return result
+
+    # Model output index -> index of the possible answer it is matched to
+    matched_answer = {}
+    # Matching greedily in order is enough for almost all the entries
+    unmatched_answers = []
+    # The first possible answer left without a match, and the model outputs matched before it, to report if the model
+    # outputs can't all be matched
+    first_unmatched_answer = None
+    first_unmatched_indices = None
+
+    # We go through the possible answers one by one, as we need ground truth to fetch the correct function description
+    for i, possible_answer in enumerate(possible_answers):
+        # possible_answer is a dictionary with only one key
+        func_name_expected = list(possible_answer.keys())[0]
+        func_description = find_description(func_descriptions, func_name_expected)
+        relevant_func_descriptions.append(func_description)
+        candidates = output_indices_by_name.get(
+            convert_func_name(func_description["name"], model_name), []
+        )
+        candidate_indices.append(candidates)
 
-            if result["valid"]:
-                matched_indices.append(index)
+        for index in candidates:
+            if index in matched_answer:
+                continue
+            if check(i, index)["valid"]:
+                matched_answer[index] = i
                 break
-            else:
-                all_errors.append(
-                    {
-                        f"Model Result Index {index}": {
-                            "sub_error": result["error"],
-                            "sub_error_type": result["error_type"],
-                            "model_output_item": model_output[index],
-                            "possible_answer_item": possible_answers[i],
-                        }
-                    }
-                )
+        else:
+            if first_unmatched_answer is None:
+                first_unmatched_answer = i
+                first_unmatched_indices = set(matched_answer)
+            if not any(index in matched_answer for index in candidates):
+                # None of the model outputs is valid for this possible answer
+                break
+            unmatched_answers.append(i)
+    else:
+        # The others may still be matched by reassigning some of the model outputs
+        if all(
+            _find_augmenting_path(i, set(), candidate_indices, matched_answer, check)
+            for i in unmatched_answers
+        ):
+            return {"valid": True, "error": []}
 
-        if not result["valid"]:
-            considered_indices = [
-                i for i in range(len(model_output)) if i not in matched_indices
-            ]
-            all_errors.insert(
-                0,
-                f"Could not find a matching function among index {considered_indices} of model output for index {i} of possible answers.",
-            )
-            return {
-                "valid": False,
-                "error": all_errors,
-                "error_type": "parallel_function_checker_no_order:cannot_find_match",
+    return _parallel_no_order_match_error(
+        model_output,
+        possible_answers,
+        first_unmatched_answer,
+        first_unmatched_indices,
+        check,
+    )
+
+
+def _find_augmenting_path(
+    i: int, visited: set, candidate_indices: list, matched_answer: dict, check
+) -> bool:
+    """
+    Try to match the possible answer `i` to a model output, reassigning the ones already matched if needed (Kuhn's
+    algorithm). `matched_answer` maps each matched model output index to its possible answer index.
+    """
+    for index in candidate_indices[i]:
+        if index in visited or not check(i, index)["valid"]:
+            continue
+        visited.add(index)
+        if index not in matched_answer or _find_augmenting_path(
+            matched_answer[index], visited, candidate_indices, matched_answer, check
+        ):
+            matched_answer[index] = i
+            return True
+    return False
+
+
+def _parallel_no_order_match_error(
+    model_output: list,
+    possible_answers: list,
+    i: int,
+    matched_indices: set,
+    check,
+) -> dict:
+    """
+    Build the error of `parallel_function_checker_no_order` when the model outputs can't all be matched.
+
+    It reports the first possible answer left without a match when matching them greedily in order, and why each of the
+    model outputs not matched at that point was rejected.
+    """
+    all_errors = []
+    considered_indices = []
+    for index in range(len(model_output)):
+        if index in matched_indices:
+            continue
+        considered_indices.append(index)
+        result = check(i, index)
+        all_errors.append(
+            {
+                f"Model Result Index {index}": {
+                    "sub_error": result["error"],
+                    "sub_error_type": result["error_type"],
+                    "model_output_item": model_output[index],
+                    "possible_answer_item": possible_answers[i],
+                }
             }
+        )
 
-    return {"valid": True, "error": []}
+    all_errors.insert(
+        0,
+        f"Could not find a matching function among index {considered_indices} of model output for index {i} of possible answers.",
+    )
+    return {
+        "valid": False,
+        "error": all_errors,
+        "error_type": "parallel_function_checker_no_order:cannot_find_match",
+    }
 
 
 def multiple_function_checker(
@@ -1,6 +1,10 @@
 import argparse
+import math
+import multiprocessing as mp
 import statistics
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Optional
 
 from bfcl_eval.constants.enums import Language, ReturnFormat
 from bfcl_eval.constants.eval_config import *
@@ -16,6 +20,10 @@ from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils import (
     is_empty_execute_response,
 )
 from bfcl_eval.model_handler.base_handler import BaseHandler
+from bfcl_eval.model_handler.result_writer import (
+    UPDATE_LOG_SUFFIX,
+    load_result_file,
+)
 from bfcl_eval.model_handler.utils import parse_prompt_variation_params
 from bfcl_eval.utils import *
 from dotenv import load_dotenv
@@ -24,7 +32,7 @@ from tqdm import tqdm
 
 def get_handler(model_name: str) -> BaseHandler:
     config = MODEL_CONFIG_MAPPING[model_name]
-    handler: BaseHandler = config.model_handler(
+    handler: BaseHandler = config.handler_class(
         model_name=config.model_name,
         temperature=0,
         registry_name=model_name,
@@ -392,34 +400,34 @@ def _evaluate_single_ast_entry(
     return {"valid": True}
 
 
-def format_sensitivity_runner(
+def _evaluate_single_entry(
     handler: BaseHandler,
-    model_result,
-    prompt,
-    possible_answer,
+    model_result_entry: dict,
+    prompt_entry: dict,
+    possible_answer_entry: dict,
     model_name,
     test_category,
-    score_dir,
-):
-    assert (
-        len(model_result) == len(prompt) == len(possible_answer)
-    ), f"The length of the model result ({len(model_result)}) does not match the length of the prompt ({len(prompt)}) or possible answer ({len(possible_answer)}). Please check the input files for completeness."
-
-    # The format sensitivity tests are all single-turn tests, so we use a similar logic to the ast_file_runner to evaluate them.
+) -> dict:
+    """
+    Dispatch a single entry to the checker that matches its test category.
+    `possible_answer_entry` is None for relevance/irrelevance entries, which have no ground truth.
+    """
+    index = model_result_entry["id"]
+    model_result_item = model_result_entry["result"]
 
-    result = []
-    correct_count = 0
-    # Track stats per format sensitivity configuration
-    config_stats: dict[str, dict[str, int]] = defaultdict(
-        lambda: {"correct": 0, "total": 0}
-    )
+    if is_relevance_or_irrelevance(test_category):
+        # This function serves for both relevance and irrelevance tests, which share the exact opposite logic.
+        # If `test_category` is "irrelevance", the model is expected to output no function call.
+        # No function call means either the AST decoding fails (a error message is generated) or the decoded AST does not contain any function call (such as a empty list, `[]`).
+        # If `test_category` is "relevance", the model is expected to output to a function call, and empty list doesn't count as a function call.
+        return _evaluate_single_relevance_entry(
+            handler, index, model_result_item, prompt_entry, model_name, test_category
+        )
 
-    for i in range(len(model_result)):
-        index = model_result[i]["id"]
-        model_result_item = model_result[i]["result"]
-        prompt_entry = prompt[i]
-        possible_answer_item = possible_answer[i]["ground_truth"]
+    possible_answer_item = possible_answer_entry["ground_truth"]
 
+    if is_format_sensitivity(test_category):
+        # The format sensitivity tests are all single-turn tests, so we use a similar logic to the AST entries to evaluate them.
         assert (
             ":" in index and len(index.split(":")) == 3
         ), f"Test entry ID {index} should contain exactly two colons, since they are supposed to be the format sensitivity ids."
@@ -433,9 +441,7 @@ def format_sensitivity_runner(
             prompt_style,
         ) = parse_prompt_variation_params(format_sensitivity_config)
 
-        return_format = ReturnFormat(return_format)
-
-        entry_result = _evaluate_single_ast_entry(
+        return _evaluate_single_ast_entry(
             handler,
             index,
             model_result_item,
@@ -445,17 +451,111 @@ def format_sensitivity_runner(
             test_category,
             # Format sensitivity tests are all python tests
             language=Language.PYTHON,
-            return_format=return_format,
+            return_format=ReturnFormat(return_format),
             has_tool_call_tag=has_tool_call_tag,
         )
 
-        # Update stats for this configuration
+    elif is_multi_turn(test_category):
+        entry_result = _evaluate_single_multi_turn_entry(
+            handler,
+            index,
+            model_result_item,
+            possible_answer_item,
+            prompt_entry,
+            model_name,
+            test_category,
+        )
+
+    elif is_agentic(test_category):
+        entry_result = _evaluate_single_agentic_entry(
+            handler,
+            index,
+            model_result_item,
+            possible_answer_item,
+            prompt_entry,
+            model_name,
+            test_category,
+        )
+
+    # Single turn test
+    else:
+        if is_java(test_category):
+            language = Language.JAVA
+            return_format = ReturnFormat.JAVA
+        elif is_js(test_category):
+            language = Language.JAVASCRIPT
+            return_format = ReturnFormat.JAVASCRIPT
+        else:
+            language = Language.PYTHON
+            return_format = ReturnFormat.PYTHON
+
+        return _evaluate_single_ast_entry(
+            handler,
+            index,
+            model_result_item,
+            possible_answer_item,
+            prompt_entry,
+            model_name,
+            test_category,
+            language=language,
+            return_format=return_format,
+            has_tool_call_tag=False,
+        )
+
+    # Multi-turn and agentic entries keep the inference log for easier debugging
+    if not entry_result["valid"]:
+        entry_result["inference_log"] = model_result_entry.get("inference_log", "")
+    return entry_result
+
+
+def _evaluate_entries(
+    handler: BaseHandler,
+    model_result: list[dict],
+    prompt: list[dict],
+    possible_answer: Optional[list[dict]],
+    model_name,
+    test_category,
+) -> list[dict]:
+    """
+    Evaluate the aligned model result, prompt and possible answer entries. Return one result dict per entry, in input order.
+    """
+    if possible_answer is None:
+        possible_answer = [None] * len(model_result)
+
+    assert (
+        len(model_result) == len(prompt) == len(possible_answer)
+    ), f"The length of the model result ({len(model_result)}) does not match the length of the prompt ({len(prompt)}) or possible answer ({len(possible_answer)}). Please check the input files for completeness."
+
+    return [
+        _evaluate_single_entry(
+            handler,
+            model_result_entry,
+            prompt_entry,
+            possible_answer_entry,
+            model_name,
+            test_category,
+        )
+        for model_result_entry, prompt_entry, possible_answer_entry in zip(
+            model_result, prompt, possible_answer
+        )
+    ]
+
+
+def _get_format_sensitivity_header_fields(
+    entry_results: list[dict], model_result: list[dict]
+) -> dict:
+    """
+    Compute the per-configuration accuracy and the statistics across configurations for the format sensitivity category.
+    """
+    # Track stats per format sensitivity configuration
+    config_stats: dict[str, dict[str, int]] = defaultdict(
+        lambda: {"correct": 0, "total": 0}
+    )
+    for entry_result, model_result_entry in zip(entry_results, model_result):
+        format_sensitivity_config = model_result_entry["id"].split(":")[1]
         config_stats[format_sensitivity_config]["total"] += 1
         if entry_result["valid"]:
-            correct_count += 1
             config_stats[format_sensitivity_config]["correct"] += 1
-        else:
-            result.append(entry_result)
 
     # Compute accuracy per configuration
     accuracy_by_config = {
@@ -480,13 +580,38 @@ def format_sensitivity_runner(
         accuracy_std = 0.0
         accuracy_max_delta = 0.0
 
-    extra_header_fields = {
+    return {
         "accuracy_max_delta": accuracy_max_delta,
         "accuracy_variance": accuracy_variance,
         "accuracy_std": accuracy_std,
         **accuracy_by_config,
     }
 
+
+def _save_entry_results(
+    entry_results: list[dict],
+    model_result: list[dict],
+    test_category,
+    model_name,
+    score_dir,
+) -> tuple[float, int]:
+    """
+    Collect the failed entries from `entry_results` and write the score file for one (model, category) pair.
+    """
+    result = []
+    correct_count = 0
+    for entry_result in entry_results:
+        if entry_result["valid"]:
+            correct_count += 1
+        else:
+            result.append(entry_result)
+
+    extra_header_fields = None
+    if is_format_sensitivity(test_category):
+        extra_header_fields = _get_format_sensitivity_header_fields(
+            entry_results, model_result
+        )
+
     return save_eval_results(
         result,
         correct_count,
@@ -498,173 +623,109 @@ def format_sensitivity_runner(
     )
 
 
-def agentic_runner(
-    handler: BaseHandler,
-    model_result,
-    prompt,
-    possible_answer,
-    model_name,
-    test_category,
-    score_dir,
-):
-    assert (
-        len(model_result) == len(prompt) == len(possible_answer)
-    ), f"The length of the model result ({len(model_result)}) does not match the length of the prompt ({len(prompt)}) or possible answer ({len(possible_answer)}). Please check the input files for completeness."
+#### Main runner function ####
+def _load_aligned_entries(
+    test_category, model_result, allow_missing: bool = False
+) -> tuple[list[dict], Optional[list[dict]]]:
+    """
+    Load the prompt and possible answer entries for `test_category`, aligned with the IDs present in `model_result`.
+    The possible answer is None for relevance/irrelevance categories.
+    """
+    # For a partial evaluation, only load the entries present in the model result
+    entry_ids = {entry["id"] for entry in model_result} if allow_missing else None
 
-    result = []
-    correct_count = 0
-    for i in range(len(model_result)):
-        index = model_result[i]["id"]
-        model_result_list = model_result[i]["result"]
-        possible_answer_item = possible_answer[i]["ground_truth"]
-        test_entry = prompt[i]
+    # Find the corresponding prompt entries
+    prompt = load_dataset_entry(
+        test_category,
+        include_prereq=False,
+        include_language_specific_hint=False,
+        entry_ids=entry_ids,
+    )
 
-        entry_result = _evaluate_single_agentic_entry(
-            handler,
-            index,
-            model_result_list,
-            possible_answer_item,
-            test_entry,
-            model_name,
-            test_category,
+    if is_relevance_or_irrelevance(test_category):
+        prompt, _ = _subset_entries_by_model_ids(
+            model_result, prompt, None, allow_missing=allow_missing
         )
+        return prompt, None
 
-        if entry_result["valid"]:
-            correct_count += 1
-        else:
-            entry_result["inference_log"] = model_result[i].get("inference_log", "")
-            result.append(entry_result)
+    # Find the corresponding possible answer entries
+    possible_answer = load_ground_truth_entry(test_category, entry_ids=entry_ids)
+    # Sanity: prompt and ground truth should be 1:1
+    assert len(prompt) == len(
+        possible_answer
+    ), f"Length of ground truth ({len(possible_answer)}) should match prompt entries ({len(prompt)})."
 
-    return save_eval_results(
-        result, correct_count, model_result, test_category, model_name, score_dir
+    return _subset_entries_by_model_ids(
+        model_result, prompt, possible_answer, allow_missing=allow_missing
     )
 
 
-def multi_turn_runner(
-    handler: BaseHandler,
-    model_result,
-    prompt,
-    possible_answer,
+def _lookup_cached_entry_results(
+    model_result: list[dict],
+    prompt: list[dict],
+    possible_answer: Optional[list[dict]],
     model_name,
     test_category,
     score_dir,
-):
-    assert (
-        len(model_result) == len(prompt) == len(possible_answer)
-    ), f"The length of the model result ({len(model_result)}) does not match the length of the prompt ({len(prompt)}) or possible answer ({len(possible_answer)}). Please check the input files for completeness."
-
-    result = []
-    correct_count = 0
-    for i in range(len(model_result)):
-        index = model_result[i]["id"]
-        multi_turn_model_result_list = model_result[i]["result"]
-        multi_turn_ground_truth_list = possible_answer[i]["ground_truth"]
-        test_entry = prompt[i]
-
-        entry_result = _evaluate_single_multi_turn_entry(
-            handler,
-            index,
-            multi_turn_model_result_list,
-            multi_turn_ground_truth_list,
-            test_entry,
-            model_name,
-            test_category,
+) -> tuple[list[str], list[Optional[dict]], list[int]]:
+    """
+    Hash every entry and reuse the verdicts cached by previous runs.
+    Return the entry hashes, the entry results (None for entries that need to be checked) and the indices of those entries.
+    The returned entry hashes are None when the cache is already up to date and doesn't need to be rewritten.
+    """
+    if possible_answer is None:
+        possible_answer = [None] * len(model_result)
+
+    cached_verdicts = load_eval_cache(score_dir, model_name, test_category)
+    # Hashes must be computed before the checkers run, as some of them modify the prompt entry
+    entry_hashes = [
+        compute_entry_hash(model_result_entry, prompt_entry, possible_answer_entry)
+        for model_result_entry, prompt_entry, possible_answer_entry in zip(
+            model_result, prompt, possible_answer
         )
+    ]
+    entry_results = [cached_verdicts.get(entry_hash) for entry_hash in entry_hashes]
+    pending_indices = [i for i, result in enumerate(entry_results) if result is None]
 
-        if entry_result["valid"]:
-            correct_count += 1
-        else:
-            entry_result["inference_log"] = model_result[i].get("inference_log", "")
-            result.append(entry_result)
-
-    return save_eval_results(
-        result, correct_count, model_result, test_category, model_name, score_dir
-    )
-
-
-def relevance_file_runner(
-    handler: BaseHandler, model_result, prompt, model_name, test_category, score_dir
-):
-    # This function serves for both relevance and irrelevance tests, which share the exact opposite logic.
-    # If `test_category` is "irrelevance", the model is expected to output no function call.
-    # No function call means either the AST decoding fails (a error message is generated) or the decoded AST does not contain any function call (such as a empty list, `[]`).
-    # If `test_category` is "relevance", the model is expected to output to a function call, and empty list doesn't count as a function call.
-    result = []
-    correct_count = 0
-    for i in range(len(model_result)):
-        index = model_result[i]["id"]
-        model_result_item = model_result[i]["result"]
-        prompt_entry = prompt[i]
-
-        entry_result = _evaluate_single_relevance_entry(
-            handler, index, model_result_item, prompt_entry, model_name, test_category
+    if len(pending_indices) < len(entry_results):
+        print(
+            f"♻️  Reusing cached verdicts for {len(entry_results) - len(pending_indices)}/{len(entry_results)} entries."
         )
 
-        if entry_result["valid"]:
-            correct_count += 1
-        else:
-            result.append(entry_result)
+    if not pending_indices and len(cached_verdicts) == len(set(entry_hashes)):
+        return None, entry_results, pending_indices
+    return entry_hashes, entry_results, pending_indices
 
-    return save_eval_results(
-        result, correct_count, model_result, test_category, model_name, score_dir
-    )
 
+def _select_entries(entries: Optional[list[dict]], indices: list[int]):
+    if entries is None:
+        return None
+    return [entries[i] for i in indices]
 
-def ast_file_runner(
-    handler: BaseHandler,
-    model_result,
-    prompt,
-    possible_answer,
+
+def _record_task_result(
+    entry_results,
     test_category,
-    model_name,
     score_dir,
+    model_result,
+    model_name,
+    leaderboard_table,
+    entry_hashes: Optional[list[str]] = None,
 ):
-    assert (
-        len(model_result) == len(prompt) == len(possible_answer)
-    ), f"The length of the model result ({len(model_result)}) does not match the length of the prompt ({len(prompt)}) or possible answer ({len(possible_answer)}). Please check the input files for completeness."
-
-    if is_java(test_category):
-        language = Language.JAVA
-        return_format = ReturnFormat.JAVA
-    elif is_js(test_category):
-        language = Language.JAVASCRIPT
-        return_format = ReturnFormat.JAVASCRIPT
-    else:
-        language = Language.PYTHON
-        return_format = ReturnFormat.PYTHON
+    accuracy, total_count = _save_entry_results(
+        entry_results, model_result, test_category, model_name, score_dir
+    )
 
-    result = []
-    correct_count = 0
-    for i in range(len(model_result)):
-        index = model_result[i]["id"]
-        model_result_item = model_result[i]["result"]
-        prompt_entry = prompt[i]
-        possible_answer_item = possible_answer[i]["ground_truth"]
+    if entry_hashes is not None:
+        save_eval_cache(score_dir, model_name, test_category, entry_hashes, entry_results)
 
-        entry_result = _evaluate_single_ast_entry(
-            handler,
-            index,
-            model_result_item,
-            possible_answer_item,
-            prompt_entry,
-            model_name,
-            test_category,
-            language=language,
-            return_format=return_format,
-            has_tool_call_tag=False,
-        )
+    record_result(leaderboard_table, model_name, test_category, accuracy, total_count)
 
-        if entry_result["valid"]:
-            correct_count += 1
-        else:
-            result.append(entry_result)
+    print(f"✅ Test completed: {test_category}. 🎯 Accuracy: {accuracy:.2%}")
 
-    return save_eval_results(
-        result, correct_count, model_result, test_category, model_name, score_dir
-    )
+    return leaderboard_table
 
 
-#### Main runner function ####
 def evaluate_task(
     test_category,
     result_dir,
@@ -674,90 +735,280 @@ def evaluate_task(
     handler,
     leaderboard_table,
     allow_missing: bool = False,
+    use_cache: bool = True,
 ):
     print(f"🔍 Running test: {test_category}")
 
-    record_cost_latency(leaderboard_table, model_name, model_result)
+    record_cost_latency(leaderboard_table, model_name, model_result, test_category)
 
-    # Find the corresponding prompt entries
-    prompt = load_dataset_entry(
-        test_category, include_prereq=False, include_language_specific_hint=False
+    prompt, possible_answer = _load_aligned_entries(
+        test_category, model_result, allow_missing=allow_missing
     )
 
-    if is_relevance_or_irrelevance(test_category):
-        prompt, _ = _subset_entries_by_model_ids(
-            model_result, prompt, None, allow_missing=allow_missing
+    if not use_cache:
+        entry_results = _evaluate_entries(
+            handler, model_result, prompt, possible_answer, model_name, test_category
         )
-
-        accuracy, total_count = relevance_file_runner(
-            handler, model_result, prompt, model_name, test_category, score_dir
+        return _record_task_result(
+            entry_results,
+            test_category,
+            score_dir,
+            model_result,
+            model_name,
+            leaderboard_table,
         )
 
-    else:
-        # Find the corresponding possible answer entries
-        possible_answer = load_ground_truth_entry(test_category)
-        # Sanity: prompt and ground truth should be 1:1
-        assert len(prompt) == len(
-            possible_answer
-        ), f"Length of ground truth ({len(possible_answer)}) should match prompt entries ({len(prompt)})."
-
-        prompt, possible_answer = _subset_entries_by_model_ids(
-            model_result, prompt, possible_answer, allow_missing=allow_missing
-        )
+    entry_hashes, entry_results, pending_indices = _lookup_cached_entry_results(
+        model_result, prompt, possible_answer, model_name, test_category, score_dir
+    )
+    pending_results = _evaluate_entries(
+        handler,
+        _select_entries(model_result, pending_indices),
+        _select_entries(prompt, pending_indices),
+        _select_entries(possible_answer, pending_indices),
+        model_name,
+        test_category,
+    )
+    for i, entry_result in zip(pending_indices, pending_results):
+        entry_results[i] = entry_result
 
-        if is_format_sensitivity(test_category):
-            accuracy, total_count = format_sensitivity_runner(
-                handler,
-                model_result,
-                prompt,
-                possible_answer,
-                model_name,
-                test_category,
-                score_dir,
-            )
+    return _record_task_result(
+        entry_results,
+        test_category,
+        score_dir,
+        model_result,
+        model_name,
+        leaderboard_table,
+        entry_hashes=entry_hashes,
+    )
+
+
+def _iter_model_result_files(subdir: Path, test_categories):
+    """
+    Yield the `(test_category, model_result_json)` pairs to evaluate for one model result directory.
+    """
+    # Find and process all result JSON files recursively in the subdirectory
+    model_result_jsons = list(subdir.rglob(RESULT_FILE_PATTERN))
+    # An interrupted `--run-ids` generation may have left the results of a category in an update log only
+    for update_log in subdir.rglob(RESULT_FILE_PATTERN + UPDATE_LOG_SUFFIX):
+        model_result_json = update_log.with_name(update_log.name[: -len(UPDATE_LOG_SUFFIX)])
+        if not model_result_json.exists():
+            model_result_jsons.append(model_result_json)
+
+    for model_result_json in model_result_jsons:
+        test_category = extract_test_category(model_result_json)
+        if test_category not in test_categories:
+            continue
+
+        # We don't evaluate the following categories in the current iteration of the benchmark
+        if (
+            is_chatable(test_category)
+            or is_sql(test_category)
+            or is_executable(test_category)
+            or is_memory_prereq(test_category)
+        ):
+            continue
+
+        yield test_category, model_result_json
+
+
+# Handlers built inside each worker process, keyed by the model name
+_WORKER_HANDLERS: dict[str, BaseHandler] = {}
+
+
+def _evaluate_entry_chunk(
+    model_name,
+    test_category,
+    model_result: list[dict],
+    prompt: list[dict],
+    possible_answer: Optional[list[dict]],
+) -> list[dict]:
+    """
+    Worker entry point for the parallel runner. Evaluate one chunk of aligned entries for a (model, category) pair.
+    """
+    if model_name not in _WORKER_HANDLERS:
+        _WORKER_HANDLERS[model_name] = get_handler(model_name.replace("_", "/"))
+    handler = _WORKER_HANDLERS[model_name]
+
+    return _evaluate_entries(
+        handler, model_result, prompt, possible_answer, model_name, test_category
+    )
+
+
+# The parallel runner keeps at most this many chunks per worker submitted to the pool and not yet done...
+MAX_IN_FLIGHT_CHUNKS_PER_WORKER = 2
+# ...and the entries of at most this many categories per worker loaded at a time
+MAX_LOADED_CATEGORIES_PER_WORKER = 1
 
-        elif is_multi_turn(test_category):
-            accuracy, total_count = multi_turn_runner(
-                handler,
-                model_result,
-                prompt,
-                possible_answer,
-                model_name,
-                test_category,
-                score_dir,
-            )
 
-        elif is_agentic(test_category):
-            accuracy, total_count = agentic_runner(
-                handler,
-                model_result,
-                prompt,
-                possible_answer,
-                model_name,
-                test_category,
-                score_dir,
+class _ParallelTask:
+    """
+    The entries of one (model, category) pair being evaluated by the parallel runner, split into chunks that are
+    submitted to the pool one at a time.
+    """
+
+    def __init__(
+        self,
+        model_name,
+        test_category,
+        model_result_json,
+        score_dir,
+        allow_missing: bool,
+        use_cache: bool,
+        num_workers: int,
+    ) -> None:
+        self.model_name = model_name
+        self.test_category = test_category
+        self.model_result = load_result_file(model_result_json)
+        self.prompt, self.possible_answer = _load_aligned_entries(
+            test_category, self.model_result, allow_missing=allow_missing
+        )
+
+        if use_cache:
+            self.entry_hashes, self.entry_results, pending_indices = (
+                _lookup_cached_entry_results(
+                    self.model_result,
+                    self.prompt,
+                    self.possible_answer,
+                    model_name,
+                    test_category,
+                    score_dir,
+                )
             )
-        # Single turn test
         else:
-            accuracy, total_count = ast_file_runner(
-                handler,
-                model_result,
-                prompt,
-                possible_answer,
-                test_category,
-                model_name,
-                score_dir,
-            )
+            self.entry_hashes = None
+            self.entry_results = [None] * len(self.model_result)
+            pending_indices = list(range(len(self.model_result)))
+
+        # Aim for a few chunks per worker so that slow (eg. multi-turn) chunks don't leave the pool idle at the end
+        chunk_size = max(1, math.ceil(len(pending_indices) / (num_workers * 4)))
+        self.unsubmitted_chunks = deque(
+            pending_indices[i : i + chunk_size]
+            for i in range(0, len(pending_indices), chunk_size)
+        )
+        self.submitted_chunks = []
+
+    def submit_next_chunk(self, pool: ProcessPoolExecutor) -> Future:
+        # The entries of a chunk are only copied (and pickled) once it is submitted
+        chunk_indices = self.unsubmitted_chunks.popleft()
+        future = pool.submit(
+            _evaluate_entry_chunk,
+            self.model_name,
+            self.test_category,
+            _select_entries(self.model_result, chunk_indices),
+            _select_entries(self.prompt, chunk_indices),
+            _select_entries(self.possible_answer, chunk_indices),
+        )
+        self.submitted_chunks.append((chunk_indices, future))
+        return future
 
-    record_result(leaderboard_table, model_name, test_category, accuracy, total_count)
+    def is_done(self) -> bool:
+        return not self.unsubmitted_chunks and all(
+            future.done() for _, future in self.submitted_chunks
+        )
 
-    print(f"✅ Test completed: {test_category}. 🎯 Accuracy: {accuracy:.2%}")
+
+def _parallel_runner(
+    subdirs,
+    result_dir,
+    score_dir,
+    test_categories,
+    leaderboard_table,
+    allow_missing: bool,
+    num_workers: int,
+    use_cache: bool = True,
+):
+    """
+    Shard the (model, category, entry-chunk) work units across a process pool.
+
+    The categories are loaded and submitted in order, within a bounded window: at most
+    `MAX_LOADED_CATEGORIES_PER_WORKER * num_workers` categories are loaded, and at most
+    `MAX_IN_FLIGHT_CHUNKS_PER_WORKER * num_workers` chunks are waiting in the pool, so the memory used doesn't grow
+    with the number of models and categories evaluated. The per-category results are recorded in the same order as
+    the serial path, so the score files and the leaderboard CSVs are identical to a serial run.
+    """
+    work_items = [
+        (subdir.relative_to(result_dir).name, test_category, model_result_json)
+        for subdir in subdirs
+        for test_category, model_result_json in _iter_model_result_files(
+            subdir, test_categories
+        )
+    ]
+    max_in_flight_chunks = num_workers * MAX_IN_FLIGHT_CHUNKS_PER_WORKER
+    max_loaded_tasks = num_workers * MAX_LOADED_CATEGORIES_PER_WORKER
+
+    remaining_work_items = iter(work_items)
+    # Loaded tasks, in the order of `work_items`; only the last one may still have unsubmitted chunks
+    loaded_tasks = deque()
+    in_flight = set()
+    with ProcessPoolExecutor(
+        max_workers=num_workers, mp_context=mp.get_context("spawn")
+    ) as pool, tqdm(
+        total=len(work_items), desc="Number of test categories evaluated"
+    ) as pbar:
+        while True:
+            # Fill the window
+            while len(in_flight) < max_in_flight_chunks:
+                if loaded_tasks and loaded_tasks[-1].unsubmitted_chunks:
+                    in_flight.add(loaded_tasks[-1].submit_next_chunk(pool))
+                    continue
+                if len(loaded_tasks) >= max_loaded_tasks:
+                    break
+                work_item = next(remaining_work_items, None)
+                if work_item is None:
+                    break
+                loaded_tasks.append(
+                    _ParallelTask(
+                        *work_item,
+                        score_dir,
+                        allow_missing=allow_missing,
+                        use_cache=use_cache,
+                        num_workers=num_workers,
+                    )
+                )
+
+            # Record the finished tasks in order, which frees their entries
+            if loaded_tasks and loaded_tasks[0].is_done():
+                task = loaded_tasks.popleft()
+                print(f"🦍 Model: {task.model_name}")
+                print(f"🔍 Running test: {task.test_category}")
+                record_cost_latency(
+                    leaderboard_table, task.model_name, task.model_result, task.test_category
+                )
+
+                for chunk_indices, future in task.submitted_chunks:
+                    for i, entry_result in zip(chunk_indices, future.result()):
+                        task.entry_results[i] = entry_result
+
+                leaderboard_table = _record_task_result(
+                    task.entry_results,
+                    task.test_category,
+                    score_dir,
+                    task.model_result,
+                    task.model_name,
+                    leaderboard_table,
+                    entry_hashes=task.entry_hashes,
+                )
+                pbar.update(1)
+                continue
+
+            # Nothing is in flight only once every task is recorded
+            if not in_flight:
+                break
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            in_flight -= done
 
     return leaderboard_table
 
 
 def runner(
-    model_names, test_categories, result_dir, score_dir, allow_missing: bool = False
+    model_names,
+    test_categories,
+    result_dir,
+    score_dir,
+    allow_missing: bool = False,
+    num_workers: int = 1,
+    use_cache: bool = True,
 ):
 
     # A dictionary to store the evaluation scores.
@@ -770,48 +1021,52 @@ def runner(
     entries = result_dir.iterdir()
 
     # Filter out the subdirectories
-    subdirs = [entry for entry in entries if entry.is_dir()]
-
-    # Traverse each subdirectory
-    for subdir in tqdm(subdirs, desc="Number of models evaluated"):
-
-        model_name = subdir.relative_to(result_dir).name
-        if model_names is not None and model_name not in model_names:
-            continue
+    subdirs = [
+        entry
+        for entry in entries
+        if entry.is_dir()
+        and (model_names is None or entry.relative_to(result_dir).name in model_names)
+    ]
+
+    if num_workers > 1:
+        leaderboard_table = _parallel_runner(
+            subdirs,
+            result_dir,
+            score_dir,
+            test_categories,
+            leaderboard_table,
+            allow_missing=allow_missing,
+            num_workers=num_workers,
+            use_cache=use_cache,
+        )
 
-        model_name_escaped = model_name.replace("_", "/")
+    else:
+        # Traverse each subdirectory
+        for subdir in tqdm(subdirs, desc="Number of models evaluated"):
 
-        print(f"🦍 Model: {model_name}")
+            model_name = subdir.relative_to(result_dir).name
+            model_name_escaped = model_name.replace("_", "/")
 
-        # Find and process all result JSON files recursively in the subdirectory
-        for model_result_json in subdir.rglob(RESULT_FILE_PATTERN):
-            test_category = extract_test_category(model_result_json)
-            if test_category not in test_categories:
-                continue
+            print(f"🦍 Model: {model_name}")
 
-            handler = get_handler(model_name_escaped)
-
-            # We don't evaluate the following categories in the current iteration of the benchmark
-            if (
-                is_chatable(test_category)
-                or is_sql(test_category)
-                or is_executable(test_category)
-                or is_memory_prereq(test_category)
+            for test_category, model_result_json in _iter_model_result_files(
+                subdir, test_categories
             ):
-                continue
-
-            model_result = load_file(model_result_json, sort_by_id=True)
-
-            leaderboard_table = evaluate_task(
-                test_category,
-                result_dir,
-                score_dir,
-                model_result,
-                model_name,
-                handler,
-                leaderboard_table,
-                allow_missing=allow_missing,
-            )
+                handler = get_handler(model_name_escaped)
+
+                model_result = load_result_file(model_result_json)
+
+                leaderboard_table = evaluate_task(
+                    test_category,
+                    result_dir,
+                    score_dir,
+                    model_result,
+                    model_name,
+                    handler,
+                    leaderboard_table,
+                    allow_missing=allow_missing,
+                    use_cache=use_cache,
+                )
 
     # This function reads all the score files from local folder and updates the
     # leaderboard table. This is helpful when you only want to run the
@@ -821,7 +1076,15 @@ def runner(
     generate_leaderboard_csv(leaderboard_table, score_dir)
 
 
-def main(model, test_categories, result_dir, score_dir, partial_eval: bool = False):
+def main(
+    model,
+    test_categories,
+    result_dir,
+    score_dir,
+    partial_eval: bool = False,
+    num_workers: int = 1,
+    use_cache: bool = True,
+):
     if result_dir is None:
         result_dir = RESULT_PATH
     else:
@@ -855,6 +1118,8 @@ def main(model, test_categories, result_dir, score_dir, partial_eval: bool = Fal
         result_dir,
         score_dir,
         allow_missing=partial_eval,
+        num_workers=num_workers,
+        use_cache=use_cache,
     )
 
     print(
@@ -867,6 +1132,7 @@ def main(model, test_categories, result_dir, score_dir, partial_eval: bool = Fal
     print(
         f"See {score_dir / 'data_live.csv'}, {score_dir / 'data_non_live.csv'}, {score_dir / 'data_multi_turn.csv'}, {score_dir / 'data_agentic.csv'} and {score_dir / 'data_format_sensitivity.csv'} for detailed evaluation results on each sub-section categories respectively."
     )
+    print(f"See {score_dir / 'data_latency.csv'} for the latency statistics of each model.")
 
 
 if __name__ == "__main__":
@@ -902,6 +1168,20 @@ if __name__ == "__main__":
         help="Run evaluation on a partial set of benchmark entries (eg. entries present in the model result files) without raising for missing IDs.",
     )
 
+    parser.add_argument(
+        "--num-workers",
+        default=1,
+        type=int,
+        help="Number of worker processes used to evaluate the entries in parallel. The default (1) evaluates serially.",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        default=False,
+        action="store_true",
+        help="Re-check every entry instead of reusing the cached verdicts from previous evaluation runs.",
+    )
+
     args = parser.parse_args()
 
     load_dotenv(dotenv_path=DOTENV_PATH, verbose=True, override=True)  # Load the .env file
@@ -911,4 +1191,6 @@ if __name__ == "__main__":
         args.result_dir,
         args.score_dir,
         partial_eval=args.partial_eval,
+        num_workers=args.num_workers,
+        use_cache=not args.no_cache,
     )
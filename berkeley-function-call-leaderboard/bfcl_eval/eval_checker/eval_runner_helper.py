@@ -1,10 +1,12 @@
+import hashlib
+import json
 import os
-import statistics
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 import numpy as np
-import pandas as pd
 from bfcl_eval.constants.category_mapping import VERSION_PREFIX
 from bfcl_eval.constants.column_headers import *
 from bfcl_eval.constants.eval_config import *
@@ -124,41 +126,166 @@ def record_result(leaderboard_table, model_name, test_category, accuracy, total_
     }
 
 
-def record_cost_latency(leaderboard_table, model_name, model_output_data):
-    def process_data(key, data, output_list):
-        # All entries are either a list of list (in multi-turn), or a single value (in single-turn)
-        if key in data:
-            if isinstance(data[key], list) and all(
-                isinstance(inner_item, list) for inner_item in data[key]
-            ):
-                flattened_list = sum(data[key], [])
-                output_list.extend(
-                    [
-                        item
-                        for item in flattened_list
-                        if isinstance(item, (int, float)) and item != 0
-                    ]
-                )
+def _read_metric(model_output_data: list[dict], key: str) -> tuple[np.ndarray, dict]:
+    """
+    Read the values of `key` in all the entries, dropping the ones that aren't a nonzero number.
+
+    Also return the per-turn totals of the multi-turn entries, as a dict mapping the turn index to the array of the
+    (nonzero) sums of the values of that turn.
+    """
+    # The values are read in a single pass; the entries are cut into segments (a single-turn entry, or one turn of a
+    # multi-turn entry) to compute the per-turn sums afterwards
+    segment_lengths = []
+    segment_turns = []
+
+    def iter_values():
+        for data in model_output_data:
+            value = data.get(key)
+            # All entries are either a list of list (in multi-turn), or a single value (in single-turn)
+            if isinstance(value, list):
+                if not all(isinstance(turn, list) for turn in value):
+                    continue
+                for turn_index, turn in enumerate(value):
+                    segment_lengths.append(len(turn))
+                    segment_turns.append(turn_index)
+                    yield from turn
             else:
-                if isinstance(data[key], (int, float)) and data[key] != 0:
-                    output_list.append(data[key])
+                segment_lengths.append(1)
+                segment_turns.append(-1)
+                yield value
 
-    if model_name not in leaderboard_table:
-        leaderboard_table[model_name] = {}
-        leaderboard_table[model_name]["cost"] = {"input_data": [], "output_data": []}
-        leaderboard_table[model_name]["latency"] = {"data": []}
+    values = np.fromiter(
+        (value if isinstance(value, (int, float)) else 0 for value in iter_values()),
+        dtype=np.float64,
+    )
+    segment_turns = np.asarray(segment_turns, dtype=np.int64)
+    segment_ids = np.repeat(
+        np.arange(len(segment_lengths)), np.asarray(segment_lengths, dtype=np.int64)
+    )
+    segment_totals = np.bincount(segment_ids, weights=values, minlength=len(segment_lengths))
+
+    turn_totals = {}
+    for turn_index in np.unique(segment_turns[segment_turns >= 0]):
+        totals = segment_totals[segment_turns == turn_index]
+        turn_totals[int(turn_index)] = totals[totals != 0]
+    return values[values != 0], turn_totals
+
+
+def _concatenate(chunks: list) -> np.ndarray:
+    return np.concatenate(chunks) if chunks else np.empty(0, dtype=np.float64)
 
-    input_token = []
-    output_token = []
-    latency = []
-    for data in model_output_data:
-        process_data("latency", data, latency)
-        process_data("input_token_count", data, input_token)
-        process_data("output_token_count", data, output_token)
 
-    leaderboard_table[model_name]["cost"]["input_data"].extend(input_token)
-    leaderboard_table[model_name]["cost"]["output_data"].extend(output_token)
-    leaderboard_table[model_name]["latency"]["data"].extend(latency)
+class CostLatencyStats:
+    """
+    Token counts and latencies of the responses of a model, gathered from its result files.
+
+    The values of each result file are read straight into one NumPy array per metric, so that the statistics over the
+    hundreds of thousands of requests of a full run are computed on arrays rather than Python lists. Latencies and
+    output tokens are also kept per test category and, for the multi-turn entries, per turn (summed over the steps of
+    the turn).
+    """
+
+    def __init__(self) -> None:
+        self._input_tokens = []
+        self._latency = []
+        self._output_tokens = []
+        # test category -> arrays of its latencies / output tokens
+        self._category_latency = defaultdict(list)
+        self._category_output_tokens = defaultdict(list)
+        # turn index -> arrays of the latencies / output tokens of that turn
+        self._turn_latency = defaultdict(list)
+        self._turn_output_tokens = defaultdict(list)
+
+    def add(self, model_output_data: list[dict], test_category: Optional[str] = None) -> None:
+        input_tokens, _ = _read_metric(model_output_data, "input_token_count")
+        latency, turn_latency = _read_metric(model_output_data, "latency")
+        output_tokens, turn_output_tokens = _read_metric(
+            model_output_data, "output_token_count"
+        )
+
+        self._input_tokens.append(input_tokens)
+        self._latency.append(latency)
+        self._output_tokens.append(output_tokens)
+        if test_category is not None:
+            self._category_latency[test_category].append(latency)
+            self._category_output_tokens[test_category].append(output_tokens)
+        for turn_index, totals in turn_latency.items():
+            self._turn_latency[turn_index].append(totals)
+        for turn_index, totals in turn_output_tokens.items():
+            self._turn_output_tokens[turn_index].append(totals)
+
+    @property
+    def input_tokens(self) -> np.ndarray:
+        return _concatenate(self._input_tokens)
+
+    @property
+    def latency(self) -> np.ndarray:
+        return _concatenate(self._latency)
+
+    @property
+    def output_tokens(self) -> np.ndarray:
+        return _concatenate(self._output_tokens)
+
+    def iter_scopes(self):
+        """
+        Yield `(scope, latency, output_tokens)` for the whole model, then for each test category and each turn.
+        """
+        yield "Overall", self.latency, self.output_tokens
+        for test_category in sorted(self._category_latency):
+            yield (
+                test_category,
+                _concatenate(self._category_latency[test_category]),
+                _concatenate(self._category_output_tokens[test_category]),
+            )
+        for turn_index in sorted(self._turn_latency):
+            yield (
+                f"Turn {turn_index + 1}",
+                _concatenate(self._turn_latency[turn_index]),
+                _concatenate(self._turn_output_tokens[turn_index]),
+            )
+
+
+def get_latency_stats(latency: np.ndarray, output_tokens: np.ndarray) -> dict:
+    """
+    Mean, standard deviation and percentiles of the latencies, and the output tokens generated per second of latency.
+    Statistics that can't be computed (eg. no latency recorded) are "N/A".
+    """
+    stats = {
+        "count": len(latency),
+        "mean": "N/A",
+        "std": "N/A",
+        "p50": "N/A",
+        "p90": "N/A",
+        "p95": "N/A",
+        "p99": "N/A",
+        "output_tokens_per_second": "N/A",
+    }
+    if len(latency) == 0:
+        return stats
+
+    stats["mean"] = round(float(latency.mean()), 2)
+    if len(latency) > 1:
+        stats["std"] = round(float(latency.std(ddof=1)), 2)
+    p50, p90, p95, p99 = np.percentile(latency, [50, 90, 95, 99])
+    stats["p50"] = round(float(p50), 2)
+    stats["p90"] = round(float(p90), 2)
+    stats["p95"] = round(float(p95), 2)
+    stats["p99"] = round(float(p99), 2)
+    if len(output_tokens) > 0:
+        stats["output_tokens_per_second"] = round(
+            float(output_tokens.sum() / latency.sum()), 2
+        )
+    return stats
+
+
+def record_cost_latency(
+    leaderboard_table, model_name, model_output_data, test_category=None
+):
+    if model_name not in leaderboard_table:
+        leaderboard_table[model_name] = {}
+    leaderboard_table[model_name].setdefault("cost_latency", CostLatencyStats()).add(
+        model_output_data, test_category
+    )
 
 
 def save_eval_results(
@@ -189,19 +316,147 @@ def save_eval_results(
         score_dir / model_name / get_directory_structure_by_category(test_category)
     )
     write_list_of_dicts_to_file(output_file_name, result, output_file_dir)
+    update_score_index(score_dir / model_name, output_file_dir / output_file_name, header)
 
     return accuracy, len(model_result)
 
 
-def get_cost_latency_info(model_name, cost_data, latency_data):
-    cost, mean_latency, std_latency, percentile_95_latency = "N/A", "N/A", "N/A", "N/A"
+#### Helper functions for the score index ####
+
+
+# File (inside each model's score folder) that indexes the headers of its score files
+SCORE_INDEX_FILE_NAME = ".score_index.json"
+
+
+def _get_score_file_signature(score_file_path: Path) -> list[int]:
+    stat = score_file_path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def load_score_index(model_score_dir: Path) -> dict[str, dict]:
+    """
+    Load the score index of a model, which maps the path of each of its score files (relative to `model_score_dir`) to
+    the header of the file and the size and mtime it had when the header was indexed.
+    """
+    try:
+        with open(model_score_dir / SCORE_INDEX_FILE_NAME, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_score_index(model_score_dir: Path, score_index: dict[str, dict]) -> None:
+    index_file_path = model_score_dir / SCORE_INDEX_FILE_NAME
+    temp_file_path = index_file_path.with_name(f"{index_file_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_file_path, "w", encoding="utf-8") as f:
+            json.dump(score_index, f, ensure_ascii=False)
+        os.replace(temp_file_path, index_file_path)
+    except OSError:
+        # The index is an optimization only; the headers are read from the score files without it
+        pass
+
+
+def update_score_index(model_score_dir: Path, score_file_path: Path, header: dict) -> None:
+    score_index = load_score_index(model_score_dir)
+    score_index[Path(score_file_path).relative_to(model_score_dir).as_posix()] = {
+        "signature": _get_score_file_signature(Path(score_file_path)),
+        "header": make_json_serializable(header),
+    }
+    save_score_index(model_score_dir, score_index)
+
+
+def read_score_file_header(score_file_path: Path) -> dict:
+    """
+    Read the header of a score file, ie. its first line, without reading the per-entry results that follow it.
+    """
+    with open(score_file_path, "r", encoding="utf-8") as f:
+        return json.loads(f.readline())
+
+
+#### Helper functions for the incremental evaluation cache ####
+
+
+# Directory (inside each model's score folder) that stores the per-entry verdict cache
+EVAL_CACHE_DIR_NAME = ".eval_cache"
+
+
+def compute_entry_hash(
+    model_result_entry: dict, prompt_entry: dict, possible_answer_entry: dict
+) -> str:
+    """
+    Content hash of everything the verdict for one entry depends on.
+    `possible_answer_entry` is None for relevance/irrelevance entries.
+    """
+    content = json.dumps(
+        [model_result_entry, prompt_entry, possible_answer_entry],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(
+        (get_source_fingerprint() + content).encode("utf-8")
+    ).hexdigest()
+
+
+def get_eval_cache_file_path(score_dir: Path, model_name: str, test_category: str) -> Path:
+    return (
+        score_dir
+        / model_name
+        / EVAL_CACHE_DIR_NAME
+        / f"{VERSION_PREFIX}_{test_category}_eval_cache.json"
+    )
+
+
+def load_eval_cache(score_dir: Path, model_name: str, test_category: str) -> dict[str, dict]:
+    """
+    Load the cached verdicts for a (model, category) pair, as a mapping from entry hash to entry result.
+    """
+    cache_file_path = get_eval_cache_file_path(score_dir, model_name, test_category)
+    if not cache_file_path.exists():
+        return {}
+
+    try:
+        cache_entries = load_file(cache_file_path)
+    except (json.JSONDecodeError, OSError):
+        # A corrupted cache file is not fatal; we just re-check every entry
+        return {}
+    return {entry["hash"]: entry["entry_result"] for entry in cache_entries}
+
+
+def save_eval_cache(
+    score_dir: Path,
+    model_name: str,
+    test_category: str,
+    entry_hashes: list[str],
+    entry_results: list[dict],
+) -> None:
+    """
+    Overwrite the cache for a (model, category) pair with the verdicts of the current run only, so stale entries don't accumulate.
+    """
+    cache_file_path = get_eval_cache_file_path(score_dir, model_name, test_category)
+    write_list_of_dicts_to_file(
+        cache_file_path.name,
+        [
+            {"hash": entry_hash, "entry_result": entry_result}
+            for entry_hash, entry_result in zip(entry_hashes, entry_results)
+        ],
+        subdir=cache_file_path.parent,
+    )
+
+
+def get_cost_latency_info(model_name, cost_latency_stats: CostLatencyStats):
+    cost = "N/A"
     model_config = MODEL_CONFIG_MAPPING[model_name]
+    input_tokens = cost_latency_stats.input_tokens
+    output_tokens = cost_latency_stats.output_tokens
+    latency = cost_latency_stats.latency
 
     # For API models, we use the input and output token counts to calculate the cost
     if model_config.input_price is not None and model_config.output_price is not None:
-        if len(cost_data["input_data"]) > 0 and len(cost_data["output_data"]) > 0:
-            total_input_tokens = sum(cost_data["input_data"])
-            total_output_tokens = sum(cost_data["output_data"])
+        if len(input_tokens) > 0 and len(output_tokens) > 0:
+            total_input_tokens = float(input_tokens.sum())
+            total_output_tokens = float(output_tokens.sum())
             # price is in USD per million tokens
             cost = (
                 total_input_tokens * model_config.input_price / 1000000
@@ -210,8 +465,8 @@ def get_cost_latency_info(model_name, cost_data, latency_data):
             cost = round(cost, 2)
 
     # For local-hosted models, we calculate the total GPU cost by summing all latencies and multiplying by the hourly GPU price.
-    elif len(latency_data["data"]) > 0:
-        total_latency_seconds = sum(latency_data["data"])
+    elif len(latency) > 0:
+        total_latency_seconds = float(latency.sum())
         total_latency_hours = total_latency_seconds / 3600
 
         # Divide by 100 since we are doing 100x parallel inference; this is an approximation to the GPU up-time.
@@ -219,15 +474,39 @@ def get_cost_latency_info(model_name, cost_data, latency_data):
         cost = round(cost, 2)
 
     # Calculate latency statistics for ALL models (both API and local)
-    if len(latency_data["data"]) != 0:
-        mean_latency = statistics.mean(latency_data["data"])
-        std_latency = statistics.stdev(latency_data["data"])
-        percentile_95_latency = np.percentile(latency_data["data"], 95)
-        mean_latency = round(mean_latency, 2)
-        std_latency = round(std_latency, 2)
-        percentile_95_latency = round(percentile_95_latency, 2)
+    latency_stats = get_latency_stats(latency, output_tokens)
+
+    return cost, latency_stats["mean"], latency_stats["std"], latency_stats["p95"]
 
-    return cost, mean_latency, std_latency, percentile_95_latency
+
+def write_latency_csv_file(leaderboard_table, file_path) -> None:
+    """
+    Write the latency statistics of each model, overall, per test category and per multi-turn turn.
+    """
+    data = [COLUMNS_LATENCY]
+    for model_name, value in sorted(leaderboard_table.items()):
+        if "cost_latency" not in value:
+            continue
+        display_name = MODEL_CONFIG_MAPPING[model_name.replace("_", "/")].display_name
+        for scope, latency, output_tokens in value["cost_latency"].iter_scopes():
+            stats = get_latency_stats(latency, output_tokens)
+            data.append(
+                [
+                    display_name,
+                    scope,
+                    stats["count"],
+                    stats["mean"],
+                    stats["std"],
+                    stats["p50"],
+                    stats["p90"],
+                    stats["p95"],
+                    stats["p99"],
+                    stats["output_tokens_per_second"],
+                ]
+            )
+
+    with open(file_path, "w") as f:
+        f.write("\n".join(",".join(str(item) for item in row) for row in data))
 
 
 def get_category_score(score_dict: dict, test_category: str) -> dict:
@@ -236,11 +515,7 @@ def get_category_score(score_dict: dict, test_category: str) -> dict:
         score["display_accuracy"] = score["accuracy"]
         return score
     else:
-        num_entry = len(
-            load_dataset_entry(
-                test_category, include_prereq=False, include_language_specific_hint=False
-            )
-        )
+        num_entry = get_dataset_entry_count(test_category)
         # If a category is not being evaluated, it needs to be distinguished from the situation where the evaluation score is 0
         # It will still be considered 0 in the overall score calculation though
         # We use `display_accuracy` to special handle
@@ -300,10 +575,8 @@ def generate_leaderboard_csv(leaderboard_table, output_path):
         model_name_escaped = model_name.replace("_", "/")
         model_config = MODEL_CONFIG_MAPPING[model_name_escaped]
 
-        cost_data = value.get("cost", {"input_data": [], "output_data": []})
-        latency_data = value.get("latency", {"data": []})
         cost, latency_mean, latency_std, percentile_95_latency = get_cost_latency_info(
-            model_name_escaped, cost_data, latency_data
+            model_name_escaped, value.get("cost_latency", CostLatencyStats())
         )
 
         # Non-Live Score
@@ -613,8 +886,12 @@ def generate_leaderboard_csv(leaderboard_table, output_path):
         no_conversion_numeric_column_index=[4, 5, 6, 7, 32, 33],
     )
 
+    # Write Latency Statistics File
+    write_latency_csv_file(leaderboard_table, output_path / "data_latency.csv")
+
     wandb_project = os.getenv("WANDB_BFCL_PROJECT")
     if wandb_project and wandb_project != "ENTITY:PROJECT":
+        import pandas as pd
         import wandb
 
         # Initialize WandB run
@@ -685,12 +962,27 @@ def update_leaderboard_table_with_local_score_file(
     # Traverse each subdirectory
     for subdir in subdirs:
         model_name = subdir.relative_to(score_path).name
+        # The headers of the score files that didn't change since they were indexed are taken from the score index,
+        # the other ones are read from the files and indexed
+        score_index = load_score_index(subdir)
+        updated_score_index = {}
         # Find and process all score JSON files recursively in the subdirectory
         pattern = f"{VERSION_PREFIX}_*_score.json"
         for model_score_json in subdir.rglob(pattern):
-            metadata = load_file(model_score_json)[0]
+            index_key = model_score_json.relative_to(subdir).as_posix()
+            signature = _get_score_file_signature(model_score_json)
+            indexed = score_index.get(index_key)
+            if indexed is not None and indexed["signature"] == signature:
+                metadata = indexed["header"]
+            else:
+                metadata = read_score_file_header(model_score_json)
+            updated_score_index[index_key] = {"signature": signature, "header": metadata}
+
             test_category = extract_test_category(model_score_json)
             if model_name not in leaderboard_table:
                 leaderboard_table[model_name] = {}
             # Store the full metadata to retain additional statistics (e.g. format sensitivity breakdown)
-            leaderboard_table[model_name][test_category] = metadata
+            leaderboard_table[model_name][test_category] = dict(metadata)
+
+        if updated_score_index != score_index:
+            save_score_index(subdir, updated_score_index)
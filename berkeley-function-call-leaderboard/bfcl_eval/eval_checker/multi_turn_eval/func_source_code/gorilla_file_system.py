@@ -1,4 +1,5 @@
 import datetime
+import itertools
 import subprocess
 from copy import deepcopy
 from typing import Dict, List, Optional, Union
@@ -8,6 +9,94 @@ from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.long_context import
     FILES_TAIL_USED,
     POPULATE_FILE_EXTENSION,
 )
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.state_snapshot import (
+    StateSnapshotMixin,
+    copy_state_value,
+)
+
+# Every change to a file or a directory listing is stamped with the next value of this counter.
+# `_LAST_MUTATION` is the most recent stamp handed out, across all file system instances.
+_MUTATION_COUNTER = itertools.count(1)
+_LAST_MUTATION = 0
+
+
+def _record_mutation() -> int:
+    global _LAST_MUTATION
+    _LAST_MUTATION = next(_MUTATION_COUNTER)
+    return _LAST_MUTATION
+
+
+def _get_picklable_state(node) -> dict:
+    """
+    Return the attributes of a file system object to pickle (or deep-copy), without its caches.
+
+    The caches are tied to mutation stamps, which are only meaningful in the process that handed them out: another
+    process starts counting again, and could hand out a stamp that an unpickled cache still holds.
+    """
+    state = node.__dict__.copy()
+    state.pop("_snapshot_cache", None)
+    state.pop("_content_stats", None)
+    return state
+
+
+# Statistics of a file content that the commands reuse until the content changes, see `File._get_content_stat`
+_CONTENT_STATS = {
+    "lines": lambda content: tuple(content.splitlines()),
+    "words": lambda content: len(content.split()),
+    "size": lambda content: len(content.encode("utf-8")),
+}
+
+
+class DirectoryContents(dict):
+    """
+    The mapping from name to `File`/`Directory` held by a `Directory`.
+
+    It behaves exactly like a dict, but keeps a version stamp that changes whenever an entry is added, replaced or
+    removed, so that snapshots of unchanged directories can be reused.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._version: int = _record_mutation()
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self._version = _record_mutation()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._version = _record_mutation()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._version = _record_mutation()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._version = _record_mutation()
+        return item
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._version = _record_mutation()
+        return value
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self._version = _record_mutation()
+
+    def clear(self) -> None:
+        super().clear()
+        self._version = _record_mutation()
+
+    def copy(self) -> "DirectoryContents":
+        return DirectoryContents(self)
+
+    def __setstate__(self, state: dict) -> None:
+        # The stamp of the pickled copy comes from another process, see `_get_picklable_state`
+        self.__dict__.update(state)
+        self._version = _record_mutation()
 
 
 class File:
@@ -23,6 +112,7 @@ class File:
         self.name: str = name
         self.content: str = content
         self._last_modified: datetime.datetime = datetime.datetime.now()
+        self._version: int = _record_mutation()
 
     def _write(self, new_content: str) -> None:
         """
@@ -33,6 +123,7 @@ class File:
         """
         self.content = new_content
         self._last_modified = datetime.datetime.now()
+        self._version = _record_mutation()
 
     def _read(self) -> str:
         """
@@ -52,6 +143,47 @@ class File:
         """
         self.content += additional_content
         self._last_modified = datetime.datetime.now()
+        self._version = _record_mutation()
+
+    def _get_content_stat(self, stat: str):
+        """
+        Return a statistic of the content: its lines ("lines", as a tuple), its number of words ("words") or its size
+        in bytes ("size"). It is computed on first use and reused until the content changes.
+
+        The cache is tied to the content string itself rather than to `_version`, so it stays valid in a copy of the
+        file and can never outlive the content it was computed from.
+        """
+        cached = getattr(self, "_content_stats", None)
+        if cached is None or cached[0] is not self.content:
+            cached = self._content_stats = (self.content, {})
+        stats = cached[1]
+        if stat not in stats:
+            stats[stat] = _CONTENT_STATS[stat](self.content)
+        return stats[stat]
+
+    def _frozen_copy(self) -> "File":
+        """
+        Return a copy of the file that is not affected by later writes. The copy is reused until the file changes.
+        """
+        cached = getattr(self, "_snapshot_cache", None)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+
+        frozen = File.__new__(File)
+        frozen.name = self.name
+        frozen.content = self.content
+        frozen._last_modified = self._last_modified
+        frozen._version = self._version
+        self._snapshot_cache = (self._version, frozen)
+        return frozen
+
+    def __getstate__(self) -> dict:
+        return _get_picklable_state(self)
+
+    def __setstate__(self, state: dict) -> None:
+        # The stamp of the pickled copy comes from another process, see `_get_picklable_state`
+        self.__dict__.update(state)
+        self._version = _record_mutation()
 
     def __repr__(self):
         return f"<<File: {self.name}, Content: {self.content}>>"
@@ -73,7 +205,7 @@ class Directory:
         """
         self.name: str = name
         self.parent: Optional["Directory"] = parent
-        self.contents: Dict[str, Union["File", "Directory"]] = {}
+        self.contents: Dict[str, Union["File", "Directory"]] = DirectoryContents()
 
     def _add_file(self, file_name: str, content: str = "") -> None:
         """
@@ -127,6 +259,41 @@ class Directory:
         """
         return list(self.contents.keys())
 
+    def _frozen_copy(self) -> "Directory":
+        """
+        Return a copy of the directory tree that is not affected by later changes.
+
+        Unchanged files and sub-directories are shared with the previous copy, so only the parts of the tree that
+        changed since then are copied. The copy keeps a reference to the live parent, which is only used for its name.
+        """
+        frozen_contents = {
+            item_name: item._frozen_copy() for item_name, item in self.contents.items()
+        }
+
+        cached = getattr(self, "_snapshot_cache", None)
+        contents_version = getattr(self.contents, "_version", None)
+        if (
+            cached is not None
+            and contents_version is not None
+            and cached[0] is self.contents
+            and cached[1] == contents_version
+            and all(
+                frozen_item is cached[2].contents[item_name]
+                for item_name, frozen_item in frozen_contents.items()
+            )
+        ):
+            return cached[2]
+
+        frozen = Directory.__new__(Directory)
+        frozen.name = self.name
+        frozen.parent = self.parent
+        frozen.contents = frozen_contents
+        self._snapshot_cache = (self.contents, contents_version, frozen)
+        return frozen
+
+    def __getstate__(self) -> dict:
+        return _get_picklable_state(self)
+
     def __repr__(self):
         return f"<Directory: {self.name}, Parent: {self.parent.name if self.parent else None}, Contents: {self.contents}>"
 
@@ -139,7 +306,7 @@ class Directory:
 DEFAULT_STATE = {"root": Directory("/", None)}
 
 
-class GorillaFileSystem:
+class GorillaFileSystem(StateSnapshotMixin):
 
     def __init__(self) -> None:
         """
@@ -154,6 +321,76 @@ class GorillaFileSystem:
             return False
         return self.root == other.root
 
+    def __getstate__(self) -> dict:
+        return _get_picklable_state(self)
+
+    def _snapshot(self) -> dict:
+        """
+        Return a detached copy of the public state, sharing the unchanged parts of the tree with the previous snapshot.
+        If no file or directory has been modified since then, the previous copy of the tree is returned as-is.
+        """
+        last_mutation = _LAST_MUTATION
+        cached = getattr(self, "_snapshot_cache", None)
+        if cached is not None and cached[0] == last_mutation and cached[1] is self.root:
+            frozen_root = cached[2]
+        else:
+            frozen_root = self.root._frozen_copy()
+            self._snapshot_cache = (last_mutation, self.root, frozen_root)
+
+        return {
+            key: frozen_root if key == "root" else copy_state_value(value)
+            for key, value in vars(self).items()
+            if not key.startswith("_")
+        }
+
+    def _fork(self) -> "GorillaFileSystem":
+        """
+        Return an independent file system with the same tree and current directory.
+        File contents are immutable strings, so they are shared rather than copied.
+        """
+        memo = {}
+        forked = object.__new__(GorillaFileSystem)
+        for key, value in vars(self).items():
+            if key == "_snapshot_cache":
+                continue
+            if isinstance(value, (File, Directory)):
+                forked.__dict__[key] = self._copy_node(value, memo)
+            else:
+                forked.__dict__[key] = copy_state_value(value)
+        return forked
+
+    def _copy_node(self, node: Union[File, Directory], memo: dict) -> Union[File, Directory]:
+        """
+        Copy a file or directory, preserving any object shared between different places of the tree like `deepcopy` does.
+        """
+        if id(node) in memo:
+            return memo[id(node)]
+
+        if isinstance(node, File):
+            copied_file = File.__new__(File)
+            copied_file.name = node.name
+            copied_file.content = node.content
+            copied_file._last_modified = node._last_modified
+            copied_file._version = _record_mutation()
+            memo[id(node)] = copied_file
+            return copied_file
+
+        copied_dir = Directory.__new__(Directory)
+        memo[id(node)] = copied_dir
+        copied_dir.name = node.name
+        copied_dir.parent = (
+            self._copy_node(node.parent, memo) if node.parent is not None else None
+        )
+        if id(node.contents) in memo:
+            copied_dir.contents = memo[id(node.contents)]
+        else:
+            copied_contents = DirectoryContents()
+            memo[id(node.contents)] = copied_contents
+            for item_name, item in node.contents.items():
+                copied_contents[item_name] = self._copy_node(item, memo)
+            copied_dir.contents = copied_contents
+        return copied_dir
+
     def _load_scenario(self, scenario: dict, long_context: bool = False) -> None:
         """
         Load a scenario into the file system.
@@ -464,18 +701,16 @@ class GorillaFileSystem:
         if file_name in self._current_dir.contents:
             file = self._current_dir._get_item(file_name)
             if isinstance(file, File):
-                content = file._read()
-
                 if mode == "l":
-                    line_count = len(content.splitlines())
+                    line_count = len(file._get_content_stat("lines"))
                     return {"count": line_count, "type": "lines"}
 
                 elif mode == "w":
-                    word_count = len(content.split())
+                    word_count = file._get_content_stat("words")
                     return {"count": word_count, "type": "words"}
 
                 elif mode == "c":
-                    char_count = len(content)
+                    char_count = len(file._read())
                     return {"count": char_count, "type": "characters"}
 
         return {"error": f"wc: {file_name}: No such file or directory"}
@@ -493,9 +728,7 @@ class GorillaFileSystem:
         if file_name in self._current_dir.contents:
             file = self._current_dir._get_item(file_name)
             if isinstance(file, File):
-                content = file._read()
-
-                sorted_content = "\n".join(sorted(content.splitlines()))
+                sorted_content = "\n".join(sorted(file._get_content_stat("lines")))
 
                 return {"sorted_content": sorted_content}
 
@@ -515,9 +748,9 @@ class GorillaFileSystem:
         if file_name in self._current_dir.contents:
             file = self._current_dir._get_item(file_name)
             if isinstance(file, File):
-                content = file._read()
-
-                matching_lines = [line for line in content.splitlines() if pattern in line]
+                matching_lines = [
+                    line for line in file._get_content_stat("lines") if pattern in line
+                ]
 
                 return {"matching_lines": matching_lines}
 
@@ -536,7 +769,7 @@ class GorillaFileSystem:
 
         def get_size(item: Union[File, Directory]) -> int:
             if isinstance(item, File):
-                return len(item._read().encode("utf-8"))
+                return item._get_content_stat("size")
             elif isinstance(item, Directory):
                 return sum(get_size(child) for child in item.contents.values())
             return 0
@@ -574,7 +807,7 @@ class GorillaFileSystem:
         if file_name in self._current_dir.contents:
             file = self._current_dir._get_item(file_name)
             if isinstance(file, File):
-                content = file._read().splitlines()
+                content = file._get_content_stat("lines")
 
                 if lines > len(content):
                     lines = len(content)
@@ -603,8 +836,8 @@ class GorillaFileSystem:
             file2 = self._current_dir._get_item(file_name2)
 
             if isinstance(file1, File) and isinstance(file2, File):
-                content1 = file1._read().splitlines()
-                content2 = file2._read().splitlines()
+                content1 = file1._get_content_stat("lines")
+                content2 = file2._get_content_stat("lines")
 
                 diff_lines = [
                     f"- {line1}\n+ {line2}"
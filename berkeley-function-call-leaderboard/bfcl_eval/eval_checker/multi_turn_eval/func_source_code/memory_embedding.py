@@ -0,0 +1,349 @@
+import hashlib
+import os
+import struct
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+from bfcl_eval.constants.eval_config import EMBEDDING_CACHE_PATH
+from bfcl_eval.utils import _get_file_lock
+
+# Note: `sentence_transformers` must be imported before `faiss`, see `memory_vector.py`
+from sentence_transformers import SentenceTransformer
+
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+
+# Header of the cache file: magic, format version, embedding dimension (padded to 16 bytes)
+_CACHE_HEADER = struct.Struct("<8sII")
+_CACHE_MAGIC = b"BFCLEMB\0"
+_CACHE_VERSION = 1
+_CACHE_HEADER_SIZE = 16
+_KEY_SIZE = 16
+# Number of embeddings kept in memory by each `EmbeddingService`, in least recently used order (about 50 MB for the
+# 384-dimensional embeddings of the default model); the others are read back from the disk cache
+_MEMORY_CACHE_MAX_ENTRIES = 32768
+
+
+def _hash_text(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=_KEY_SIZE).digest()
+
+
+class EmbeddingCache:
+    """
+    Persistent text -> embedding cache, shared by all the processes using the same file.
+
+    The file is a fixed-size header followed by fixed-size records (hash of the text, float32 vector). It is only ever
+    appended to, under a cross-process file lock, and is read through a memory map; the hash -> row index is kept in
+    memory and extended with the records appended since the last read, including the ones written by other processes.
+    A record cut short by an interrupted write is ignored.
+    """
+
+    def __init__(self, path: Path, dimension: Optional[int] = None) -> None:
+        self.path = Path(path)
+        self.dimension = dimension
+        self._dtype = None
+        self._vectors = None
+        self._index: dict[bytes, int] = {}
+        self._num_records = 0
+        self._size = 0
+        self._lock = threading.Lock()
+        self._read_header()
+
+    def _read_header(self) -> None:
+        try:
+            with open(self.path, "rb") as f:
+                header = f.read(_CACHE_HEADER.size)
+        except FileNotFoundError:
+            return
+        if len(header) < _CACHE_HEADER.size:
+            return
+        magic, version, dimension = _CACHE_HEADER.unpack(header)
+        if magic != _CACHE_MAGIC or version != _CACHE_VERSION:
+            return
+        if self.dimension is not None and self.dimension != dimension:
+            return
+        self._set_dimension(dimension)
+
+    def _set_dimension(self, dimension: int) -> None:
+        self.dimension = dimension
+        self._dtype = np.dtype([("key", f"S{_KEY_SIZE}"), ("vector", "<f4", (dimension,))])
+
+    def _refresh(self) -> None:
+        """
+        Map the records appended to the file since the last call. Must be called with `self._lock` held.
+        """
+        if self._dtype is None:
+            return
+        try:
+            file_size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            return
+        if file_size == self._size:
+            return
+        num_records = (file_size - _CACHE_HEADER_SIZE) // self._dtype.itemsize
+        if num_records <= self._num_records:
+            return
+        records = np.memmap(
+            self.path,
+            dtype=self._dtype,
+            mode="r",
+            offset=_CACHE_HEADER_SIZE,
+            shape=(num_records,),
+        )
+        for row, key in enumerate(
+            records["key"][self._num_records :].tolist(), self._num_records
+        ):
+            self._index.setdefault(key, row)
+        self._vectors = records["vector"]
+        self._num_records = num_records
+        self._size = file_size
+
+    def get(self, texts: list[str]) -> tuple[np.ndarray, list[int]]:
+        """
+        Look up the embeddings of `texts`.
+
+        Return the matrix of embeddings (the rows of the missing texts are left as zeros) and the positions of the
+        texts that are not cached.
+        """
+        keys = [_hash_text(text) for text in texts]
+        with self._lock:
+            self._refresh()
+            if self._dtype is None:
+                return np.zeros((len(texts), 0), dtype=np.float32), list(range(len(texts)))
+            rows = [self._index.get(key) for key in keys]
+            vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+            hits = [i for i, row in enumerate(rows) if row is not None]
+            if hits:
+                vectors[hits] = self._vectors[[rows[i] for i in hits]]
+        missing = [i for i, row in enumerate(rows) if row is None]
+        return vectors, missing
+
+    def put(self, texts: list[str], vectors: np.ndarray) -> None:
+        """
+        Append the embeddings of `texts` that are not cached yet, by this or another process.
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        with self._lock:
+            if self.dimension is not None and vectors.shape[1] != self.dimension:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with _get_file_lock(str(self.path)):
+                if self._dtype is None:
+                    # The file may have been created by another process in the meantime
+                    self._read_header()
+                if self._dtype is None:
+                    # Missing, or written by another version: start a new file
+                    self._set_dimension(vectors.shape[1])
+                    with open(self.path, "wb") as f:
+                        f.write(
+                            _CACHE_HEADER.pack(
+                                _CACHE_MAGIC, _CACHE_VERSION, self.dimension
+                            ).ljust(_CACHE_HEADER_SIZE, b"\0")
+                        )
+                self._refresh()
+
+                records = np.zeros(len(texts), dtype=self._dtype)
+                num_new = 0
+                seen = set()
+                for text, vector in zip(texts, vectors):
+                    key = _hash_text(text)
+                    if key in self._index or key in seen:
+                        continue
+                    seen.add(key)
+                    records[num_new] = (key, vector)
+                    num_new += 1
+                if num_new == 0:
+                    return
+
+                with open(self.path, "r+b") as f:
+                    # Write after the last complete record, overwriting one left incomplete by an interrupted write
+                    f.seek(_CACHE_HEADER_SIZE + self._num_records * self._dtype.itemsize)
+                    f.write(records[:num_new].tobytes())
+                    f.truncate()
+                self._refresh()
+
+
+class _EncodeRequest:
+    def __init__(self, texts: list[str]) -> None:
+        self.texts = texts
+        self.result: Optional[np.ndarray] = None
+        self.error: Optional[BaseException] = None
+        self.done = threading.Event()
+
+
+class MicroBatcher:
+    """
+    Coalesce the `encode` calls made concurrently by several threads into batched calls.
+
+    The first caller becomes the leader and encodes everything pending; the calls made while the encoder is busy queue
+    up and are encoded together by the leader in its next batch, while their callers wait for the result. A lone
+    caller is encoded right away, so batching adds no latency.
+    """
+
+    def __init__(
+        self, encode_fn: Callable[[list[str]], np.ndarray], max_batch_size: int = 128
+    ) -> None:
+        self.encode_fn = encode_fn
+        self.max_batch_size = max_batch_size
+        self._pending: list[_EncodeRequest] = []
+        self._has_leader = False
+        self._lock = threading.Lock()
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        request = _EncodeRequest(texts)
+        with self._lock:
+            self._pending.append(request)
+            is_leader = not self._has_leader
+            self._has_leader = True
+
+        if is_leader:
+            self._lead()
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _lead(self) -> None:
+        while True:
+            with self._lock:
+                batch, num_texts = [], 0
+                while self._pending and (
+                    not batch or num_texts + len(self._pending[0].texts) <= self.max_batch_size
+                ):
+                    request = self._pending.pop(0)
+                    batch.append(request)
+                    num_texts += len(request.texts)
+                if not batch:
+                    self._has_leader = False
+                    return
+
+            try:
+                vectors = self.encode_fn([text for request in batch for text in request.texts])
+            except BaseException as e:
+                for request in batch:
+                    request.error = e
+                    request.done.set()
+                continue
+
+            start = 0
+            for request in batch:
+                request.result = vectors[start : start + len(request.texts)]
+                start += len(request.texts)
+                request.done.set()
+
+
+class EmbeddingService:
+    """
+    Embeds texts with a SentenceTransformer model, for the vector memory backend.
+
+    - The model is only loaded on the first text that is not cached, not when the backend module is imported.
+    - Embeddings are cached on disk (see `EmbeddingCache`), so the texts of a memory snapshot, which are reloaded by
+      every entry that depends on it, are only encoded once across runs. The most recently used ones are also kept in
+      memory.
+    - Concurrent calls from the inference threads are micro-batched into one `encode` call (see `MicroBatcher`).
+    """
+
+    def __init__(self, model_name: str, cache_dir: Optional[Path] = EMBEDDING_CACHE_PATH) -> None:
+        self.model_name = model_name
+        self._encoder = None
+        self._encoder_lock = threading.Lock()
+        self._cache = (
+            EmbeddingCache(Path(cache_dir) / f"{model_name.replace('/', '_')}.bin")
+            if cache_dir is not None
+            else None
+        )
+        # Text -> embedding, in least recently used order; shared by the inference threads
+        self._memory_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._memory_cache_lock = threading.Lock()
+        self._batcher = MicroBatcher(self._encode)
+
+    @property
+    def encoder(self) -> SentenceTransformer:
+        if self._encoder is None:
+            with self._encoder_lock:
+                if self._encoder is None:
+                    self._encoder = SentenceTransformer(self.model_name, device="cpu")
+        return self._encoder
+
+    @property
+    def dimension(self) -> int:
+        if self._cache is not None and self._cache.dimension is not None:
+            return self._cache.dimension
+        return self.encoder.get_sentence_embedding_dimension()
+
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        vectors = self.encoder.encode(texts, normalize_embeddings=True)
+        return np.asarray(vectors, dtype=np.float32)
+
+    def _get_from_memory(self, texts: list[str]) -> list[Optional[np.ndarray]]:
+        with self._memory_cache_lock:
+            vectors = []
+            for text in texts:
+                vector = self._memory_cache.get(text)
+                if vector is not None:
+                    self._memory_cache.move_to_end(text)
+                vectors.append(vector)
+            return vectors
+
+    def _add_to_memory(self, texts: list[str], vectors) -> None:
+        with self._memory_cache_lock:
+            for text, vector in zip(texts, vectors):
+                self._memory_cache[text] = vector
+                self._memory_cache.move_to_end(text)
+            while len(self._memory_cache) > _MEMORY_CACHE_MAX_ENTRIES:
+                self._memory_cache.popitem(last=False)
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """
+        Return the L2-normalised embeddings of `texts`, as a float32 matrix with one row per text.
+        """
+        vectors = self._get_from_memory(texts)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+
+        if missing and self._cache is not None:
+            cached_vectors, still_missing = self._cache.get([texts[i] for i in missing])
+            still_missing_positions = set(still_missing)
+            found = [
+                position
+                for position in range(len(missing))
+                if position not in still_missing_positions
+            ]
+            for position in found:
+                vectors[missing[position]] = cached_vectors[position]
+            self._add_to_memory(
+                [texts[missing[position]] for position in found],
+                [cached_vectors[position] for position in found],
+            )
+            missing = [missing[position] for position in still_missing]
+
+        if missing:
+            # The same text can appear more than once, eg. in a snapshot
+            missing_texts = list(dict.fromkeys(texts[i] for i in missing))
+            encoded = self._batcher.encode(missing_texts)
+            if self._cache is not None:
+                self._cache.put(missing_texts, encoded)
+            self._add_to_memory(missing_texts, encoded)
+            encoded_by_text = dict(zip(missing_texts, encoded))
+            for i in missing:
+                vectors[i] = encoded_by_text[texts[i]]
+
+        if not vectors:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        return np.stack(vectors)
+
+
+_EMBEDDING_SERVICES: dict[str, EmbeddingService] = {}
+_EMBEDDING_SERVICES_LOCK = threading.Lock()
+
+
+def get_embedding_service(model_name: str = EMBEDDING_MODEL_NAME) -> EmbeddingService:
+    """
+    Return the embedding service of `model_name`, shared by all the vector stores of the process.
+    """
+    with _EMBEDDING_SERVICES_LOCK:
+        service = _EMBEDDING_SERVICES.get(model_name)
+        if service is None:
+            service = _EMBEDDING_SERVICES[model_name] = EmbeddingService(model_name)
+        return service
@@ -1,12 +1,13 @@
+import heapq
 import json
+import math
 import re
 from copy import deepcopy
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.memory_api_metaclass import (
     MemoryAPI,
 )
-from rank_bm25 import BM25Plus
 
 # https://lilianweng.github.io/posts/2023-06-23-agent/#component-two-memory
 MAX_CORE_MEMORY_SIZE = 7
@@ -14,6 +15,115 @@ MAX_CORE_MEMORY_ENTRY_LENGTH = 300
 MAX_ARCHIVAL_MEMORY_SIZE = 50
 MAX_ARCHIVAL_MEMORY_ENTRY_LENGTH = 2000
 
+# BM25+ parameters, the defaults of `rank_bm25.BM25Plus`
+BM25_K1 = 1.5
+BM25_B = 0.75
+BM25_DELTA = 1
+
+
+class KeySearchIndex:
+    """
+    Inverted index of the keys of a memory, for the BM25+ key search.
+
+    It is updated as keys are added and removed, instead of building a `BM25Plus` over all the keys on every search,
+    and gives the same scores (down to the last bit, as the terms are summed in the same order) and the same ranking:
+    by decreasing score, ties in insertion order.
+    """
+
+    def __init__(self, keys: Iterable[str] = ()):
+        # key -> (insertion position, term frequencies, number of terms); in insertion order
+        self._documents: dict[str, tuple[int, dict[str, int], int]] = {}
+        # term -> keys containing the term
+        self._postings: dict[str, set[str]] = {}
+        self._total_length = 0
+        self._next_position = 0
+        for key in keys:
+            self.add(key)
+
+    @staticmethod
+    def _tokenize(text: str) -> list[str]:
+        return text.replace("_", " ").lower().split()
+
+    def add(self, key: str) -> None:
+        terms = self._tokenize(key)
+        term_frequencies = {}
+        for term in terms:
+            term_frequencies[term] = term_frequencies.get(term, 0) + 1
+            self._postings.setdefault(term, set()).add(key)
+        self._documents[key] = (self._next_position, term_frequencies, len(terms))
+        self._next_position += 1
+        self._total_length += len(terms)
+
+    def remove(self, key: str) -> None:
+        _, term_frequencies, length = self._documents.pop(key)
+        for term in term_frequencies:
+            postings = self._postings[term]
+            postings.discard(key)
+            if not postings:
+                del self._postings[term]
+        self._total_length -= length
+
+    def search(self, query: str, k: int = 5) -> list[tuple[float, str]]:
+        """
+        Return the `k` keys with the highest BM25+ score for `query`, as a list of (score, key) tuples.
+        """
+        if not self._documents:
+            # Same outcome as building a `BM25Plus` on an empty corpus
+            raise ZeroDivisionError("division by zero")
+
+        corpus_size = len(self._documents)
+        avgdl = self._total_length / corpus_size
+        # Terms missing from every key add nothing to the scores
+        query_idfs = [
+            (term, math.log((corpus_size + 1) / len(self._postings[term])))
+            for term in self._tokenize(query)
+            if term in self._postings
+        ]
+
+        # BM25+ gives `idf * delta` for a query term to the keys without it, so the keys that contain none of the query
+        # terms all share the same score
+        base_score = 0.0
+        for _, idf in query_idfs:
+            base_score += idf * BM25_DELTA
+        matched_keys = set()
+        for term, _ in query_idfs:
+            matched_keys |= self._postings[term]
+
+        def score(key: str) -> float:
+            if key not in matched_keys:
+                return base_score
+            _, term_frequencies, length = self._documents[key]
+            result = 0.0
+            for term, idf in query_idfs:
+                tf = term_frequencies.get(term, 0)
+                result += idf * (
+                    BM25_DELTA
+                    + (tf * (BM25_K1 + 1))
+                    / (BM25_K1 * (1 - BM25_B + BM25_B * length / avgdl) + tf)
+                )
+            return result
+
+        if not isinstance(k, int) or k < 0:
+            # Keep the slicing semantics of the full ranking, eg. for a negative `k`
+            ranked_results = sorted(
+                ((score(key), key) for key in self._documents),
+                key=lambda x: x[0],
+                reverse=True,
+            )
+            return ranked_results[:k]
+
+        # Only the first `k` unmatched keys can make it to the top `k`
+        candidates = [(score(key), self._documents[key][0], key) for key in matched_keys]
+        num_unmatched = 0
+        for key, (position, _, _) in self._documents.items():
+            if num_unmatched >= k:
+                break
+            if key not in matched_keys:
+                candidates.append((base_score, position, key))
+                num_unmatched += 1
+        top_k = heapq.nsmallest(k, candidates, key=lambda x: (-x[0], x[1]))
+        return [(key_score, key) for key_score, _, key in top_k]
+
 
 class MemoryAPI_kv(MemoryAPI):
     """
@@ -23,6 +133,9 @@ class MemoryAPI_kv(MemoryAPI):
     def __init__(self):
         self.core_memory = {}
         self.archival_memory = {}
+        # Indexes of the keys of each memory for the key search; kept in sync with the memory on every change of keys
+        self._core_memory_index = KeySearchIndex()
+        self._archival_memory_index = KeySearchIndex()
         self._api_description = """This tool belongs to the memory suite, which provides APIs to interact with a key-value based memory system."""
         self.snapshot_folder = None
 
@@ -34,6 +147,8 @@ class MemoryAPI_kv(MemoryAPI):
         if memory_data:
             self.core_memory = deepcopy(memory_data["core_memory"])
             self.archival_memory = deepcopy(memory_data["archival_memory"])
+            self._core_memory_index = KeySearchIndex(self.core_memory)
+            self._archival_memory_index = KeySearchIndex(self.archival_memory)
 
     def _flush_memory_to_local_file(self):
         """
@@ -67,26 +182,6 @@ class MemoryAPI_kv(MemoryAPI):
             return "There is no content in the core memory at this point."
         return json.dumps(self.core_memory, indent=4)
 
-    @staticmethod
-    def _similarity_search(query: str, corpus: list[str], k: int = 5):
-        """
-        Search for the most similar text in the corpus to the query using BM25+ algorithm.
-
-        Args:
-            query (str): The query text to search for.
-            corpus (list[str]): A list of text strings to search in.
-            k (int): The number of results to return.
-
-        Returns:
-            ranked_results (list[tuple[float, str]]): A list of tuples containing the BM25+ score and the text string.
-        """
-        tokenized_corpus = [text.replace("_", " ").lower().split() for text in corpus]
-        bm25 = BM25Plus(tokenized_corpus)
-        tokenized_query = query.replace("_", " ").lower().split()
-        scores = bm25.get_scores(tokenized_query)
-        ranked_results = sorted(zip(scores, corpus), key=lambda x: x[0], reverse=True)
-        return {"ranked_results": ranked_results[:k]}
-
     @staticmethod
     def _is_valid_key_format(s):
         """
@@ -120,6 +215,7 @@ class MemoryAPI_kv(MemoryAPI):
             return {"error": "Key name must be unique."}
 
         self.core_memory[key] = value
+        self._core_memory_index.add(key)
         return {"status": "Key-value pair added."}
 
     def core_memory_remove(self, key: str) -> Dict[str, str]:
@@ -134,6 +230,7 @@ class MemoryAPI_kv(MemoryAPI):
         """
         if key in self.core_memory:
             del self.core_memory[key]
+            self._core_memory_index.remove(key)
             return {"status": "Key removed."}
         else:
             return {"error": "Key not found."}
@@ -168,6 +265,7 @@ class MemoryAPI_kv(MemoryAPI):
             status (str): Status of the operation.
         """
         self.core_memory = {}
+        self._core_memory_index = KeySearchIndex()
         return {"status": "Short term memory cleared."}
 
     def core_memory_retrieve(self, key: str) -> Dict[str, str]:
@@ -207,8 +305,7 @@ class MemoryAPI_kv(MemoryAPI):
         Returns:
             ranked_results (List[Tuple[float, str]]): A list of tuples containing the BM25+ score and the key.
         """
-        keys = deepcopy(list(self.core_memory.keys()))
-        return self._similarity_search(query, keys, k)
+        return {"ranked_results": self._core_memory_index.search(query, k)}
 
     def core_memory_retrieve_all(self) -> Dict[str, str]:
         """
@@ -244,6 +341,7 @@ class MemoryAPI_kv(MemoryAPI):
             return {"error": "Key name must be unique."}
 
         self.archival_memory[key] = value
+        self._archival_memory_index.add(key)
         return {"status": "Key added."}
 
     def archival_memory_remove(self, key: str) -> Dict[str, str]:
@@ -258,6 +356,7 @@ class MemoryAPI_kv(MemoryAPI):
         """
         if key in self.archival_memory:
             del self.archival_memory[key]
+            self._archival_memory_index.remove(key)
             return {"status": "Key removed."}
         else:
             return {"error": "Key not found."}
@@ -292,6 +391,7 @@ class MemoryAPI_kv(MemoryAPI):
             status (str): Status of the operation.
         """
         self.archival_memory = {}
+        self._archival_memory_index = KeySearchIndex()
         return {"status": "Long term memory cleared."}
 
     def archival_memory_retrieve(self, key: str) -> Dict[str, str]:
@@ -330,5 +430,4 @@ class MemoryAPI_kv(MemoryAPI):
         Returns:
             ranked_results (List[Tuple[float, str]]): A list of tuples containing the BM25+ score and the key.
         """
-        keys = deepcopy(list(self.archival_memory.keys()))
-        return self._similarity_search(query, keys, k)
+        return {"ranked_results": self._archival_memory_index.search(query, k)}
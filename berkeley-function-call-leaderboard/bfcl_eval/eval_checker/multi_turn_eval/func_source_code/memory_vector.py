@@ -10,7 +10,10 @@ from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.memory_api_metaclas
 # Note: This import order is necessary to avoid segfault issue due to FAISS and PyTorch each load a different OpenMP runtime
 # See https://github.com/pytorch/pytorch/issues/149201#issuecomment-2725586827
 # TODO: Find a common OpenMP runtime to avoid this issue
-from sentence_transformers import SentenceTransformer
+# `memory_embedding` imports `sentence_transformers`, so it must come before `faiss`
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.memory_embedding import (
+    get_embedding_service,
+)
 import faiss
 
 # isort: on
@@ -22,11 +25,6 @@ MAX_ARCHIVAL_MEMORY_SIZE = 50
 MAX_ARCHIVAL_MEMORY_ENTRY_LENGTH = 2000
 
 
-# Use a global SentenceTransformer model for all vector stores.
-ENCODER = SentenceTransformer("all-MiniLM-L6-v2", device="cpu")
-ENCODER_DIM = ENCODER.get_sentence_embedding_dimension()
-
-
 class MemoryAPI_vector(MemoryAPI):
     """
     A class that provides APIs to manage short-term and long-term memory data using vector embeddings.
@@ -241,7 +239,7 @@ class VectorStore:
         self.max_entry_length = max_entry_length
 
         # Cosine similarity via inner product on L2‑normalised vectors.
-        index_flat = faiss.IndexFlatIP(ENCODER_DIM)
+        index_flat = faiss.IndexFlatIP(get_embedding_service().dimension)
         self._index = faiss.IndexIDMap(index_flat)
 
         self._store: dict[int, str] = {}
@@ -250,10 +248,8 @@ class VectorStore:
 
     def _embed(self, text: str | List[str]) -> np.ndarray:
         """Return an L2-normalised NumPy array suitable for FAISS."""
-        vecs = ENCODER.encode(
-            text if isinstance(text, list) else [text], normalize_embeddings=True
-        )
-        return np.asarray(vecs, dtype=np.float32)
+        # All the vector stores of the process share one embedding service (lazily loaded model, cache, batching)
+        return get_embedding_service().embed(text if isinstance(text, list) else [text])
 
     def add(self, text: str) -> dict[str, str]:
         if len(text) > self.max_entry_length:
@@ -362,7 +358,7 @@ class VectorStore:
         self._index.reset()
 
         if self._store:
-            # Re-embed every stored text in one batch
+            # Embed every stored text in one batch; the texts of a snapshot are usually already cached
             # To keep IDs aligned with vectors, sort by ID
             ids = np.array(sorted(self._store.keys()), dtype=np.int64)
             texts = [self._store[i] for i in ids]
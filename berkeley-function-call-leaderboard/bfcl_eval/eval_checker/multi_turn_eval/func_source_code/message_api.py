@@ -2,6 +2,10 @@ import random
 from copy import deepcopy
 from typing import Dict, List, Optional, Union
 
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.state_snapshot import (
+    StateSnapshotMixin,
+)
+
 DEFAULT_STATE = {
     "generated_ids": set(),
     "user_count": 4,
@@ -27,7 +31,7 @@ DEFAULT_STATE = {
 }
 
 
-class MessageAPI:
+class MessageAPI(StateSnapshotMixin):
     """
     A class representing a Message API for managing user interactions in a workspace.
 
@@ -1,6 +1,10 @@
 from copy import deepcopy
 from typing import Dict, List, Optional, Union
 
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.state_snapshot import (
+    StateSnapshotMixin,
+)
+
 DEFAULT_STATE = {
     "username": "john",
     "password": "john123",
@@ -13,7 +17,7 @@ DEFAULT_STATE = {
 }
 
 
-class TwitterAPI:
+class TwitterAPI(StateSnapshotMixin):
     def __init__(self):
         self.username: str
         self.password: str
@@ -0,0 +1,57 @@
+import random
+from copy import copy, deepcopy
+
+# Values of these types are immutable, so they can be shared between copies as-is
+_ATOMIC_TYPES = (str, int, float, bool, type(None), bytes)
+
+
+def copy_state_value(value):
+    """
+    Copy a piece of backend state.
+
+    The backends keep their state in plain JSON-like containers (dict, list, tuple, set of scalars), for which this is
+    several times faster than `copy.deepcopy`. Strings and other immutable scalars are shared rather than copied.
+    A `random.Random` is copied through its state, an immutable tuple that `copy.deepcopy` would copy item by item.
+    Anything else falls back to `copy.deepcopy`.
+    """
+    value_type = type(value)
+    if value_type in _ATOMIC_TYPES:
+        return value
+    if value_type is dict:
+        return {key: copy_state_value(item) for key, item in value.items()}
+    if value_type is list:
+        return [copy_state_value(item) for item in value]
+    if value_type is tuple:
+        return tuple(copy_state_value(item) for item in value)
+    if value_type is set:
+        return set(value)
+    if value_type is random.Random:
+        return copy(value)
+    return deepcopy(value)
+
+
+class StateSnapshotMixin:
+    """
+    Snapshot/fork protocol shared by the multi-turn backends.
+
+    `_snapshot()` returns a detached copy of the public state (the attributes that don't start with `_`), which is what
+    goes into the state log of the inference result. `_fork()` returns an independent instance with the same state,
+    so that the model and the ground truth twins of a test entry don't have to load the same scenario twice.
+
+    Both methods are private on purpose, as every public method of a backend is exposed to the model as a tool.
+    Backends with a more specialised state representation override these methods.
+    """
+
+    def _snapshot(self) -> dict:
+        return {
+            key: copy_state_value(value)
+            for key, value in vars(self).items()
+            if not key.startswith("_")
+        }
+
+    def _fork(self):
+        forked = object.__new__(type(self))
+        forked.__dict__.update(
+            {key: copy_state_value(value) for key, value in vars(self).items()}
+        )
+        return forked
@@ -1,6 +1,10 @@
 from copy import deepcopy
 from typing import Dict, List, Optional, Union
 
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.state_snapshot import (
+    StateSnapshotMixin,
+)
+
 DEFAULT_STATE = {
     "ticket_queue": [],
     "ticket_counter": 1,
@@ -8,7 +12,7 @@ DEFAULT_STATE = {
 }
 
 
-class TicketAPI:
+class TicketAPI(StateSnapshotMixin):
     """
     A class representing the Ticket API for managing support tickets.
 
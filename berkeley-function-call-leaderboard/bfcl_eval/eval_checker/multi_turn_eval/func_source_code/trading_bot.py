@@ -12,6 +12,9 @@ from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.long_context import
     TRANSACTION_HISTORY_EXTENSION,
     WATCH_LIST_EXTENSION,
 )
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.state_snapshot import (
+    StateSnapshotMixin,
+)
 
 CURRENT_TIME = datetime(2024, 9, 1, 10, 30)
 
@@ -127,7 +130,7 @@ DEFAULT_STATE = {
 }
 
 
-class TradingBot:
+class TradingBot(StateSnapshotMixin):
     """
     A class representing a trading bot for executing stock trades and managing a trading account.
 
@@ -7,6 +7,9 @@ from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.long_context import
     BOOKING_RECORD_EXTENSION,
     CREDIT_CARD_EXTENSION,
 )
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.state_snapshot import (
+    StateSnapshotMixin,
+)
 
 DEFAULT_STATE = {
     "random_seed": 141053,
@@ -22,7 +25,7 @@ DEFAULT_STATE = {
 }
 
 
-class TravelAPI:
+class TravelAPI(StateSnapshotMixin):
     # Adapted from source : https://developer.concur.com/api-reference/
     def __init__(self):
         super().__init__()
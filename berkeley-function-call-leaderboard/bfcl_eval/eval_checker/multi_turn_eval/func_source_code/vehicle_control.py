@@ -8,6 +8,9 @@ from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.long_context import
     LONG_WEATHER_EXTENSION,
     PARKING_BRAKE_INSTRUCTION,
 )
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.state_snapshot import (
+    StateSnapshotMixin,
+)
 
 MAX_FUEL_LEVEL = 50
 MIN_FUEL_LEVEL = 0.0
@@ -47,7 +50,7 @@ DEFAULT_STATE = {
 }
 
 
-class VehicleControlAPI:
+class VehicleControlAPI(StateSnapshotMixin):
 
     def __init__(self):
         """
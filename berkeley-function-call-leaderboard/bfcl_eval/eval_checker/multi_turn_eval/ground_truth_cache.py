@@ -0,0 +1,182 @@
+import copy
+import hashlib
+import json
+import os
+import pickle
+import threading
+import zlib
+from pathlib import Path
+from typing import NamedTuple, Optional, Union
+
+from bfcl_eval.constants.category_mapping import VERSION_PREFIX
+from bfcl_eval.constants.eval_config import GROUND_TRUTH_CACHE_PATH
+from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils import (
+    ExecutionSession,
+    execute_multi_turn_func_call,
+)
+from bfcl_eval.utils import get_source_fingerprint
+
+# Bump when the content of the cache files changes, so that the ones left by an older version are ignored
+GROUND_TRUTH_CACHE_VERSION = 1
+
+# Instances key of the ground truth execution, distinct from any model name
+GROUND_TRUTH_MODEL_NAME = "ground_truth"
+
+
+class GroundTruthTurn(NamedTuple):
+    """
+    The outcome of executing the ground truth function calls of one turn: their execution results, and the state of
+    the backend instances at the end of the turn.
+    """
+
+    execution_results: list[str]
+    # Pickle of the mapping from class name to instance, or a detached copy of it if the instances can't be pickled
+    instances_state: Union[bytes, dict]
+
+    def load_instances(self) -> dict:
+        """
+        Return a fresh copy of the backend instances at the end of the turn.
+        """
+        if isinstance(self.instances_state, bytes):
+            return pickle.loads(self.instances_state)
+        return copy.deepcopy(self.instances_state)
+
+
+def compute_ground_truth_fingerprint(
+    test_entry: dict, multi_turn_ground_truth_list: list[list[str]], long_context: bool
+) -> str:
+    """
+    Hash of everything the ground truth execution of an entry depends on: the dataset version, the entry (its initial
+    configuration and involved classes), the ground truth function calls, and the source code of the backends.
+    """
+    content = json.dumps(
+        [
+            GROUND_TRUTH_CACHE_VERSION,
+            VERSION_PREFIX,
+            get_source_fingerprint(),
+            test_entry["initial_config"],
+            test_entry["involved_classes"],
+            multi_turn_ground_truth_list,
+            long_context,
+        ],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=repr,
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class GroundTruthCache:
+    """
+    Persistent cache of the ground truth execution of the multi-turn entries.
+
+    The ground truth trajectory of an entry and the state of the backends at the end of each turn only depend on the
+    entry, not on the model being evaluated, so they are computed once and reused when checking every model, in this
+    run and the next ones. Each entry has one small file under `<directory>/<dataset version>/`, holding the
+    zlib-compressed pickle of its turns; it is replaced atomically, and ignored when the fingerprint of the entry no
+    longer matches.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory) / VERSION_PREFIX
+        self._warned_unpicklable = False
+        self._warning_lock = threading.Lock()
+
+    def _get_path(self, test_entry_id: str) -> Path:
+        return self.directory / (
+            test_entry_id.replace("/", "_").replace(":", "_") + ".pkl.z"
+        )
+
+    def load(self, test_entry_id: str, fingerprint: str) -> Optional[list[GroundTruthTurn]]:
+        """
+        Return the cached turns of an entry, or None if there is none, or if it was made for a different version of the
+        entry (fingerprint mismatch) or is unreadable.
+        """
+        try:
+            data = self._get_path(test_entry_id).read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            cached = pickle.loads(zlib.decompress(data))
+        except Exception:
+            return None
+        if cached.get("fingerprint") != fingerprint:
+            return None
+        return [GroundTruthTurn(*turn) for turn in cached["turns"]]
+
+    def save(
+        self, test_entry_id: str, fingerprint: str, turns: list[GroundTruthTurn]
+    ) -> None:
+        data = zlib.compress(
+            pickle.dumps(
+                {"fingerprint": fingerprint, "turns": [tuple(turn) for turn in turns]},
+                protocol=pickle.HIGHEST_PROTOCOL,
+            ),
+            level=1,
+        )
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._get_path(test_entry_id)
+        # Unique per process and thread, so that concurrent writers never share a temp file
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+
+    def get_ground_truth_turns(
+        self,
+        test_entry: dict,
+        multi_turn_ground_truth_list: list[list[str]],
+        long_context: bool,
+        session: ExecutionSession,
+    ) -> list[GroundTruthTurn]:
+        """
+        Return the ground truth execution of every turn of an entry, executing it (and caching it) if it isn't cached.
+        """
+        test_entry_id = test_entry["id"]
+        fingerprint = compute_ground_truth_fingerprint(
+            test_entry, multi_turn_ground_truth_list, long_context
+        )
+        turns = self.load(test_entry_id, fingerprint)
+        if turns is not None:
+            return turns
+
+        turns = []
+        picklable = True
+        for single_turn_ground_truth_list in multi_turn_ground_truth_list:
+            execution_results, instances = execute_multi_turn_func_call(
+                func_call_list=single_turn_ground_truth_list,
+                initial_config=test_entry["initial_config"],
+                involved_classes=test_entry["involved_classes"],
+                model_name=GROUND_TRUTH_MODEL_NAME,
+                test_entry_id=test_entry_id,
+                long_context=long_context,
+                is_evaL_run=True,
+                session=session,
+            )
+            # The instances keep changing in the next turns, so their state is captured right away
+            instances_state = None
+            if picklable:
+                try:
+                    instances_state = pickle.dumps(instances, protocol=pickle.HIGHEST_PROTOCOL)
+                except Exception as e:
+                    picklable = False
+                    with self._warning_lock:
+                        if not self._warned_unpicklable:
+                            self._warned_unpicklable = True
+                            print(
+                                f"⚠️ Warning: The ground truth execution of some multi-turn entries can't be cached: {e}"
+                            )
+            if instances_state is None:
+                instances_state = copy.deepcopy(instances)
+            turns.append(GroundTruthTurn(execution_results, instances_state))
+
+        if picklable:
+            self.save(test_entry_id, fingerprint, turns)
+        return turns
+
+
+# Shared by all the entries checked in this process
+_GROUND_TRUTH_CACHE = GroundTruthCache(GROUND_TRUTH_CACHE_PATH)
+
+
+def get_ground_truth_cache() -> GroundTruthCache:
+    return _GROUND_TRUTH_CACHE
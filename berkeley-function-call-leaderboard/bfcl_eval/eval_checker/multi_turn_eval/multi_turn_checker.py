@@ -1,4 +1,12 @@
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.gorilla_file_system import (
+    Directory,
+    File,
+)
+from bfcl_eval.eval_checker.multi_turn_eval.ground_truth_cache import (
+    get_ground_truth_cache,
+)
 from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils import (
+    ExecutionSession,
     execute_multi_turn_func_call,
     is_empty_execute_response,
 )
@@ -16,13 +24,39 @@ def multi_turn_checker(
     """
     The main function that checks the correctness of the model's function call execution.
     """
+    # Both the model and the ground truth instances are released once this entry is checked.
+    # They start from the same scenario, so it is only loaded once and forked for each of them.
+    with ExecutionSession(share_initial_state=True) as session:
+        return _multi_turn_checker(
+            multi_turn_model_result_list_decoded,
+            multi_turn_ground_truth_list,
+            test_entry,
+            test_category,
+            model_name,
+            session,
+        )
 
+
+def _multi_turn_checker(
+    multi_turn_model_result_list_decoded: list[list[list[str]]],
+    multi_turn_ground_truth_list: list[list[str]],
+    test_entry: dict,
+    test_category: str,
+    model_name: str,
+    session: ExecutionSession,
+) -> dict:
     initial_config: dict = test_entry["initial_config"]
     involved_classes: list = test_entry["involved_classes"]
     test_entry_id: str = test_entry["id"]
     test_category: str = test_entry_id.rsplit("_", 1)[0]
     execution_results: list[dict] = []
     all_turn_model_execution_results: list[str] = []
+    long_context = "long_context" in test_category or "composite" in test_category
+
+    # The ground truth execution doesn't depend on the model, so it is shared by all the models evaluated on this entry
+    ground_truth_turns = get_ground_truth_cache().get_ground_truth_turns(
+        test_entry, multi_turn_ground_truth_list, long_context, session
+    )
 
     # First execute all the function calls
     for turn_index, single_turn_ground_truth_list in enumerate(
@@ -45,29 +79,17 @@ def multi_turn_checker(
                     involved_classes=involved_classes,
                     model_name=model_name,
                     test_entry_id=test_entry_id,
-                    long_context=(
-                        "long_context" in test_category or "composite" in test_category
-                    ),
+                    long_context=long_context,
                     is_evaL_run=True,
+                    session=session,
                 )
             )
             single_turn_model_execution_results.extend(single_step_model_execution_results)
             single_turn_model_execution_results_uncombined.append(single_step_model_execution_results)
 
-        # Execute the ground truth function calls
-        single_turn_ground_truth_execution_results, ground_truth_instances = (
-            execute_multi_turn_func_call(
-                func_call_list=single_turn_ground_truth_list,
-                initial_config=initial_config,
-                involved_classes=involved_classes,
-                model_name=model_name + "_ground_truth",
-                test_entry_id=test_entry_id,
-                long_context=(
-                    "long_context" in test_category or "composite" in test_category
-                ),
-                is_evaL_run=True,
-            )
-        )
+        single_turn_ground_truth_execution_results = ground_truth_turns[
+            turn_index
+        ].execution_results
 
         all_turn_model_execution_results.extend(single_turn_model_execution_results)
         execution_results.append(
@@ -98,6 +120,7 @@ def multi_turn_checker(
             continue
 
         ## Check after each turn ##
+        ground_truth_instances = ground_truth_turns[turn_index].load_instances()
         assert len(model_instances) == len(
             ground_truth_instances
         ), f"Model instances and ground truth instances do not match in length for turn {turn_index}. Model instances: {len(model_instances)}, Ground truth instances: {len(ground_truth_instances)}"
@@ -259,6 +282,7 @@ def method_invoke_order_checker(model_instances: dict, ground_truth_instances: d
 def _compare_instances(model_obect, ground_truth_object):
     """
     Checks if the model_object has the same attributes as the ground_truth_object. They are instances of the same class.
+    The differences are reported at the innermost paths where the two states differ (see `_diff_state_paths`).
     """
     assert type(model_obect) == type(
         ground_truth_object
@@ -274,11 +298,73 @@ def _compare_instances(model_obect, ground_truth_object):
 
         if model_attr != ground_truth_attr:
             valid = False
-            differences[attr_name] = {"model": model_attr, "ground_truth": ground_truth_attr}
+            # The path-level diff is only computed once the attribute is known to mismatch
+            difference_count = len(differences)
+            _diff_state_paths(model_attr, ground_truth_attr, attr_name, differences)
+            # Eg. a NaN, which is not equal to itself: no inner part differs, report the whole attribute
+            if len(differences) == difference_count:
+                differences[attr_name] = {"model": model_attr, "ground_truth": ground_truth_attr}
 
     return valid, differences
 
 
+# The attributes that define the equality of the file system nodes (see their `__eq__`)
+_NODE_STATE_FIELDS = {File: ("name", "content"), Directory: ("name", "contents")}
+
+
+def _diff_state_paths(
+    model_value, ground_truth_value, path: str, differences: dict
+) -> None:
+    """
+    Add to `differences` the innermost paths (eg. `root.contents['notes'].contents['a.txt'].content`) where two pieces
+    of backend state differ, each mapped to the model and ground truth values at that path. A dict key or list item
+    present on one side only is reported at its own path, with the value of that side only.
+    """
+    if model_value == ground_truth_value:
+        return
+
+    if type(model_value) == type(ground_truth_value):
+        if isinstance(model_value, dict):
+            for key in ground_truth_value:
+                key_path = f"{path}[{repr(key)}]"
+                if key in model_value:
+                    _diff_state_paths(
+                        model_value[key], ground_truth_value[key], key_path, differences
+                    )
+                else:
+                    differences[key_path] = {"ground_truth": ground_truth_value[key]}
+            for key in model_value:
+                if key not in ground_truth_value:
+                    differences[f"{path}[{repr(key)}]"] = {"model": model_value[key]}
+            return
+
+        if isinstance(model_value, (list, tuple)):
+            for index in range(max(len(model_value), len(ground_truth_value))):
+                index_path = f"{path}[{index}]"
+                if index >= len(model_value):
+                    differences[index_path] = {"ground_truth": ground_truth_value[index]}
+                elif index >= len(ground_truth_value):
+                    differences[index_path] = {"model": model_value[index]}
+                else:
+                    _diff_state_paths(
+                        model_value[index], ground_truth_value[index], index_path, differences
+                    )
+            return
+
+        fields = _NODE_STATE_FIELDS.get(type(model_value))
+        if fields is not None:
+            for field in fields:
+                _diff_state_paths(
+                    getattr(model_value, field),
+                    getattr(ground_truth_value, field),
+                    f"{path}.{field}",
+                    differences,
+                )
+            return
+
+    differences[path] = {"model": model_value, "ground_truth": ground_truth_value}
+
+
 def _is_subsequence(list1, list2) -> tuple[bool, list]:
     """
     Checks if list1 is a subsequence of list2, i.e., all elements of list1 are present in list2 in the same order.
@@ -1,14 +1,106 @@
+import ast
 import copy
 import importlib
 import inspect
 import json
-import re
+from functools import lru_cache
+from threading import Lock
+from typing import NamedTuple, Optional
 
 from bfcl_eval.constants.executable_backend_config import (
     CLASS_FILE_PATH_MAPPING,
     STATELESS_CLASSES,
 )
 
+# Functions that must never be called from a model response, no matter which object they are called on
+BLOCKED_FUNCTION_NAMES = frozenset(
+    ["kill", "exit", "quit", "remove", "unlink", "popen", "Popen", "run"]
+)
+
+class ExecutionSession:
+    """
+    Registry of the backend instances (GorillaFileSystem, TradingBot, ...) created by `execute_multi_turn_func_call`.
+
+    Instances are grouped by `(model_name, test_entry_id)` so that their state carries over from one call to the next for the same entry.
+    Use it as a context manager to scope the instances to one test entry; all of them are released on exit.
+
+    When `share_initial_state` is set, the scenario of a test entry is loaded only once per class, and every instance
+    (eg. the model and the ground truth twins during evaluation) is forked from that pristine copy.
+    """
+
+    def __init__(self, share_initial_state: bool = False) -> None:
+        self.share_initial_state = share_initial_state
+        self._entries: dict[tuple[str, str], dict] = {}
+        self._templates: dict[tuple[str, str, bool], object] = {}
+        # The shared session is used by multiple generation threads at the same time
+        self._lock = Lock()
+
+    def __enter__(self) -> "ExecutionSession":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_instances(self, model_name: str, test_entry_id: str) -> dict:
+        """
+        Return the mutable mapping from class name to instance for a test entry.
+        """
+        with self._lock:
+            return self._entries.setdefault((model_name, test_entry_id), {})
+
+    def create_instance(
+        self,
+        class_name: str,
+        test_entry_id: str,
+        initial_config: dict,
+        long_context: bool,
+    ):
+        """
+        Create a backend instance loaded with the initial configuration of a test entry.
+        """
+        if not self.share_initial_state:
+            return _load_instance(class_name, initial_config, long_context)
+
+        key = (test_entry_id, class_name, long_context)
+        with self._lock:
+            template = self._templates.get(key)
+        if template is None:
+            template = _load_instance(class_name, initial_config, long_context)
+            # Backends without the snapshot protocol (eg. the memory backends) are always loaded from scratch
+            if not hasattr(template, "_fork"):
+                return template
+            with self._lock:
+                self._templates[key] = template
+        return template._fork()
+
+    def release(self, model_name: str, test_entry_id: str) -> None:
+        with self._lock:
+            self._entries.pop((model_name, test_entry_id), None)
+
+    def close(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._templates.clear()
+
+
+# Class -> names of its public methods, filled the first time a class is instantiated
+_CLASS_METHOD_NAMES: dict[type, tuple[str, ...]] = {}
+
+
+class _CompiledFuncCall(NamedTuple):
+    """
+    A parsed function call string. `method_name` is only set when the call can be dispatched directly, ie. it is a
+    plain `name(...)` call whose arguments are all literals.
+    """
+
+    code: object
+    method_name: Optional[str] = None
+    arg_nodes: tuple = ()
+    keyword_nodes: tuple = ()
+
 
 def execute_multi_turn_func_call(
     func_call_list: list[str],  # a list of strings of func calls
@@ -18,69 +110,41 @@ def execute_multi_turn_func_call(
     test_entry_id: str,
     long_context: bool = False,
     is_evaL_run: bool = False,
+    *,
+    session: ExecutionSession,
 ) -> tuple[list[str], dict]:
     """
-    TODO: Add docstring
+    Execute the function calls against the backend instances of a test entry, and return the execution results and the involved instances.
+
+    The instances are created (and loaded with `initial_config`) on the first call for a `(model_name, test_entry_id)` pair, and reused in subsequent calls from `session`.
+    They live until the session releases them, so use one session per scope (eg. `with ExecutionSession() as session:`).
     """
     if is_evaL_run:
         model_name += "_eval"
 
-    class_method_name_mapping = {}
+    entry_instances = session.get_instances(model_name, test_entry_id)
+
+    method_table = {}
     involved_instances = {}
     for class_name in involved_classes:
-        module_name = CLASS_FILE_PATH_MAPPING[class_name]
-        # TODO: Handler the model name issue from handler more elegantly
-        instance_name = (
-            f"{model_name}_{test_entry_id}_{class_name}_instance"
-        )
-        instance_name = re.sub(r'[-./]', '_', instance_name)
-        if instance_name not in globals():
-            module = importlib.import_module(module_name)
-            class_ = getattr(module, class_name)
-            class_instance = class_()
-            if class_name not in STATELESS_CLASSES:
-                class_initial_config = initial_config.get(class_name, {})
-                # Deep copy the initial configuration to avoid mutation issues
-                class_instance._load_scenario(
-                    copy.deepcopy(class_initial_config), long_context=long_context
-                )
-            globals()[instance_name] = class_instance
-        # This happens in subsequent turns
-        else:
-            class_instance = globals()[instance_name]
+        # Instances already exist in subsequent turns
+        if class_name not in entry_instances:
+            entry_instances[class_name] = session.create_instance(
+                class_name, test_entry_id, initial_config, long_context
+            )
+        class_instance = entry_instances[class_name]
 
         involved_instances[class_name] = class_instance
 
-        # Retrieve all method names and map them to the instance
-        for method_name, method in inspect.getmembers(
-            class_instance, predicate=inspect.ismethod
-        ):
-            # Skip private methods
-            if method_name.startswith("_"):
-                continue
-            class_method_name_mapping[method_name] = instance_name
+        # Later classes take precedence when two of them expose a method with the same name
+        for method_name in _get_public_method_names(class_instance):
+            method_table[method_name] = getattr(class_instance, method_name)
 
     execution_results = []
     for func_call in func_call_list:
-        # Add the instance name to the method calls
-        func_call = _process_method_calls(func_call, class_method_name_mapping)
-
         # Evaluate the function call
         try:
-            # We need to make a copy here because otherwise the `eval(func_call)` would error. 
-            func_call_copy = func_call
-            # Before calling `eval`, we need to make sure that the function call is safe
-            # We do so by checking if the function is `kill` or `exit`, etc.
-            # Extract the function name first
-            if "(" in func_call_copy:
-                func_call_copy = func_call_copy.split("(")[0]
-            # Situation where the function call is a method call
-            if "." in func_call_copy:
-                func_call_copy = func_call_copy.split(".")[1]
-            if func_call_copy in ["kill", "exit", "quit", "remove", "unlink", "popen", "Popen", "run"]:
-                raise Exception(f"Function call {func_call_copy} is not allowed.")
-
-            func_call_result = eval(func_call)
+            func_call_result = _dispatch_func_call(func_call, method_table)
 
             if type(func_call_result) == str:
                 pass
@@ -100,6 +164,22 @@ def execute_multi_turn_func_call(
     return execution_results, involved_instances
 
 
+def _load_instance(class_name: str, initial_config: dict, long_context: bool):
+    """
+    Instantiate a backend class and load the scenario for it from `initial_config`.
+    """
+    module = importlib.import_module(CLASS_FILE_PATH_MAPPING[class_name])
+    class_ = getattr(module, class_name)
+    class_instance = class_()
+    if class_name not in STATELESS_CLASSES:
+        class_initial_config = initial_config.get(class_name, {})
+        # Deep copy the initial configuration to avoid mutation issues
+        class_instance._load_scenario(
+            copy.deepcopy(class_initial_config), long_context=long_context
+        )
+    return class_instance
+
+
 def is_empty_execute_response(input_list: list):
     if len(input_list) == 0:
         return True
@@ -108,39 +188,89 @@ def is_empty_execute_response(input_list: list):
     return False
 
 
-def _process_method_calls(function_call_string: str, instance_mapping: dict) -> str:
+def _get_public_method_names(class_instance) -> tuple[str, ...]:
     """
-    Prepends the instance name to the function name for each of the function name represented in the string, you will
-    also be provided with the mapping of method name to instance name.
-
-    Example input:
-    ```
-    f(x = g((1, 2), h(3)), y = (4), z = (5, 6))
-    ```
+    Return the names of the public methods of a backend instance. The result is computed once per class.
+    """
+    class_ = type(class_instance)
+    method_names = _CLASS_METHOD_NAMES.get(class_)
+    if method_names is None:
+        method_names = tuple(
+            method_name
+            for method_name, _ in inspect.getmembers(
+                class_instance, predicate=inspect.ismethod
+            )
+            # Skip private methods
+            if not method_name.startswith("_")
+        )
+        _CLASS_METHOD_NAMES[class_] = method_names
+    return method_names
 
-    Example return:
-    ```
-    a.f(x=a.g((1, 2), a.h(3)), y=(4), z=(5, 6))
-    ```
 
-    Args:
-        function_call_string (str): The function call string to parse.
-        class_mapping (dict): A dictionary mapping method names to instance names.
+@lru_cache(maxsize=8192)
+def _compile_func_call(func_call: str) -> _CompiledFuncCall:
+    """
+    Parse a function call string such as `cd(folder='document')` into a `_CompiledFuncCall`.
 
-    Returns:
-        str: The parsed function call string with instance names prepended to method names.
+    Raises:
+        SyntaxError: If the string is not a valid Python expression.
+        Exception: If any (possibly nested) call targets a blocked function such as `kill` or `exit`.
     """
+    # `eval` ignores leading spaces and tabs, do the same here
+    expression = ast.parse(func_call.lstrip(" \t"), filename="<string>", mode="eval")
+
+    # Make sure that the function call is safe before it ever gets executed
+    for node in ast.walk(expression):
+        if not isinstance(node, ast.Call):
+            continue
+        if isinstance(node.func, ast.Name):
+            called_name = node.func.id
+        elif isinstance(node.func, ast.Attribute):
+            called_name = node.func.attr
+        else:
+            continue
+        if called_name in BLOCKED_FUNCTION_NAMES:
+            raise Exception(f"Function call {called_name} is not allowed.")
+
+    code = compile(expression, filename="<string>", mode="eval")
+
+    # Fast path: `method(arg, key=value, ...)` where every argument is a literal
+    call = expression.body
+    if (
+        isinstance(call, ast.Call)
+        and isinstance(call.func, ast.Name)
+        and not any(isinstance(arg, ast.Starred) for arg in call.args)
+        and all(keyword.arg is not None for keyword in call.keywords)
+    ):
+        try:
+            for node in [*call.args, *(keyword.value for keyword in call.keywords)]:
+                ast.literal_eval(node)
+        except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+            pass
+        else:
+            return _CompiledFuncCall(
+                code=code,
+                method_name=call.func.id,
+                arg_nodes=tuple(call.args),
+                keyword_nodes=tuple((keyword.arg, keyword.value) for keyword in call.keywords),
+            )
+
+    return _CompiledFuncCall(code=code)
 
-    def replace_function(match):
-        func_name = match.group(1)
-        if func_name in instance_mapping:
-            return f"{instance_mapping[func_name]}.{func_name}"
-        return func_name
 
-    # Regular expression to match function names
-    pattern = r"\b([a-zA-Z_]\w*)\s*(?=\()"
+def _dispatch_func_call(func_call: str, method_table: dict):
+    """
+    Execute a single function call string against the bound methods in `method_table`.
+
+    Simple calls are dispatched directly to the bound method. Anything else (eg. nested calls or non-literal
+    arguments) is evaluated as an expression where the method names resolve to the bound methods.
+    """
+    compiled = _compile_func_call(func_call)
 
-    # Replace function names with their class-prepended versions
-    processed_string = re.sub(pattern, replace_function, function_call_string)
+    if compiled.method_name is not None and compiled.method_name in method_table:
+        # Arguments are re-built on every call so that a method mutating them doesn't affect later calls
+        args = [ast.literal_eval(node) for node in compiled.arg_nodes]
+        kwargs = {key: ast.literal_eval(node) for key, node in compiled.keyword_nodes}
+        return method_table[compiled.method_name](*args, **kwargs)
 
-    return processed_string
+    return eval(compiled.code, globals(), method_table)
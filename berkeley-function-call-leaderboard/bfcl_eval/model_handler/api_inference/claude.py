@@ -8,6 +8,7 @@ from anthropic.types import TextBlock, ToolUseBlock
 from bfcl_eval.constants.enums import ModelStyle
 from bfcl_eval.constants.type_mappings import GORILLA_TO_OPENAPI
 from bfcl_eval.model_handler.base_handler import BaseHandler
+from bfcl_eval.model_handler.rate_limiter import report_response_headers
 from bfcl_eval.model_handler.utils import (
     combine_consecutive_user_prompts,
     convert_to_function_call,
@@ -58,8 +59,10 @@ class ClaudeHandler(BaseHandler):
     @retry_with_backoff(error_type=RateLimitError, error_message_pattern=r".*Your credit balance is too low.*")
     def generate_with_backoff(self, **kwargs):
         start_time = time.time()
-        api_response = self.client.messages.create(**kwargs)
+        raw_response = self.client.messages.with_raw_response.create(**kwargs)
         end_time = time.time()
+        report_response_headers(raw_response.headers)
+        api_response = raw_response.parse()
 
         return api_response, end_time - start_time
 
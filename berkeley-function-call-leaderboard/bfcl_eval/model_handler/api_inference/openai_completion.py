@@ -6,6 +6,7 @@ from typing import Any
 from bfcl_eval.constants.type_mappings import GORILLA_TO_OPENAPI
 from bfcl_eval.model_handler.base_handler import BaseHandler
 from bfcl_eval.constants.enums import ModelStyle
+from bfcl_eval.model_handler.rate_limiter import report_response_headers
 from bfcl_eval.model_handler.utils import (
     convert_to_function_call,
     convert_to_tool,
@@ -15,7 +16,7 @@ from bfcl_eval.model_handler.utils import (
     retry_with_backoff,
     system_prompt_pre_processing_chat_model,
 )
-from openai import OpenAI, RateLimitError
+from openai import AsyncOpenAI, OpenAI, RateLimitError
 
 
 class OpenAICompletionsHandler(BaseHandler):
@@ -30,6 +31,7 @@ class OpenAICompletionsHandler(BaseHandler):
         super().__init__(model_name, temperature, registry_name, is_fc_model, **kwargs)
         self.model_style = ModelStyle.OPENAI_COMPLETIONS
         self._client = None
+        self._async_client = None
 
     @property
     def client(self):
@@ -41,6 +43,26 @@ class OpenAICompletionsHandler(BaseHandler):
     def client(self, value):
         self._client = value
 
+    @property
+    def async_client(self):
+        if self._async_client is None:
+            # Mirror the sync client, as subclasses often point it to their own endpoint and key
+            client = self.client
+            self._async_client = AsyncOpenAI(
+                api_key=client.api_key,
+                organization=client.organization,
+                project=client.project,
+                base_url=client.base_url,
+                timeout=client.timeout,
+                max_retries=client.max_retries,
+                default_headers=client._custom_headers,
+            )
+        return self._async_client
+
+    @async_client.setter
+    def async_client(self, value):
+        self._async_client = value
+
     def _build_client_kwargs(self):
         """Collect OpenAI client keyword arguments from environment variables, but only
         include them if they are actually present so that we keep the call minimal
@@ -79,14 +101,42 @@ class OpenAICompletionsHandler(BaseHandler):
     @retry_with_backoff(error_type=RateLimitError)
     def generate_with_backoff(self, **kwargs):
         start_time = time.time()
-        api_response = self.client.chat.completions.create(**kwargs)
+        raw_response = self.client.chat.completions.with_raw_response.create(**kwargs)
         end_time = time.time()
+        report_response_headers(raw_response.headers)
+        api_response = raw_response.parse()
 
         return api_response, end_time - start_time
 
+    @retry_with_backoff(error_type=RateLimitError)
+    async def agenerate_with_backoff(self, **kwargs):
+        start_time = time.time()
+        raw_response = await self.async_client.chat.completions.with_raw_response.create(
+            **kwargs
+        )
+        end_time = time.time()
+        report_response_headers(raw_response.headers)
+        api_response = raw_response.parse()
+
+        return api_response, end_time - start_time
+
+    def _uses_default_query(self, query_method_name: str, handler_class: type) -> bool:
+        """
+        Whether `query_method_name` and `generate_with_backoff` are the ones defined by `handler_class`, and the client
+        is a plain OpenAI client. If a subclass customises any of them, the native async query would not send the same
+        request, so the async hooks fall back to running the sync query in a worker thread instead.
+        """
+        return (
+            isinstance(self.client, OpenAI)
+            and getattr(type(self), query_method_name)
+            is getattr(handler_class, query_method_name)
+            and type(self).generate_with_backoff
+            is OpenAICompletionsHandler.generate_with_backoff
+        )
+
     #### FC methods ####
 
-    def _query_FC(self, inference_data: dict):
+    def _build_query_kwargs_FC(self, inference_data: dict) -> dict:
         message: list[dict] = inference_data["message"]
         tools = inference_data["tools"]
         inference_data["inference_input_log"] = {"message": repr(message), "tools": tools}
@@ -101,7 +151,17 @@ class OpenAICompletionsHandler(BaseHandler):
         if len(tools) > 0:
             kwargs["tools"] = tools
 
-        return self.generate_with_backoff(**kwargs)
+        return kwargs
+
+    def _query_FC(self, inference_data: dict):
+        return self.generate_with_backoff(**self._build_query_kwargs_FC(inference_data))
+
+    async def _aquery_FC(self, inference_data: dict):
+        if not self._uses_default_query("_query_FC", OpenAICompletionsHandler):
+            return await super()._aquery_FC(inference_data)
+        return await self.agenerate_with_backoff(
+            **self._build_query_kwargs_FC(inference_data)
+        )
 
     def _pre_query_processing_FC(self, inference_data: dict, test_entry: dict) -> dict:
         inference_data["message"] = []
@@ -225,14 +285,26 @@ class OpenAICompletionsHandler(BaseHandler):
 
     #### Prompting methods ####
 
-    def _query_prompting(self, inference_data: dict):
+    def _build_query_kwargs_prompting(self, inference_data: dict) -> dict:
         inference_data["inference_input_log"] = {"message": repr(inference_data["message"])}
 
+        return {
+            "messages": inference_data["message"],
+            "model": self.model_name,
+            "temperature": self.temperature,
+            "store": False,
+        }
+
+    def _query_prompting(self, inference_data: dict):
         return self.generate_with_backoff(
-            messages=inference_data["message"],
-            model=self.model_name,
-            temperature=self.temperature,
-            store=False,
+            **self._build_query_kwargs_prompting(inference_data)
+        )
+
+    async def _aquery_prompting(self, inference_data: dict):
+        if not self._uses_default_query("_query_prompting", OpenAICompletionsHandler):
+            return await super()._aquery_prompting(inference_data)
+        return await self.agenerate_with_backoff(
+            **self._build_query_kwargs_prompting(inference_data)
         )
 
     def _pre_query_processing_prompting(self, test_entry: dict) -> dict:
@@ -5,6 +5,7 @@ import time
 from bfcl_eval.constants.type_mappings import GORILLA_TO_OPENAPI
 from bfcl_eval.model_handler.base_handler import BaseHandler
 from bfcl_eval.constants.enums import ModelStyle
+from bfcl_eval.model_handler.rate_limiter import report_response_headers
 from bfcl_eval.model_handler.utils import (
     convert_to_function_call,
     convert_to_tool,
@@ -80,8 +81,10 @@ class OpenAIResponsesHandler(BaseHandler):
     @retry_with_backoff(error_type=RateLimitError)
     def generate_with_backoff(self, **kwargs):
         start_time = time.time()
-        api_response = self.client.responses.create(**kwargs)
+        raw_response = self.client.responses.with_raw_response.create(**kwargs)
         end_time = time.time()
+        report_response_headers(raw_response.headers)
+        api_response = raw_response.parse()
 
         return api_response, end_time - start_time
 
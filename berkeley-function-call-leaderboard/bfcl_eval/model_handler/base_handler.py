@@ -1,6 +1,5 @@
-import json
-from copy import deepcopy
-from typing import TYPE_CHECKING, Any
+import asyncio
+from typing import TYPE_CHECKING, Any, Generator, Optional
 
 from bfcl_eval.constants.category_mapping import VERSION_PREFIX
 from bfcl_eval.constants.default_prompts import (
@@ -15,9 +14,15 @@ from bfcl_eval.constants.executable_backend_config import (
     STATELESS_CLASSES,
 )
 from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils import (
+    ExecutionSession,
     execute_multi_turn_func_call,
     is_empty_execute_response,
 )
+from bfcl_eval.model_handler.result_writer import ResultWriter
+from bfcl_eval.model_handler.turn_checkpoint import (
+    TurnCheckpointStore,
+    compute_entry_fingerprint,
+)
 from bfcl_eval.model_handler.utils import add_memory_instruction_system_prompt
 from bfcl_eval.utils import *
 from overrides import final
@@ -36,6 +41,7 @@ class BaseHandler:
     registry_dir_name: str
     model_name_underline_replaced: str
     model_style: ModelStyle
+    turn_checkpoint_store: Optional[TurnCheckpointStore]
 
     def __init__(
         self, model_name, temperature, registry_name, is_fc_model, **kwargs
@@ -60,6 +66,8 @@ class BaseHandler:
         # Replace the slash with underscore to avoid creating subdirectories
         self.registry_dir_name = registry_name.replace("/", "_")
         self.temperature = temperature
+        # Set by the generation pipeline to checkpoint the multi-turn entries after every turn
+        self.turn_checkpoint_store = None
 
         # Set any additional attributes passed via kwargs
         for _key, _value in kwargs.items():
@@ -72,24 +80,134 @@ class BaseHandler:
         exclude_state_log: bool,
     ):
         # This method is used to retrive model response for each model.
+        # The backend instances of multi-turn entries only live for the duration of this entry
+        with ExecutionSession() as session:
+            return self._run_inference_steps(
+                self._get_inference_steps(
+                    test_entry, include_input_log, exclude_state_log, session
+                )
+            )
+
+    async def ainference(
+        self,
+        test_entry: dict,
+        include_input_log: bool,
+        exclude_state_log: bool,
+    ):
+        """
+        Async counterpart of `inference`. The model is queried through the `_aquery_FC`/`_aquery_prompting` hooks,
+        so that many entries can be in flight on a single event loop.
+        """
+        with ExecutionSession() as session:
+            return await self._arun_inference_steps(
+                self._get_inference_steps(
+                    test_entry, include_input_log, exclude_state_log, session
+                )
+            )
 
+    @final
+    def _get_inference_steps(
+        self,
+        test_entry: dict,
+        include_input_log: bool,
+        exclude_state_log: bool,
+        session: ExecutionSession,
+    ) -> Generator:
         # FC model
         # TODO: Let all models have the is_fc_model attribute and remove the "FC" check
         if "FC" in self.registry_name or self.is_fc_model:
             if contain_multi_turn_interaction(test_entry["id"]):
-                return self.inference_multi_turn_FC(
-                    test_entry, include_input_log, exclude_state_log
+                return self._inference_multi_turn_FC(
+                    test_entry, include_input_log, exclude_state_log, session
                 )
             else:
-                return self.inference_single_turn_FC(test_entry, include_input_log)
+                return self._inference_single_turn_FC(test_entry, include_input_log)
         # Prompting model
         else:
             if contain_multi_turn_interaction(test_entry["id"]):
-                return self.inference_multi_turn_prompting(
-                    test_entry, include_input_log, exclude_state_log
+                return self._inference_multi_turn_prompting(
+                    test_entry, include_input_log, exclude_state_log, session
                 )
             else:
-                return self.inference_single_turn_prompting(test_entry, include_input_log)
+                return self._inference_single_turn_prompting(test_entry, include_input_log)
+
+    @final
+    def _run_inference_steps(self, steps: Generator):
+        """
+        Drive an inference generator to completion, answering each model query it yields with `_query_FC` or
+        `_query_prompting`. Return the value returned by the generator.
+
+        The inference generators yield `(query_mode, inference_data)` whenever they need a model response, and get
+        back the `(api_response, query_latency)` tuple from the corresponding query hook.
+        """
+        try:
+            query_mode, inference_data = next(steps)
+            while True:
+                try:
+                    if query_mode == "FC":
+                        query_result = self._query_FC(inference_data)
+                    else:
+                        query_result = self._query_prompting(inference_data)
+                except Exception as e:
+                    query_mode, inference_data = steps.throw(e)
+                else:
+                    query_mode, inference_data = steps.send(query_result)
+        except StopIteration as stop:
+            return stop.value
+
+    @final
+    async def _arun_inference_steps(self, steps: Generator):
+        """
+        Same as `_run_inference_steps`, but the model queries are awaited from `_aquery_FC` or `_aquery_prompting`.
+        """
+        try:
+            query_mode, inference_data = next(steps)
+            while True:
+                try:
+                    if query_mode == "FC":
+                        query_result = await self._aquery_FC(inference_data)
+                    else:
+                        query_result = await self._aquery_prompting(inference_data)
+                except Exception as e:
+                    query_mode, inference_data = steps.throw(e)
+                else:
+                    query_mode, inference_data = steps.send(query_result)
+        except StopIteration as stop:
+            return stop.value
+
+    @final
+    def _load_turn_checkpoint(
+        self,
+        test_entry: dict,
+        include_input_log: bool,
+        exclude_state_log: bool,
+        session: ExecutionSession,
+    ) -> tuple[Optional[str], Optional[dict]]:
+        """
+        Look up the turn checkpoint of a multi-turn entry, left by an interrupted run. When there is one, the backend
+        instances saved with it are put back into `session` and the function docs of the entry are restored, so that
+        the inference can continue after the last completed turn.
+
+        Return the fingerprint to save the checkpoints of this entry with (None if the entry is not checkpointed) and
+        the checkpoint (None if there is nothing to resume).
+        """
+        # The memory backends keep their state outside of the instances, so these entries always start from scratch
+        if self.turn_checkpoint_store is None or is_memory(test_entry["id"]):
+            return None, None
+
+        fingerprint = compute_entry_fingerprint(
+            self, test_entry, include_input_log, exclude_state_log
+        )
+        checkpoint = self.turn_checkpoint_store.load(test_entry["id"], fingerprint)
+        if checkpoint is not None:
+            session.get_instances(
+                self.model_name_underline_replaced, test_entry["id"]
+            ).update(checkpoint["instances"])
+            test_entry["function"] = checkpoint["function"]
+            print(
+                f"Resuming {test_entry['id']} after turn {checkpoint['turn_idx']} from its checkpoint."
+            )
+        return fingerprint, checkpoint
 
     @final
     def inference_multi_turn_FC(
@@ -98,6 +216,22 @@ class BaseHandler:
         include_input_log: bool,
         exclude_state_log: bool,
     ) -> tuple[list[list], dict]:
+        # The backend instances only live for the duration of this entry
+        with ExecutionSession() as session:
+            return self._run_inference_steps(
+                self._inference_multi_turn_FC(
+                    test_entry, include_input_log, exclude_state_log, session
+                )
+            )
+
+    @final
+    def _inference_multi_turn_FC(
+        self,
+        test_entry: dict,
+        include_input_log: bool,
+        exclude_state_log: bool,
+        session: ExecutionSession,
+    ) -> Generator[tuple[str, dict], tuple[Any, float], tuple[list[list], dict]]:
         initial_config: dict = test_entry.get("initial_config", {})
         involved_classes: list = test_entry["involved_classes"]
         test_entry_id: str = test_entry["id"]
@@ -120,6 +254,17 @@ class BaseHandler:
 
         all_reasoning_content: list[list] = []
 
+        checkpoint_fingerprint, checkpoint = self._load_turn_checkpoint(
+            test_entry, include_input_log, exclude_state_log, session
+        )
+        if checkpoint is not None:
+            total_input_token_count = checkpoint["input_token_count"]
+            total_output_token_count = checkpoint["output_token_count"]
+            total_latency = checkpoint["latency"]
+            all_model_response = checkpoint["model_response"]
+            all_reasoning_content = checkpoint["reasoning_content"]
+            all_inference_log = checkpoint["inference_log"]
+
         # Execute no function call, but just to get a reference to all the instances to get the initial state for logging purpose
         _, involved_instances = execute_multi_turn_func_call(
             [],
@@ -129,6 +274,7 @@ class BaseHandler:
             test_entry_id,
             long_context=("long_context" in test_category or "composite" in test_category),
             is_evaL_run=False,
+            session=session,
         )
 
         if is_memory(test_category):
@@ -144,35 +290,37 @@ class BaseHandler:
                 memory_instance,
             )
 
-        if not exclude_state_log:
+        if not exclude_state_log and checkpoint is None:
             state_log = []
             for class_name, class_instance in involved_instances.items():
                 if class_name in STATELESS_CLASSES or class_name in OMIT_STATE_INFO_CLASSES:
                     continue
-                # Avoid modification in future turns
-                class_instance = deepcopy(class_instance)
                 state_log.append(
                     {
                         "role": "state_info",
                         "class_name": class_name,
-                        "content": {
-                            key: value
-                            for key, value in vars(class_instance).items()
-                            if not key.startswith("_")
-                        },
+                        # A detached copy, so that it isn't affected by future turns
+                        "content": class_instance._snapshot(),
                     }
                 )
             if len(state_log) > 0:
                 all_inference_log.append(state_log)
 
-        inference_data: dict = {}
-        inference_data = self._pre_query_processing_FC(inference_data, test_entry)
-        inference_data = self._compile_tools(inference_data, test_entry)
+        if checkpoint is None:
+            inference_data: dict = {}
+            inference_data = self._pre_query_processing_FC(inference_data, test_entry)
+            inference_data = self._compile_tools(inference_data, test_entry)
+        else:
+            inference_data = checkpoint["inference_data"]
 
         all_multi_turn_messages: list[list[dict]] = test_entry["question"]
         for turn_idx, current_turn_message in enumerate(all_multi_turn_messages):
             current_turn_message: list[dict]
 
+            # Turns already completed before the checkpoint
+            if checkpoint is not None and turn_idx <= checkpoint["turn_idx"]:
+                continue
+
             if str(turn_idx) in holdout_function:
                 test_entry["function"].extend(holdout_function[str(turn_idx)])
                 # Since we have added new functions, we need to recompile the tools
@@ -217,7 +365,7 @@ class BaseHandler:
                 # Add to the current_turn_inference_log at beginning of each step so that we don't need to bother dealing with the break statements
                 current_turn_inference_log[f"step_{count}"] = current_step_inference_log
 
-                api_response, query_latency = self._query_FC(inference_data)
+                api_response, query_latency = yield "FC", inference_data
 
                 # This part of logging is disabled by default because it is too verbose and will make the result file extremely large
                 # It is only useful to see if the inference pipeline is working as expected (eg, does it convert all the inputs correctly)
@@ -303,6 +451,7 @@ class BaseHandler:
                         "long_context" in test_category or "composite" in test_category
                     ),
                     is_evaL_run=False,
+                    session=session,
                 )
 
                 # Add the execution results to the chat history for the next turn
@@ -347,17 +496,12 @@ class BaseHandler:
                         or class_name in OMIT_STATE_INFO_CLASSES
                     ):
                         continue
-                    # Avoid modification in future turns
-                    class_instance = deepcopy(class_instance)
                     state_log.append(
                         {
                             "role": "state_info",
                             "class_name": class_name,
-                            "content": {
-                                key: value
-                                for key, value in vars(class_instance).items()
-                                if not key.startswith("_")
-                            },
+                            # A detached copy, so that it isn't affected by future turns
+                            "content": class_instance._snapshot(),
                         }
                     )
                 if len(state_log) > 0:
@@ -366,6 +510,27 @@ class BaseHandler:
             if force_quit:
                 break
 
+            if (
+                checkpoint_fingerprint is not None
+                and turn_idx < len(all_multi_turn_messages) - 1
+            ):
+                self.turn_checkpoint_store.save(
+                    test_entry_id,
+                    {
+                        "fingerprint": checkpoint_fingerprint,
+                        "turn_idx": turn_idx,
+                        "function": test_entry["function"],
+                        "inference_data": inference_data,
+                        "instances": involved_instances,
+                        "input_token_count": total_input_token_count,
+                        "output_token_count": total_output_token_count,
+                        "latency": total_latency,
+                        "model_response": all_model_response,
+                        "reasoning_content": all_reasoning_content,
+                        "inference_log": all_inference_log,
+                    },
+                )
+
         # Special handling for the memory category
         # Need to flush the memory to local file at the end of the conversation
         if is_memory_prereq(test_entry_id):
@@ -375,6 +540,9 @@ class BaseHandler:
             memory_instance: "MemoryAPI" = list(involved_instances.values())[0]
             memory_instance._flush_memory_to_local_file()
 
+        if checkpoint_fingerprint is not None:
+            self.turn_checkpoint_store.discard(test_entry_id)
+
         metadata = {
             "input_token_count": total_input_token_count,
             "output_token_count": total_output_token_count,
@@ -397,6 +565,22 @@ class BaseHandler:
         include_input_log: bool,
         exclude_state_log: bool,
     ) -> tuple[list[list], dict]:
+        # The backend instances only live for the duration of this entry
+        with ExecutionSession() as session:
+            return self._run_inference_steps(
+                self._inference_multi_turn_prompting(
+                    test_entry, include_input_log, exclude_state_log, session
+                )
+            )
+
+    @final
+    def _inference_multi_turn_prompting(
+        self,
+        test_entry: dict,
+        include_input_log: bool,
+        exclude_state_log: bool,
+        session: ExecutionSession,
+    ) -> Generator[tuple[str, dict], tuple[Any, float], tuple[list[list], dict]]:
         initial_config: dict = test_entry.get("initial_config", {})
         involved_classes: list = test_entry["involved_classes"]
         test_entry_id: str = test_entry["id"]
@@ -417,6 +601,17 @@ class BaseHandler:
         all_inference_log: list[list[dict]] = []
         force_quit = False  # Whether the model has been forced to quit. If True, this whole entry will be failed.
 
+        checkpoint_fingerprint, checkpoint = self._load_turn_checkpoint(
+            test_entry, include_input_log, exclude_state_log, session
+        )
+        if checkpoint is not None:
+            total_input_token_count = checkpoint["input_token_count"]
+            total_output_token_count = checkpoint["output_token_count"]
+            total_latency = checkpoint["latency"]
+            all_model_response = checkpoint["model_response"]
+            all_reasoning_content = checkpoint["reasoning_content"]
+            all_inference_log = checkpoint["inference_log"]
+
         # Execute no function call, but just to get a reference to all the instances to get the initial state for logging purpose
         _, involved_instances = execute_multi_turn_func_call(
             [],
@@ -426,6 +621,7 @@ class BaseHandler:
             test_entry_id,
             long_context=("long_context" in test_category or "composite" in test_category),
             is_evaL_run=False,
+            session=session,
         )
 
         if is_memory(test_category):
@@ -441,33 +637,35 @@ class BaseHandler:
                 memory_instance,
             )
 
-        if not exclude_state_log:
+        if not exclude_state_log and checkpoint is None:
             state_log = []
             for class_name, class_instance in involved_instances.items():
                 if class_name in STATELESS_CLASSES or class_name in OMIT_STATE_INFO_CLASSES:
                     continue
-                # Avoid modification in future turns
-                class_instance = deepcopy(class_instance)
                 state_log.append(
                     {
                         "role": "state_info",
                         "class_name": class_name,
-                        "content": {
-                            key: value
-                            for key, value in vars(class_instance).items()
-                            if not key.startswith("_")
-                        },
+                        # A detached copy, so that it isn't affected by future turns
+                        "content": class_instance._snapshot(),
                     }
                 )
             if len(state_log) > 0:
                 all_inference_log.append(state_log)
 
-        inference_data: dict = self._pre_query_processing_prompting(test_entry)
+        if checkpoint is None:
+            inference_data: dict = self._pre_query_processing_prompting(test_entry)
+        else:
+            inference_data = checkpoint["inference_data"]
 
         all_multi_turn_messages: list[list[dict]] = test_entry["question"]
         for turn_idx, current_turn_message in enumerate(all_multi_turn_messages):
             current_turn_message: list[dict]
 
+            # Turns already completed before the checkpoint
+            if checkpoint is not None and turn_idx <= checkpoint["turn_idx"]:
+                continue
+
             if str(turn_idx) in holdout_function:
                 assert (
                     len(current_turn_message) == 0
@@ -509,7 +707,7 @@ class BaseHandler:
                 # Add to the current_turn_inference_log at beginning of each step so that we don't need to bother dealing with the break statements
                 current_turn_inference_log[f"step_{count}"] = current_step_inference_log
 
-                api_response, query_latency = self._query_prompting(inference_data)
+                api_response, query_latency = yield "prompting", inference_data
 
                 # This part of logging is disabled by default because it is too verbose and will make the result file extremely large
                 # It is only useful to see if the inference pipeline is working as expected (eg, does it convert all the inputs correctly)
@@ -595,6 +793,7 @@ class BaseHandler:
                         "long_context" in test_category or "composite" in test_category
                     ),
                     is_evaL_run=False,
+                    session=session,
                 )
 
                 # Add the execution results to the chat history for the next turn
@@ -638,17 +837,12 @@ class BaseHandler:
                         or class_name in OMIT_STATE_INFO_CLASSES
                     ):
                         continue
-                    # Avoid modification in future turns
-                    class_instance = deepcopy(class_instance)
                     state_log.append(
                         {
                             "role": "state_info",
                             "class_name": class_name,
-                            "content": {
-                                key: value
-                                for key, value in vars(class_instance).items()
-                                if not key.startswith("_")
-                            },
+                            # A detached copy, so that it isn't affected by future turns
+                            "content": class_instance._snapshot(),
                         }
                     )
                 if len(state_log) > 0:
@@ -657,6 +851,27 @@ class BaseHandler:
             if force_quit:
                 break
 
+            if (
+                checkpoint_fingerprint is not None
+                and turn_idx < len(all_multi_turn_messages) - 1
+            ):
+                self.turn_checkpoint_store.save(
+                    test_entry_id,
+                    {
+                        "fingerprint": checkpoint_fingerprint,
+                        "turn_idx": turn_idx,
+                        "function": test_entry["function"],
+                        "inference_data": inference_data,
+                        "instances": involved_instances,
+                        "input_token_count": total_input_token_count,
+                        "output_token_count": total_output_token_count,
+                        "latency": total_latency,
+                        "model_response": all_model_response,
+                        "reasoning_content": all_reasoning_content,
+                        "inference_log": all_inference_log,
+                    },
+                )
+
         # Special handling for the memory category
         # Need to flush the memory to local file at the end of the conversation
         if is_memory_prereq(test_entry_id):
@@ -666,6 +881,9 @@ class BaseHandler:
             memory_instance: "MemoryAPI" = list(involved_instances.values())[0]
             memory_instance._flush_memory_to_local_file()
 
+        if checkpoint_fingerprint is not None:
+            self.turn_checkpoint_store.discard(test_entry_id)
+
         metadata = {
             "input_token_count": total_input_token_count,
             "output_token_count": total_output_token_count,
@@ -685,6 +903,14 @@ class BaseHandler:
     def inference_single_turn_FC(
         self, test_entry: dict, include_input_log: bool
     ) -> tuple[any, dict]:
+        return self._run_inference_steps(
+            self._inference_single_turn_FC(test_entry, include_input_log)
+        )
+
+    @final
+    def _inference_single_turn_FC(
+        self, test_entry: dict, include_input_log: bool
+    ) -> Generator[tuple[str, dict], tuple[Any, float], tuple[any, dict]]:
         inference_data: dict = {}
         inference_data = self._pre_query_processing_FC(inference_data, test_entry)
         inference_data = self._compile_tools(inference_data, test_entry)
@@ -692,7 +918,7 @@ class BaseHandler:
             inference_data, test_entry["question"][0]
         )
 
-        api_response, query_latency = self._query_FC(inference_data)
+        api_response, query_latency = yield "FC", inference_data
 
         # Try parsing the model response
         model_response_data = self._parse_query_response_FC(api_response)
@@ -722,12 +948,20 @@ class BaseHandler:
     def inference_single_turn_prompting(
         self, test_entry: dict, include_input_log: bool
     ) -> tuple[any, dict]:
+        return self._run_inference_steps(
+            self._inference_single_turn_prompting(test_entry, include_input_log)
+        )
+
+    @final
+    def _inference_single_turn_prompting(
+        self, test_entry: dict, include_input_log: bool
+    ) -> Generator[tuple[str, dict], tuple[Any, float], tuple[any, dict]]:
         inference_data: dict = self._pre_query_processing_prompting(test_entry)
         inference_data = self.add_first_turn_message_prompting(
             inference_data, test_entry["question"][0]
         )
 
-        api_response, query_latency = self._query_prompting(inference_data)
+        api_response, query_latency = yield "prompting", inference_data
 
         # Try parsing the model response
         model_response_data = self._parse_query_response_prompting(api_response)
@@ -766,59 +1000,22 @@ class BaseHandler:
         raise NotImplementedError
 
     @final
-    def write(self, result, result_dir, update_mode=False):
+    def get_result_file_path(self, entry_id: str, result_dir: Path) -> Path:
         # Use the internal registry name to decide the result directory to avoid
         # collisions between different variants that share the same API model name.
         model_result_dir = result_dir / self.registry_dir_name
+        test_category = extract_test_category_from_id(entry_id)
+        # Determine the high-level grouping folder (non_live, live, etc.)
+        group_dir_name = get_directory_structure_by_id(entry_id)
+        return model_result_dir / group_dir_name / f"{VERSION_PREFIX}_{test_category}_result.json"
 
-        if isinstance(result, dict):
-            result = [result]
-
-        # Collect and format each entry for JSON compatibility
-        entries_to_write = [make_json_serializable(entry) for entry in result]
-
-        # Group entries by their `test_category` for efficient file handling
-        file_entries = {}
-        for entry in entries_to_write:
-            test_category = extract_test_category_from_id(entry["id"])
-            # Determine the high-level grouping folder (non_live, live, etc.)
-            group_dir_name = get_directory_structure_by_id(entry["id"])
-            group_dir_path = model_result_dir / group_dir_name
-            group_dir_path.mkdir(parents=True, exist_ok=True)
-
-            file_path = group_dir_path / f"{VERSION_PREFIX}_{test_category}_result.json"
-            file_entries.setdefault(file_path, []).append(entry)
-
-        for file_path, entries in file_entries.items():
-            if update_mode:
-                # Load existing entries from the file
-                existing_entries = {}
-                if file_path.exists():
-                    existing_entries = {
-                        entry["id"]: entry for entry in load_file(file_path)
-                    }
-
-                # Update existing entries with new data
-                for entry in entries:
-                    existing_entries[entry["id"]] = entry
-
-                # Sort entries by `id` and write them back to ensure order consistency
-                sorted_entries = sorted(existing_entries.values(), key=sort_key)
-                with open(file_path, "w") as f:
-                    for entry in sorted_entries:
-                        content = json.dumps(entry) + "\n"
-                        f.write(content)
-                        f.flush()
-
-            else:
-                # Normal mode: Append to the end of the file
-                # Note: We will sort all the entries at the end of the generation pipeline to ensure the order is consistent
-                entries.sort(key=sort_key)
-                with open(file_path, "a") as f:
-                    for entry in entries:
-                        content = json.dumps(entry) + "\n"
-                        f.write(content)
-                        f.flush()
+    def write(self, result, result_dir, update_mode=False):
+        """
+        Write one or more result entries to their result files. For writing many entries over time, use a
+        `ResultWriter`, which keeps the files open and batches the writes.
+        """
+        with ResultWriter(self, result_dir, update_mode=update_mode) as writer:
+            writer.write(result)
 
     #### FC methods ####
 
@@ -829,6 +1026,13 @@ class BaseHandler:
         """
         raise NotImplementedError
 
+    async def _aquery_FC(self, inference_data: dict):
+        """
+        Async version of `_query_FC`, used by `ainference`.
+        Handlers with an async client should override this; by default, `_query_FC` is run in a worker thread.
+        """
+        return await asyncio.to_thread(self._query_FC, inference_data)
+
     def _pre_query_processing_FC(self, inference_data: dict, test_entry: dict) -> dict:
         """
         Preprocess the testset entry before sending it to the model.
@@ -919,6 +1123,13 @@ class BaseHandler:
         """
         raise NotImplementedError
 
+    async def _aquery_prompting(self, inference_data: dict):
+        """
+        Async version of `_query_prompting`, used by `ainference`.
+        Handlers with an async client should override this; by default, `_query_prompting` is run in a worker thread.
+        """
+        return await asyncio.to_thread(self._query_prompting, inference_data)
+
     def _pre_query_processing_prompting(self, test_entry: dict) -> dict:
         """
         Preprocess the testset entry before sending it to the model.
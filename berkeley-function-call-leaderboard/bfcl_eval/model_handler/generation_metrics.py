@@ -0,0 +1,421 @@
+import bisect
+import functools
+import inspect
+import json
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Optional
+
+from bfcl_eval.model_handler.rate_limiter import get_handler_provider, is_rate_limit_error
+from bfcl_eval.utils import extract_test_category_from_id
+
+DEFAULT_METRICS_INTERVAL = 10.0
+# Upper bounds, in seconds, of the buckets of the request latency histograms
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+_METRIC_HELP = {
+    "bfcl_generation_requests_total": ("counter", "Model requests sent, by outcome."),
+    "bfcl_generation_retries_total": ("counter", "Model requests retried after an error."),
+    "bfcl_generation_request_latency_seconds": ("histogram", "Latency of the model requests."),
+    "bfcl_generation_entries_total": ("gauge", "Test entries scheduled for generation."),
+    "bfcl_generation_entries_completed_total": ("counter", "Test entries generated."),
+    "bfcl_generation_entries_failed_total": ("counter", "Test entries whose inference failed."),
+    "bfcl_generation_input_tokens_total": ("counter", "Input tokens of the generated entries."),
+    "bfcl_generation_output_tokens_total": ("counter", "Output tokens of the generated entries."),
+    "bfcl_generation_queue_depth": ("gauge", "Test entries ready to run, waiting for a free slot."),
+    "bfcl_generation_blocked_entries": ("gauge", "Test entries waiting for the entries they depend on."),
+    "bfcl_generation_in_flight": ("gauge", "Test entries being generated."),
+}
+
+
+def _sum_token_counts(value) -> float:
+    # Token counts are a number for single-turn entries, and nested lists (per turn, per step) for multi-turn entries
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    if isinstance(value, list):
+        return sum(_sum_token_counts(item) for item in value)
+    return 0
+
+
+class _Histogram:
+    def __init__(self) -> None:
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect.bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Upper bound of the bucket holding the `q` quantile, or the largest value observed if it is in the last bucket.
+        Returns None if nothing was observed.
+        """
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for bound, bucket_count in zip(LATENCY_BUCKETS, self.bucket_counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class GenerationMetrics:
+    """
+    Live metrics of a `bfcl generate` run, shared by the scheduler and the model handlers of the process.
+
+    The handlers report every attempt of a model request (latency, errors, rate limit errors, retries) per provider and
+    model, the scheduler reports its queue depth and number of entries in flight, and every generated entry adds its
+    token counts and outcome to the per-category totals. `snapshot` returns everything as a dict, and
+    `render_prometheus` in the Prometheus text format.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.start_time = time.time()
+        # (provider, model, outcome) -> count
+        self.requests = defaultdict(int)
+        # (provider, model) -> count
+        self.retries = defaultdict(int)
+        # (provider, model) -> histogram
+        self.request_latency = defaultdict(_Histogram)
+        # (model, category) -> count
+        self.entries_total = defaultdict(int)
+        self.entries_completed = defaultdict(int)
+        self.entries_failed = defaultdict(int)
+        # model -> count
+        self.input_tokens = defaultdict(float)
+        self.output_tokens = defaultdict(float)
+        # model -> gauge value
+        self.queue_depth = {}
+        self.blocked_entries = {}
+        self.in_flight = {}
+
+    def observe_request(
+        self, provider: str, model: str, latency: float, error: Optional[BaseException] = None
+    ) -> None:
+        if error is None:
+            outcome = "success"
+        elif is_rate_limit_error(error):
+            outcome = "rate_limited"
+        else:
+            outcome = "error"
+        with self._lock:
+            self.requests[(provider, model, outcome)] += 1
+            self.request_latency[(provider, model)].observe(latency)
+
+    def observe_retry(self, provider: str, model: str) -> None:
+        with self._lock:
+            self.retries[(provider, model)] += 1
+
+    def add_scheduled_entries(self, model: str, test_entry_ids: list[str]) -> None:
+        with self._lock:
+            for test_entry_id in test_entry_ids:
+                self.entries_total[(model, extract_test_category_from_id(test_entry_id))] += 1
+
+    def observe_entry(self, model: str, result: dict) -> None:
+        key = (model, extract_test_category_from_id(result["id"]))
+        with self._lock:
+            self.entries_completed[key] += 1
+            if isinstance(result["result"], str) and result["result"].startswith(
+                "Error during inference"
+            ):
+                self.entries_failed[key] += 1
+            self.input_tokens[model] += _sum_token_counts(result.get("input_token_count"))
+            self.output_tokens[model] += _sum_token_counts(result.get("output_token_count"))
+
+    def set_scheduler_state(
+        self, model: str, queue_depth: int, blocked_entries: int, in_flight: int
+    ) -> None:
+        with self._lock:
+            self.queue_depth[model] = queue_depth
+            self.blocked_entries[model] = blocked_entries
+            self.in_flight[model] = in_flight
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            providers = {}
+            for (provider, model), histogram in self.request_latency.items():
+                providers[f"{provider} ({model})"] = {
+                    "requests": {
+                        outcome: count
+                        for (p, m, outcome), count in self.requests.items()
+                        if (p, m) == (provider, model)
+                    },
+                    "retries": self.retries.get((provider, model), 0),
+                    "latency_mean": histogram.sum / histogram.count,
+                    "latency_p50": histogram.quantile(0.5),
+                    "latency_p90": histogram.quantile(0.9),
+                    "latency_p99": histogram.quantile(0.99),
+                }
+            models = {}
+            for model in {model for model, _ in self.entries_total}:
+                models[model] = {
+                    "queue_depth": self.queue_depth.get(model, 0),
+                    "blocked_entries": self.blocked_entries.get(model, 0),
+                    "in_flight": self.in_flight.get(model, 0),
+                    "input_tokens": self.input_tokens.get(model, 0),
+                    "output_tokens": self.output_tokens.get(model, 0),
+                    "categories": {
+                        category: {
+                            "total": total,
+                            "completed": self.entries_completed.get((m, category), 0),
+                            "failed": self.entries_failed.get((m, category), 0),
+                        }
+                        for (m, category), total in sorted(self.entries_total.items())
+                        if m == model
+                    },
+                }
+            return {
+                "timestamp": time.time(),
+                "elapsed": time.time() - self.start_time,
+                "providers": providers,
+                "models": models,
+            }
+
+    def render_prometheus(self) -> str:
+        samples = defaultdict(list)
+        with self._lock:
+            for (provider, model, outcome), count in self.requests.items():
+                samples["bfcl_generation_requests_total"].append(
+                    ({"provider": provider, "model": model, "outcome": outcome}, count)
+                )
+            for (provider, model), count in self.retries.items():
+                samples["bfcl_generation_retries_total"].append(
+                    ({"provider": provider, "model": model}, count)
+                )
+            for (provider, model), histogram in self.request_latency.items():
+                labels = {"provider": provider, "model": model}
+                cumulative = 0
+                for bound, bucket_count in zip(
+                    LATENCY_BUCKETS + (float("inf"),), histogram.bucket_counts
+                ):
+                    cumulative += bucket_count
+                    samples["bfcl_generation_request_latency_seconds"].append(
+                        (
+                            {**labels, "le": "+Inf" if bound == float("inf") else str(bound)},
+                            cumulative,
+                            "_bucket",
+                        )
+                    )
+                samples["bfcl_generation_request_latency_seconds"].append(
+                    (labels, histogram.sum, "_sum")
+                )
+                samples["bfcl_generation_request_latency_seconds"].append(
+                    (labels, histogram.count, "_count")
+                )
+            for name, values in [
+                ("bfcl_generation_entries_total", self.entries_total),
+                ("bfcl_generation_entries_completed_total", self.entries_completed),
+                ("bfcl_generation_entries_failed_total", self.entries_failed),
+            ]:
+                for (model, category), count in values.items():
+                    samples[name].append(({"model": model, "category": category}, count))
+            for name, values in [
+                ("bfcl_generation_input_tokens_total", self.input_tokens),
+                ("bfcl_generation_output_tokens_total", self.output_tokens),
+                ("bfcl_generation_queue_depth", self.queue_depth),
+                ("bfcl_generation_blocked_entries", self.blocked_entries),
+                ("bfcl_generation_in_flight", self.in_flight),
+            ]:
+                for model, value in values.items():
+                    samples[name].append(({"model": model}, value))
+
+        lines = []
+        for name, (metric_type, help_text) in _METRIC_HELP.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for sample in samples.get(name, []):
+                labels, value = sample[0], sample[1]
+                suffix = sample[2] if len(sample) > 2 else ""
+                label_str = ",".join(
+                    f'{key}="{_escape_label_value(label)}"' for key, label in labels.items()
+                )
+                lines.append(f"{name}{suffix}{{{label_str}}} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label_value(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class _MetricsFileWriter(threading.Thread):
+    """
+    Append a snapshot of the metrics to a JSONL file every `interval` seconds, along with the throughput since the
+    previous snapshot.
+    """
+
+    def __init__(self, metrics: GenerationMetrics, file_path: Path, interval: float) -> None:
+        super().__init__(daemon=True)
+        self.metrics = metrics
+        self.file_path = Path(file_path)
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._previous = None
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.write_snapshot()
+
+    def write_snapshot(self) -> None:
+        snapshot = self.metrics.snapshot()
+        previous = self._previous
+        for model, model_metrics in snapshot["models"].items():
+            completed = sum(
+                category["completed"] for category in model_metrics["categories"].values()
+            )
+            model_metrics["completed"] = completed
+            if previous is not None and model in previous["models"]:
+                duration = snapshot["timestamp"] - previous["timestamp"]
+                previous_model_metrics = previous["models"][model]
+                model_metrics["entries_per_second"] = (
+                    completed - previous_model_metrics["completed"]
+                ) / duration
+                model_metrics["output_tokens_per_second"] = (
+                    model_metrics["output_tokens"] - previous_model_metrics["output_tokens"]
+                ) / duration
+        self._previous = snapshot
+
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.file_path, "a") as f:
+            f.write(json.dumps(snapshot) + "\n")
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+        # The final state of the run
+        self.write_snapshot()
+
+
+def _start_metrics_server(metrics: GenerationMetrics, port: int) -> ThreadingHTTPServer:
+    class _MetricsRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = metrics.render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    # Only reachable from this machine, the endpoint has no authentication
+    server = ThreadingHTTPServer(("127.0.0.1", port), _MetricsRequestHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+_generation_metrics: Optional[GenerationMetrics] = None
+_metrics_file_writer: Optional[_MetricsFileWriter] = None
+_metrics_server: Optional[ThreadingHTTPServer] = None
+
+
+def configure_generation_metrics(
+    metrics_file: Optional[Path] = None,
+    metrics_port: Optional[int] = None,
+    interval: float = DEFAULT_METRICS_INTERVAL,
+) -> Optional[GenerationMetrics]:
+    """
+    Start collecting the generation metrics of this process, and export them to a JSONL file (every `interval` seconds)
+    and/or on a Prometheus endpoint (`http://localhost:<metrics_port>/metrics`). Returns None, and collects nothing, when
+    neither is requested.
+    """
+    global _generation_metrics, _metrics_file_writer, _metrics_server
+    shutdown_generation_metrics()
+    if metrics_file is None and metrics_port is None:
+        return None
+
+    _generation_metrics = GenerationMetrics()
+    if metrics_file is not None:
+        _metrics_file_writer = _MetricsFileWriter(_generation_metrics, metrics_file, interval)
+        _metrics_file_writer.start()
+    if metrics_port is not None:
+        _metrics_server = _start_metrics_server(_generation_metrics, metrics_port)
+        print(f"Serving the generation metrics on http://localhost:{metrics_port}/metrics")
+    return _generation_metrics
+
+
+def shutdown_generation_metrics() -> None:
+    """
+    Write the last snapshot of the metrics file and stop the metrics endpoint, if any.
+    """
+    global _generation_metrics, _metrics_file_writer, _metrics_server
+    if _metrics_file_writer is not None:
+        _metrics_file_writer.stop()
+    if _metrics_server is not None:
+        _metrics_server.shutdown()
+        _metrics_server.server_close()
+    _generation_metrics = _metrics_file_writer = _metrics_server = None
+
+
+def get_generation_metrics() -> Optional[GenerationMetrics]:
+    return _generation_metrics
+
+
+def report_retry(handler) -> None:
+    """
+    Count a retry of a model request of `handler`, if metrics are being collected.
+    """
+    metrics = _generation_metrics
+    if metrics is not None and getattr(handler, "model_name", None) is not None:
+        metrics.observe_retry(
+            get_handler_provider(handler), getattr(handler, "registry_name", handler.model_name)
+        )
+
+
+def metered(func: Callable) -> Callable:
+    """
+    Decorator for the `generate_with_backoff` methods of the model handlers, which reports the latency and outcome of
+    every call to the generation metrics (if they are being collected).
+    """
+
+    def _observe(args, start_time, error=None):
+        metrics = _generation_metrics
+        handler = args[0] if args else None
+        if metrics is None or getattr(handler, "model_name", None) is None:
+            return
+        metrics.observe_request(
+            get_handler_provider(handler),
+            getattr(handler, "registry_name", handler.model_name),
+            time.monotonic() - start_time,
+            error,
+        )
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapped(*args, **kwargs):
+            start_time = time.monotonic()
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                _observe(args, start_time, e)
+                raise
+            _observe(args, start_time)
+            return result
+
+        return async_wrapped
+
+    @functools.wraps(func)
+    def wrapped(*args, **kwargs):
+        start_time = time.monotonic()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            _observe(args, start_time, e)
+            raise
+        _observe(args, start_time)
+        return result
+
+    return wrapped
@@ -1,4 +1,5 @@
 import os
+import re
 from re import S
 import subprocess
 import threading
@@ -19,6 +20,11 @@ from bfcl_eval.model_handler.utils import (
 from openai import OpenAI
 from overrides import EnforceOverrides, final, override
 
+# Printed by the vLLM server once it accepts requests
+SERVER_READY_LOG_PATTERN = re.compile(r"Application startup complete|Uvicorn running on")
+# How often the endpoint is polled when the server log doesn't tell us it is ready
+SERVER_READY_POLL_INTERVAL = 2
+
 
 class OSSHandler(OpenAICompletionsHandler, EnforceOverrides):
     def __init__(
@@ -64,7 +70,7 @@ class OSSHandler(OpenAICompletionsHandler, EnforceOverrides):
         return os.getenv("VLLM_TOOL_CALL_PARSER", self.tool_call_parser)
 
     @override
-    def _query_FC(self, inference_data: dict):
+    def _build_query_kwargs_FC(self, inference_data: dict) -> dict:
         message: list[dict] = inference_data["message"]
         tools = inference_data["tools"]
         inference_data["inference_input_log"] = {"message": repr(message), "tools": tools}
@@ -84,10 +90,20 @@ class OSSHandler(OpenAICompletionsHandler, EnforceOverrides):
         if extra_body:
             kwargs["extra_body"] = extra_body
 
-        return self.generate_with_backoff(**kwargs)
+        return kwargs
+
+    @final
+    def set_local_server_port(self, port: int) -> None:
+        """
+        Point the handler to a local server on another port, eg. when several local servers run side by side.
+        """
+        self.local_server_port = port
+        self.base_url = f"http://{self.local_server_endpoint}:{port}/v1"
+        self.client = OpenAI(base_url=self.base_url, api_key=self.api_key)
+        self._async_client = None
 
     @override
-    def _query_prompting(self, inference_data: dict):
+    def _build_query_kwargs_prompting(self, inference_data: dict) -> dict:
         inference_data["inference_input_log"] = {"message": repr(inference_data["message"])}
 
         kwargs = {
@@ -100,7 +116,7 @@ class OSSHandler(OpenAICompletionsHandler, EnforceOverrides):
         if extra_body:
             kwargs["extra_body"] = extra_body
 
-        return self.generate_with_backoff(**kwargs)
+        return kwargs
 
     @final
     def spin_up_local_server(
@@ -113,10 +129,15 @@ class OSSHandler(OpenAICompletionsHandler, EnforceOverrides):
         lora_modules: Optional[list[str]] = None,
         enable_lora: bool = False,
         max_lora_rank: Optional[int] = None,
+        cuda_visible_devices: Optional[str] = None,
     ):
         """
         Spin up a local server for the model.
         If the server is already running, skip the setup.
+
+        The server is considered ready as soon as its log says so (and its endpoint answers); the endpoint is also
+        polled every few seconds in case the log doesn't. `cuda_visible_devices`, if given, restricts the server to
+        these GPUs.
         """
         if local_model_path is not None:
             self.model_path_or_id = local_model_path
@@ -129,6 +150,7 @@ class OSSHandler(OpenAICompletionsHandler, EnforceOverrides):
         # Event to signal threads to stop; no need to see logs after server is ready
         # declare early so it always exists
         self._stop_event = threading.Event()
+        server_ready_event = threading.Event()
         try:
             if not skip_server_setup:
                 if backend == "vllm":
@@ -166,11 +188,16 @@ class OSSHandler(OpenAICompletionsHandler, EnforceOverrides):
  
                     print(f"🚀Starting vLLM server with command: \"{' '.join(cmd)}\"")
                     
+                    env = None
+                    if cuda_visible_devices is not None:
+                        env = {**os.environ, "CUDA_VISIBLE_DEVICES": cuda_visible_devices}
+
                     process = subprocess.Popen(
                         cmd,
                         stdout=subprocess.PIPE,  # Capture stdout
                         stderr=subprocess.PIPE,  # Capture stderr
                         text=True,  # To get the output as text instead of bytes
+                        env=env,
                     )
                 else:
                     raise ValueError(f"Backend {backend} is not supported.")
@@ -178,6 +205,8 @@ class OSSHandler(OpenAICompletionsHandler, EnforceOverrides):
                 def log_subprocess_output(pipe, stop_event):
                     # Read lines until the pipe is closed (EOF)
                     for line in iter(pipe.readline, ""):
+                        if SERVER_READY_LOG_PATTERN.search(line):
+                            server_ready_event.set()
                         if not stop_event.is_set():
                             print(line, end="")
                     print("server log tracking thread stopped successfully.")
@@ -211,6 +240,10 @@ class OSSHandler(OpenAICompletionsHandler, EnforceOverrides):
                     raise Exception(
                         f"Subprocess terminated unexpectedly with code {process.returncode}"
                     )
+                if not skip_server_setup:
+                    # The log line announcing that the server is up cuts the wait short
+                    server_ready_event.wait(timeout=SERVER_READY_POLL_INTERVAL)
+                    server_ready_event.clear()
                 try:
                     # Make a simple request to check if the server is up
                     response = requests.get(f"{self.base_url}/models")
@@ -218,6 +251,8 @@ class OSSHandler(OpenAICompletionsHandler, EnforceOverrides):
                         server_ready = True
                         print("server is ready!")
                 except requests.exceptions.ConnectionError:
+                    pass
+                if not server_ready and skip_server_setup:
                     # If the connection is not ready, wait and try again
                     time.sleep(1)
 
@@ -0,0 +1,346 @@
+import asyncio
+import functools
+import inspect
+import re
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Mapping, Optional
+
+# Used when a rate limit error doesn't tell us how long to wait
+DEFAULT_COOLDOWN = 1.0
+# How often coroutines waiting for a free slot re-check the limiter, in seconds
+ASYNC_POLL_INTERVAL = 0.05
+
+_RATE_LIMIT_ERROR_PATTERN = re.compile(
+    r"RateLimit|TooManyRequests|Throttl|RESOURCE_EXHAUSTED|Status 429|\b429\b",
+    re.IGNORECASE,
+)
+# Durations in the `x-ratelimit-reset-*` headers look like "1s", "6m0s", "20ms" or "1h2m3.5s"
+_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600, "m": 60, "s": 1, "ms": 0.001}
+
+# (limit, remaining, reset) request headers used by the different providers
+_REQUEST_LIMIT_HEADERS = [
+    (
+        "x-ratelimit-limit-requests",
+        "x-ratelimit-remaining-requests",
+        "x-ratelimit-reset-requests",
+    ),
+    (
+        "anthropic-ratelimit-requests-limit",
+        "anthropic-ratelimit-requests-remaining",
+        "anthropic-ratelimit-requests-reset",
+    ),
+]
+
+
+class AdaptiveRateLimiter:
+    """
+    Rate limiter shared by every thread and coroutine that queries the same model from the same provider.
+
+    It combines two mechanisms:
+    - A token bucket, whose refill rate is learned from the rate limit headers of the provider (when it sends them).
+      Until the first response comes back, a single request is let through, so that a large pool of threads doesn't
+      run into the limit before the limiter had a chance to learn it.
+    - An AIMD (additive increase, multiplicative decrease) cap on the number of requests in flight. The cap is only
+      introduced once the provider starts rejecting requests; it is halved on a rate limit error and grows by about
+      one request per round trip of successful requests, so that throughput converges to the real limit.
+
+    On a rate limit error, every caller pauses until the `retry-after` hint (or `DEFAULT_COOLDOWN`) has passed, instead
+    of each thread backing off on its own and then retrying all at once.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._waiting_for_first_response = True
+        # None means no limit is known (yet)
+        self._concurrency_limit: Optional[float] = None
+        self._rate: Optional[float] = None
+        self._capacity = 1.0
+        self._tokens = 1.0
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        # Bumped on every decrease, so that the rate limit errors of one burst only halve the cap once
+        self._epoch = 0
+
+    def acquire(self) -> int:
+        """
+        Block until a request may be sent. Returns a ticket to pass to `release`.
+        """
+        with self._condition:
+            while True:
+                delay = self._try_acquire_locked()
+                if delay == 0:
+                    return self._epoch
+                self._condition.wait(timeout=delay)
+
+    async def aacquire(self) -> int:
+        """
+        Async version of `acquire`, which waits without blocking the event loop.
+        """
+        while True:
+            with self._condition:
+                delay = self._try_acquire_locked()
+                if delay == 0:
+                    return self._epoch
+            await asyncio.sleep(ASYNC_POLL_INTERVAL if delay is None else delay)
+
+    def _try_acquire_locked(self) -> Optional[float]:
+        """
+        Take a slot if one is available and return 0. Otherwise, return how long to wait before trying again, or None
+        to wait until another request is released.
+        """
+        now = time.monotonic()
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self._waiting_for_first_response and self._in_flight > 0:
+            return None
+        if (
+            self._concurrency_limit is not None
+            and self._in_flight >= int(self._concurrency_limit)
+        ):
+            return None
+        if self._rate is not None:
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._last_refill) * self._rate
+            )
+            self._last_refill = now
+            if self._tokens < 1:
+                return (1 - self._tokens) / self._rate
+            self._tokens -= 1
+        self._in_flight += 1
+        return 0
+
+    def release(
+        self,
+        ticket: int,
+        error: Optional[BaseException] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """
+        Report the outcome of a request taken with `acquire`.
+
+        Args:
+            ticket (int): The value returned by `acquire`.
+            error (BaseException, optional): The exception raised by the request, if any.
+            headers (Mapping[str, str], optional): The response headers, if available. The headers of an error are
+                extracted from the exception when not given.
+        """
+        if headers is None and error is not None:
+            headers = get_error_headers(error)
+        with self._condition:
+            self._in_flight -= 1
+            self._waiting_for_first_response = False
+            if headers:
+                self._update_from_headers_locked(headers)
+
+            if error is not None and is_rate_limit_error(error):
+                now = time.monotonic()
+                retry_after = parse_retry_after(headers) if headers else None
+                self._paused_until = max(
+                    self._paused_until,
+                    now + (retry_after if retry_after is not None else DEFAULT_COOLDOWN),
+                )
+                if ticket == self._epoch:
+                    self._epoch += 1
+                    current_limit = self._concurrency_limit or float(self._in_flight + 1)
+                    self._concurrency_limit = max(1.0, current_limit / 2)
+                    print(
+                        f"Rate limited by {self.name}. "
+                        f"Lowering the number of concurrent requests to {int(self._concurrency_limit)}."
+                    )
+            elif error is None and self._concurrency_limit is not None:
+                self._concurrency_limit += 1 / self._concurrency_limit
+
+            self._condition.notify_all()
+
+    def _update_from_headers_locked(self, headers: Mapping[str, str]) -> None:
+        headers = {key.lower(): value for key, value in headers.items()}
+        for limit_key, remaining_key, reset_key in _REQUEST_LIMIT_HEADERS:
+            if limit_key not in headers or remaining_key not in headers:
+                continue
+            try:
+                limit = float(headers[limit_key])
+                remaining = float(headers[remaining_key])
+            except ValueError:
+                continue
+            reset = _parse_reset(headers.get(reset_key))
+
+            # The provider refills its bucket continuously, and `reset` is the time until it is full again
+            if reset and limit > remaining:
+                self._rate = (limit - remaining) / reset
+            elif self._rate is None:
+                # Requests limits are per minute unless the reset time says otherwise
+                self._rate = limit / 60
+            self._capacity = max(1.0, limit)
+            # The requests still in flight will be counted against `remaining` by the provider
+            self._tokens = max(0.0, min(self._capacity, remaining - self._in_flight))
+            self._last_refill = time.monotonic()
+            return
+
+
+_rate_limiters: dict[tuple[str, str], AdaptiveRateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, model_name: str) -> AdaptiveRateLimiter:
+    """
+    Return the rate limiter shared by all the requests for `model_name` sent to `provider`.
+    """
+    key = (provider, model_name)
+    with _rate_limiters_lock:
+        if key not in _rate_limiters:
+            _rate_limiters[key] = AdaptiveRateLimiter(f"{provider} ({model_name})")
+        return _rate_limiters[key]
+
+
+def get_handler_rate_limiter(handler) -> Optional[AdaptiveRateLimiter]:
+    """
+    Return the rate limiter for a model handler, keyed by its provider and model name. Returns None for objects that
+    are not model handlers.
+    """
+    model_name = getattr(handler, "model_name", None)
+    if model_name is None:
+        return None
+    return get_rate_limiter(get_handler_provider(handler), model_name)
+
+
+def get_handler_provider(handler) -> str:
+    """
+    Identify the provider a model handler talks to: the endpoint of its client, or its model style when the client has
+    no endpoint. The rate limiters and the generation metrics are both keyed by it.
+    """
+    provider = getattr(getattr(handler, "client", None), "base_url", None)
+    if not provider:
+        model_style = getattr(handler, "model_style", None)
+        provider = getattr(model_style, "value", type(handler).__name__)
+    return str(provider)
+
+
+def rate_limited(func: Callable) -> Callable:
+    """
+    Decorator for the `generate_with_backoff` methods of the model handlers, which holds a slot of the handler's rate
+    limiter for the duration of each call. Handlers that can read the response headers pass them on with
+    `report_response_headers`.
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapped(*args, **kwargs):
+            limiter = get_handler_rate_limiter(args[0]) if args else None
+            if limiter is None:
+                return await func(*args, **kwargs)
+            ticket = await limiter.aacquire()
+            token = _response_headers.set(None)
+            try:
+                result = await func(*args, **kwargs)
+            except BaseException as e:
+                limiter.release(ticket, error=e)
+                raise
+            else:
+                limiter.release(ticket, headers=_response_headers.get())
+            finally:
+                _response_headers.reset(token)
+            return result
+
+        return async_wrapped
+
+    @functools.wraps(func)
+    def wrapped(*args, **kwargs):
+        limiter = get_handler_rate_limiter(args[0]) if args else None
+        if limiter is None:
+            return func(*args, **kwargs)
+        ticket = limiter.acquire()
+        token = _response_headers.set(None)
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            limiter.release(ticket, error=e)
+            raise
+        else:
+            limiter.release(ticket, headers=_response_headers.get())
+        finally:
+            _response_headers.reset(token)
+        return result
+
+    return wrapped
+
+
+# Headers of the response received by the current `rate_limited` call; each thread and task has its own value
+_response_headers: ContextVar[Optional[Mapping[str, str]]] = ContextVar(
+    "_response_headers", default=None
+)
+
+
+def report_response_headers(headers: Mapping[str, str]) -> None:
+    """
+    Hand the headers of a successful response to the rate limiter. Only has an effect when called from inside a
+    `generate_with_backoff` method.
+    """
+    _response_headers.set(headers)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """
+    Whether an exception raised by a provider SDK means that the request was rate limited.
+    """
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    if status == 429:
+        return True
+    return bool(_RATE_LIMIT_ERROR_PATTERN.search(f"{type(error).__name__}: {error}"))
+
+
+def get_error_headers(error: BaseException) -> Optional[Mapping[str, str]]:
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    return headers if isinstance(headers, Mapping) else None
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Return the number of seconds to wait according to the `retry-after-ms` or `retry-after` header, if present.
+    """
+    headers = {key.lower(): value for key, value in headers.items()}
+    try:
+        if "retry-after-ms" in headers:
+            return max(0.0, float(headers["retry-after-ms"]) / 1000)
+        if "retry-after" in headers:
+            value = headers["retry-after"]
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                return max(
+                    0.0,
+                    (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds(),
+                )
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+def _parse_reset(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a rate limit reset header, either a duration ("6m0s") or a RFC 3339 timestamp, into seconds from now.
+    """
+    if not value:
+        return None
+    matches = _DURATION_PATTERN.findall(value)
+    if matches and "".join(number + unit for number, unit in matches) == value:
+        return sum(float(number) * _DURATION_UNITS[unit] for number, unit in matches)
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
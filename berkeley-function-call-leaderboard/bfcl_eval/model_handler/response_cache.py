@@ -0,0 +1,183 @@
+import functools
+import hashlib
+import inspect
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+# The cache is not used at all
+PASSTHROUGH = "passthrough"
+# Responses are served from the cache when possible; the other requests go to the endpoint and are recorded
+RECORD = "record"
+# Responses are only served from the cache; a request that was never recorded is an error. Works fully offline
+REPLAY = "replay"
+RESPONSE_CACHE_MODES = [PASSTHROUGH, RECORD, REPLAY]
+
+
+class ResponseCacheMissError(Exception):
+    """
+    Raised in replay mode for a request that is not in the response cache.
+    """
+
+
+class ResponseCache:
+    """
+    Content-addressed cache of model responses, stored in a SQLite database.
+
+    The key of a request is a hash of everything that determines the response: the registry name of the model (which
+    identifies its provider and mode), the temperature and the arguments of the `generate_with_backoff` call (messages,
+    tools, etc.). The endpoint is left out on purpose, so that responses of a local model survive a change of port. The value is the pickled
+    `(api_response, latency)` tuple returned by the call, so a replayed run reports the latency of the recorded one.
+    """
+
+    def __init__(self, db_path: Path, mode: str) -> None:
+        if mode not in RESPONSE_CACHE_MODES:
+            raise ValueError(
+                f"Invalid response cache mode '{mode}'. Expected one of {RESPONSE_CACHE_MODES}."
+            )
+        self.db_path = Path(db_path)
+        self.mode = mode
+        self.num_hits = 0
+        self.num_misses = 0
+        # sqlite3 connections can't be shared between threads
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._warned_unpicklable = False
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = self._get_connection()
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, model_name TEXT, response BLOB NOT NULL, created_at REAL)"
+            )
+
+    def _get_connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.db_path, timeout=60)
+            # WAL lets readers and the writer work concurrently, and skips the fsync of every single insert
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str):
+        row = (
+            self._get_connection()
+            .execute("SELECT response FROM responses WHERE key = ?", (key,))
+            .fetchone()
+        )
+        with self._stats_lock:
+            if row is None:
+                self.num_misses += 1
+            else:
+                self.num_hits += 1
+        return None if row is None else pickle.loads(row[0])
+
+    def put(self, key: str, model_name: str, value) -> None:
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            # Eg. streamed responses; they are just not cached
+            if not self._warned_unpicklable:
+                self._warned_unpicklable = True
+                print(f"⚠️ Warning: Some responses of {model_name} can't be cached: {e}")
+            return
+        connection = self._get_connection()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, model_name, data, time.time()),
+            )
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def configure_response_cache(mode: str, db_path: Path) -> Optional[ResponseCache]:
+    """
+    Set the response cache used by all the handlers of this process. Returns None in passthrough mode.
+    """
+    global _response_cache
+    _response_cache = None if mode == PASSTHROUGH else ResponseCache(db_path, mode)
+    return _response_cache
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    return _response_cache
+
+
+def _json_default(value):
+    # Conversation histories may contain SDK objects, eg. the assistant messages of previous turns
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    return repr(value)
+
+
+def compute_request_key(handler, args: tuple, kwargs: dict) -> str:
+    content = json.dumps(
+        [
+            getattr(handler, "registry_name", None) or handler.model_name,
+            getattr(handler, "temperature", None),
+            args,
+            kwargs,
+        ],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=_json_default,
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def cached_response(func: Callable) -> Callable:
+    """
+    Decorator for the `generate_with_backoff` methods of the model handlers, which serves and records their return
+    values through the response cache configured with `configure_response_cache` (if any).
+    """
+
+    def _lookup(args, kwargs):
+        cache = _response_cache
+        if cache is None or not args or getattr(args[0], "model_name", None) is None:
+            return None, None, None
+        handler = args[0]
+        key = compute_request_key(handler, args[1:], kwargs)
+        cached = cache.get(key)
+        if cached is None and cache.mode == REPLAY:
+            raise ResponseCacheMissError(
+                f"No recorded response for this request to {handler.model_name} (key {key}) in {cache.db_path}. "
+                "Run with `--response-cache record` to record it."
+            )
+        return cache, key, cached
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapped(*args, **kwargs):
+            cache, key, cached = _lookup(args, kwargs)
+            if cached is not None:
+                return cached
+            result = await func(*args, **kwargs)
+            if cache is not None:
+                cache.put(key, args[0].model_name, result)
+            return result
+
+        return async_wrapped
+
+    @functools.wraps(func)
+    def wrapped(*args, **kwargs):
+        cache, key, cached = _lookup(args, kwargs)
+        if cached is not None:
+            return cached
+        result = func(*args, **kwargs)
+        if cache is not None:
+            cache.put(key, args[0].model_name, result)
+        return result
+
+    return wrapped
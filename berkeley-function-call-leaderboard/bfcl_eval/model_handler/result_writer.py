@@ -0,0 +1,204 @@
+import json
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, TextIO, Union
+
+from bfcl_eval.utils import _get_file_lock, load_file, make_json_serializable, sort_key
+
+if TYPE_CHECKING:
+    from bfcl_eval.model_handler.base_handler import BaseHandler
+
+# Flush the buffered entries to the result files once this many entries are pending...
+DEFAULT_BATCH_SIZE = 64
+# ...or once the oldest pending entry has waited this many seconds
+DEFAULT_FLUSH_INTERVAL = 1.0
+# Seconds between two fsyncs of the result files; flushed entries survive a crash of the process anyway, fsync only
+# protects them against a crash of the machine
+DEFAULT_FSYNC_INTERVAL = 60.0
+
+UPDATE_LOG_SUFFIX = ".updates"
+
+
+def get_update_log_path(result_file_path: Path) -> Path:
+    """
+    Path of the append-only log that holds the `--run-ids` updates of a result file until they are compacted into it.
+    """
+    return result_file_path.with_name(result_file_path.name + UPDATE_LOG_SUFFIX)
+
+
+def compact_update_log(result_file_path: Path) -> None:
+    """
+    Merge the update log of a result file (if any) into the file and delete the log.
+
+    The latest entry of each id wins, and the merged file is sorted by id. A partially written last line, left by an
+    interrupted run, is ignored.
+    """
+    result_file_path = Path(result_file_path)
+    log_path = get_update_log_path(result_file_path)
+    if not log_path.exists():
+        return
+
+    with _get_file_lock(result_file_path):
+        entries = _read_entries_with_update_log(result_file_path, log_path)
+
+        temp_path = result_file_path.with_name(result_file_path.name + ".tmp")
+        with open(temp_path, "w") as f:
+            for entry in sorted(entries.values(), key=sort_key):
+                f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, result_file_path)
+        log_path.unlink()
+
+
+def load_result_file(result_file_path: Path) -> list[dict]:
+    """
+    Load the entries of a result file, sorted by id, with the ones still pending in its update log merged in (as
+    `compact_update_log` would), eg. after an interrupted `--run-ids` run. The files themselves are left untouched, as
+    the generation that owns the update log may still be appending to it.
+    """
+    result_file_path = Path(result_file_path)
+    log_path = get_update_log_path(result_file_path)
+    if not log_path.exists():
+        return load_file(result_file_path, sort_by_id=True)
+
+    print(
+        f"⚠️ Including the results pending in {log_path.name}, left by an interrupted or ongoing `--run-ids` generation."
+    )
+    with _get_file_lock(result_file_path):
+        entries = _read_entries_with_update_log(result_file_path, log_path)
+    return sorted(entries.values(), key=sort_key)
+
+
+def _read_entries_with_update_log(result_file_path: Path, log_path: Path) -> dict:
+    """
+    Read a result file and then its update log, keeping the latest entry of each id.
+    """
+    entries = {}
+    for path in [result_file_path, log_path]:
+        if not path.exists():
+            continue
+        with open(path) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                entries[entry["id"]] = entry
+    return entries
+
+
+class ResultWriter:
+    """
+    Long-lived writer for the result files of a model.
+
+    Entries are serialized as soon as they are written, but only hit the disk in batches (every `batch_size` entries
+    or `flush_interval` seconds) through one buffered handle per result file, which is kept open until `close`. The
+    files are fsynced at most every `fsync_interval` seconds, and on `close`.
+
+    In update mode (`--run-ids`), entries go to an append-only update log next to each result file, which is merged
+    into the result file once, on `close`, instead of rewriting the whole file for every entry.
+
+    Entries are appended in completion order; the result files are sorted by id at the end of the generation.
+    """
+
+    def __init__(
+        self,
+        handler: "BaseHandler",
+        result_dir: Path,
+        update_mode: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        fsync_interval: float = DEFAULT_FSYNC_INTERVAL,
+    ) -> None:
+        self.handler = handler
+        self.result_dir = result_dir
+        self.update_mode = update_mode
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+
+        # Result file path -> open handle (of the update log in update mode)
+        self._handles: dict[Path, TextIO] = {}
+        # Result file path -> serialized lines waiting to be written
+        self._pending: dict[Path, list[str]] = {}
+        self._num_pending = 0
+        self._oldest_pending_time = None
+        self._last_fsync_time = time.monotonic()
+
+    def write(self, result: Union[dict, list[dict]]) -> None:
+        if isinstance(result, dict):
+            result = [result]
+
+        for entry in result:
+            entry = make_json_serializable(entry)
+            file_path = self.handler.get_result_file_path(entry["id"], self.result_dir)
+            self._pending.setdefault(file_path, []).append(json.dumps(entry) + "\n")
+            self._num_pending += 1
+        if self._oldest_pending_time is None and self._num_pending:
+            self._oldest_pending_time = time.monotonic()
+
+        if self._num_pending >= self.batch_size:
+            self.flush()
+        else:
+            self.flush_if_due()
+
+    def flush_if_due(self) -> None:
+        """
+        Flush the pending entries if the oldest of them has waited for `flush_interval` seconds.
+        """
+        if (
+            self._oldest_pending_time is not None
+            and time.monotonic() - self._oldest_pending_time >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self, fsync: bool = False) -> None:
+        """
+        Write the pending entries to their files. The files are also fsynced if `fsync` is set or if `fsync_interval`
+        seconds have passed since the last fsync.
+        """
+        for file_path, lines in self._pending.items():
+            handle = self._get_handle(file_path)
+            handle.write("".join(lines))
+            handle.flush()
+        self._pending.clear()
+        self._num_pending = 0
+        self._oldest_pending_time = None
+
+        now = time.monotonic()
+        if fsync or now - self._last_fsync_time >= self.fsync_interval:
+            for handle in self._handles.values():
+                os.fsync(handle.fileno())
+            self._last_fsync_time = now
+
+    def close(self) -> None:
+        """
+        Flush and fsync everything, close the files and, in update mode, compact the update logs.
+        """
+        self.flush(fsync=True)
+        for handle in self._handles.values():
+            handle.close()
+        if self.update_mode:
+            for file_path in self._handles:
+                compact_update_log(file_path)
+        self._handles.clear()
+
+    def _get_handle(self, file_path: Path) -> TextIO:
+        handle = self._handles.get(file_path)
+        if handle is None:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            # Results left in an update log by an interrupted run must not end up after the ones of this run
+            compact_update_log(file_path)
+            handle = open(
+                get_update_log_path(file_path) if self.update_mode else file_path, "a"
+            )
+            self._handles[file_path] = handle
+        return handle
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,109 @@
+import hashlib
+import json
+import os
+import pickle
+import threading
+import zlib
+from pathlib import Path
+from typing import Optional
+
+from bfcl_eval.utils import get_source_fingerprint
+
+# Bump when the content of the checkpoints changes, so that the ones left by an older version are ignored
+TURN_CHECKPOINT_VERSION = 1
+
+TURN_CHECKPOINT_DIR_NAME = ".turn_checkpoints"
+
+
+def compute_entry_fingerprint(handler, test_entry: dict, *extra) -> str:
+    """
+    Hash of everything a turn checkpoint depends on: the model, its temperature and the (not yet preprocessed) test
+    entry, plus any `extra` inference options that change the content of the result.
+    The source code of the package (handlers and backends) is part of it, so that a fix to either of them is never
+    resumed on top of a checkpoint made before it.
+    """
+    content = json.dumps(
+        [
+            TURN_CHECKPOINT_VERSION,
+            get_source_fingerprint(),
+            handler.registry_name,
+            handler.temperature,
+            test_entry,
+            extra,
+        ],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=repr,
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class TurnCheckpointStore:
+    """
+    Per-turn checkpoints of the multi-turn entries being generated, so that an interrupted run resumes an entry from
+    its last completed turn instead of from scratch.
+
+    Each entry in progress has one small side file, holding the zlib-compressed pickle of the inference state at the
+    end of its last completed turn: the `inference_data` of the handler, the responses and logs accumulated so far,
+    and the backend instances. The file is replaced atomically after every turn, and deleted once the entry completes.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+        self._warned_unpicklable = False
+        self._warning_lock = threading.Lock()
+
+    def _get_path(self, test_entry_id: str) -> Path:
+        return self.directory / (
+            test_entry_id.replace("/", "_").replace(":", "_") + ".pkl.z"
+        )
+
+    def load(self, test_entry_id: str, fingerprint: str) -> Optional[dict]:
+        """
+        Return the checkpoint of an entry, or None if there is none, or if it was made for a different version of the
+        entry (fingerprint mismatch) or is unreadable.
+        """
+        path = self._get_path(test_entry_id)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            checkpoint = pickle.loads(zlib.decompress(data))
+        except Exception:
+            return None
+        if checkpoint.get("fingerprint") != fingerprint:
+            return None
+        return checkpoint
+
+    def save(self, test_entry_id: str, checkpoint: dict) -> None:
+        try:
+            data = zlib.compress(
+                pickle.dumps(checkpoint, protocol=pickle.HIGHEST_PROTOCOL), level=1
+            )
+        except Exception as e:
+            # Eg. a handler keeping a client object in its `inference_data`; the entry is then just not checkpointed
+            with self._warning_lock:
+                if not self._warned_unpicklable:
+                    self._warned_unpicklable = True
+                    print(f"⚠️ Warning: Some multi-turn entries can't be checkpointed: {e}")
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._get_path(test_entry_id)
+        # Unique per process and thread, so that concurrent writers never share a temp file
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+
+    def discard(self, test_entry_id: str) -> None:
+        self._get_path(test_entry_id).unlink(missing_ok=True)
+
+    def remove_if_empty(self) -> None:
+        """
+        Remove the checkpoint directory if no entry is left unfinished.
+        """
+        try:
+            self.directory.rmdir()
+        except OSError:
+            pass
@@ -1,6 +1,7 @@
 import ast
 import builtins
 import copy
+import inspect
 import json
 import operator
 import re
@@ -17,6 +18,9 @@ from bfcl_eval.model_handler.parser.xml_parser import (
     parse_concise_xml_function_call,
     parse_verbose_xml_function_call,
 )
+from bfcl_eval.model_handler.generation_metrics import metered, report_retry
+from bfcl_eval.model_handler.rate_limiter import rate_limited
+from bfcl_eval.model_handler.response_cache import cached_response
 from bfcl_eval.utils import *
 from tenacity import (
     retry,
@@ -550,6 +554,13 @@ def retry_with_backoff(
     """
     Decorator to retry a function with exponential backoff based on specified error types or result conditions.
 
+    Every attempt also goes through the rate limiter shared by all the requests to the same provider and model (see
+    `bfcl_eval.model_handler.rate_limiter`), so that concurrent threads slow down together when the provider starts
+    rejecting requests, instead of each of them backing off and retrying on its own. The latency and outcome of every
+    attempt are reported to the generation metrics (see `bfcl_eval.model_handler.generation_metrics`).
+    The whole call is served from, or recorded to, the response cache when one is configured (see
+    `bfcl_eval.model_handler.response_cache`).
+
     Note:
         At least one of `error_type` or `error_message_pattern` must be provided.
         If both `error_type` and `error_message_pattern` are provided, the retry will occur if either condition is met.
@@ -586,20 +597,38 @@ def retry_with_backoff(
         # Combine all conditions using logical OR
         retry_policy = reduce(operator.or_, conditions)
 
-        @retry(
-            wait=wait_random_exponential(min=min_wait, max=max_wait),
-            retry=retry_policy,
-            before_sleep=lambda retry_state: print(
+        def before_sleep(retry_state):
+            print(
                 f"Attempt {retry_state.attempt_number} failed. "
                 f"Sleeping for {retry_state.next_action.sleep:.2f} seconds before retrying... "
                 f"Error: {retry_state.outcome.exception()}"
-            ),
+            )
+            if retry_state.args:
+                report_retry(retry_state.args[0])
+
+        retry_decorator = retry(
+            wait=wait_random_exponential(min=min_wait, max=max_wait),
+            retry=retry_policy,
+            before_sleep=before_sleep,
             **kwargs,
         )
+
+        func = rate_limited(metered(func))
+
+        # Coroutine functions need an async wrapper, so that tenacity awaits them and sleeps without blocking the event loop
+        if inspect.iscoroutinefunction(func):
+
+            @retry_decorator
+            async def async_wrapped(*args, **inner_kwargs):
+                return await func(*args, **inner_kwargs)
+
+            return cached_response(async_wrapped)
+
+        @retry_decorator
         def wrapped(*args, **inner_kwargs):
             return func(*args, **inner_kwargs)
 
-        return wrapped
+        return cached_response(wrapped)
 
     return decorator
 
@@ -0,0 +1,91 @@
+import argparse
+import statistics
+import subprocess
+import sys
+
+"""
+This script measures how long the `bfcl` CLI and the generation/evaluation pipelines take to import, to keep the
+startup time in check when adding a model handler or a dependency. The CLI only imports `constants/model_config.py`,
+which references the model handlers by dotted path; a handler module (and its provider SDK) must only be imported when
+a model that uses it is generated or evaluated.
+
+It also imports every model handler once, which catches a misspelled `model_handler` path in `model_config.py`.
+
+To run this script, use the following command:
+```
+cd berkeley-function-call-leaderboard/bfcl_eval/scripts
+python benchmark_import_time.py
+```
+The script exits with an error if the CLI takes longer than `--max-cli-seconds` to import, or if a handler can't be
+imported.
+"""
+
+# Module -> description; each one is imported in a fresh interpreter
+BENCHMARKED_MODULES = {
+    "bfcl_eval.__main__": "bfcl CLI (models, scores, ...)",
+    "bfcl_eval.constants.model_config": "Model registry",
+    "bfcl_eval._llm_response_generation": "Generation pipeline",
+    "bfcl_eval.eval_checker.eval_runner": "Evaluation pipeline",
+}
+
+IMPORT_TIME_SNIPPET = """
+import time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+IMPORT_ALL_HANDLERS_SNIPPET = """
+import time
+from bfcl_eval.constants.model_config import MODEL_CONFIG_MAPPING, import_model_handler
+
+start = time.perf_counter()
+failed = 0
+for model_handler in sorted({str(config.model_handler) for config in MODEL_CONFIG_MAPPING.values()}):
+    try:
+        import_model_handler(model_handler)
+    except Exception as e:
+        failed += 1
+        print(f"❌ {model_handler}: {type(e).__name__}: {e}")
+print(f"Imported all the model handlers in {time.perf_counter() - start:.2f}s")
+raise SystemExit(1 if failed else 0)
+"""
+
+
+def measure_import_time(module: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_TIME_SNIPPET.format(module=module)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        timings.append(float(output.strip().splitlines()[-1]))
+    return statistics.median(timings)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs per module; the median is reported.")
+    parser.add_argument("--max-cli-seconds", type=float, default=1.0, help="Import time budget of the bfcl CLI.")
+    args = parser.parse_args()
+
+    cli_import_time = None
+    for module, description in BENCHMARKED_MODULES.items():
+        import_time = measure_import_time(module, args.repeat)
+        if module == "bfcl_eval.__main__":
+            cli_import_time = import_time
+        print(f"{description:<32} {import_time:6.2f}s  ({module})")
+
+    handlers_ok = subprocess.run([sys.executable, "-c", IMPORT_ALL_HANDLERS_SNIPPET]).returncode == 0
+
+    if cli_import_time > args.max_cli_seconds:
+        print(
+            f"❌ The bfcl CLI takes {cli_import_time:.2f}s to import, over the budget of {args.max_cli_seconds:.2f}s. "
+            "Check for a module-level import of a model handler or of a heavy dependency, e.g. with "
+            "`python -X importtime -c 'import bfcl_eval.__main__'`."
+        )
+    if cli_import_time > args.max_cli_seconds or not handlers_ok:
+        sys.exit(1)
+    print("✅ Import times are within budget and all the model handlers can be imported.")
@@ -1,12 +1,23 @@
+import gc
 import json
 import os
 import hashlib
+import io
+import pickle
 import re
+from collections import OrderedDict
 from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from threading import Lock
 from filelock import FileLock
-from typing import Union
+from typing import Iterable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; without it, the JSON files are parsed with the standard library
+    orjson = None
 
 from bfcl_eval.constants.category_mapping import *
 from bfcl_eval.constants.default_prompts import (
@@ -183,8 +194,13 @@ def load_test_entries_from_id_file(id_file_path: Path) -> tuple[list[str], list[
         if not test_ids:
             continue
         # Extend the entries list with only those whose id is present in the ID list
+        test_ids = set(test_ids)
         entries.extend(
-            [entry for entry in load_dataset_entry(category) if entry["id"] in test_ids]
+            [
+                entry
+                for entry in load_dataset_entry(category, entry_ids=test_ids)
+                if entry["id"] in test_ids
+            ]
         )
         categories.append(category)
 
@@ -204,6 +220,15 @@ def is_memory(test_category):
     return "memory" in test_category
 
 
+def is_loaded_as_is(test_category: str) -> bool:
+    # The entries of these categories are not renamed or generated during loading, so their ids match the dataset file
+    return not (
+        is_format_sensitivity(test_category)
+        or is_web_search(test_category)
+        or is_memory(test_category)
+    )
+
+
 def is_first_memory_prereq_entry(test_entry_id):
     return "prereq" in test_entry_id and test_entry_id.endswith("-0")
 
@@ -352,21 +377,116 @@ def get_directory_structure_by_category(test_category: str) -> str:
 #### Helper functions to load/write the dataset files ####
 
 
-def load_file(file_path, sort_by_id: bool = False, use_lock: bool = True) -> list[dict]:
-    result = []
+def json_loads(data: Union[str, bytes]):
+    """
+    Parse a JSON document, with orjson when it is installed.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than `json` (eg. on NaN or very large integers), so give `json` a chance as well
+            pass
+    return json.loads(data)
 
-    def _load_entries(input_path: str) -> None:
-        with open(input_path) as f:
-            file = f.readlines()
-            for line in file:
-                content = json.loads(line)
-                result.append(content)
+
+class _CachedJsonlFile:
+    """
+    Raw lines of a JSONL file, along with the (mtime, size) stamp of the file when it was read.
+    """
+
+    __slots__ = ("stamp", "lines", "num_bytes", "_id_index")
+
+    def __init__(self, stamp: tuple[int, int], data: bytes) -> None:
+        self.stamp = stamp
+        self.lines = [line for line in data.splitlines() if line]
+        self.num_bytes = len(data)
+        self._id_index = None
+
+    def get_id_index(self) -> dict[str, int]:
+        """
+        Map the id of each entry to its line number. The ids are read off the start of the lines, so that building the
+        index doesn't require parsing the entries.
+        """
+        if self._id_index is None:
+            id_index = {}
+            for line_number, line in enumerate(self.lines):
+                match = _ENTRY_ID_PATTERN.match(line)
+                if match and b"\\" not in match.group(1):
+                    entry_id = match.group(1).decode()
+                else:
+                    entry_id = json_loads(line)["id"]
+                id_index.setdefault(entry_id, line_number)
+            self._id_index = id_index
+        return self._id_index
+
+
+# All the entries we write start with their id, eg. `{"id": "simple_python_0", ...`
+_ENTRY_ID_PATTERN = re.compile(rb'\{\s*"id"\s*:\s*"([^"]*)"')
+# Process-wide cache of the JSONL files read by `load_file`, keyed by absolute path, in least recently used order
+_JSONL_FILE_CACHE: "OrderedDict[str, _CachedJsonlFile]" = OrderedDict()
+_JSONL_FILE_CACHE_LOCK = Lock()
+_JSONL_FILE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+def _read_jsonl_file(file_path, use_lock: bool) -> _CachedJsonlFile:
+    abs_path = os.path.abspath(file_path)
+    stat = os.stat(abs_path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _JSONL_FILE_CACHE_LOCK:
+        cached = _JSONL_FILE_CACHE.get(abs_path)
+        if cached is not None and cached.stamp == stamp:
+            _JSONL_FILE_CACHE.move_to_end(abs_path)
+            return cached
+
+    def _read() -> _CachedJsonlFile:
+        with open(abs_path, "rb") as f:
+            # Stamp before reading: if the file changes in the meantime, the stale stamp makes the next call read it again
+            stat = os.fstat(f.fileno())
+            return _CachedJsonlFile((stat.st_mtime_ns, stat.st_size), f.read())
 
     if use_lock:
-        with _get_file_lock(file_path):
-            _load_entries(file_path)
+        with _get_file_lock(abs_path):
+            cached = _read()
     else:
-        _load_entries(file_path)
+        cached = _read()
+
+    with _JSONL_FILE_CACHE_LOCK:
+        _JSONL_FILE_CACHE[abs_path] = cached
+        _JSONL_FILE_CACHE.move_to_end(abs_path)
+        total_bytes = sum(entry.num_bytes for entry in _JSONL_FILE_CACHE.values())
+        while total_bytes > _JSONL_FILE_CACHE_MAX_BYTES and len(_JSONL_FILE_CACHE) > 1:
+            _, evicted = _JSONL_FILE_CACHE.popitem(last=False)
+            total_bytes -= evicted.num_bytes
+    return cached
+
+
+def load_file(
+    file_path,
+    sort_by_id: bool = False,
+    use_lock: bool = True,
+    entry_ids: Optional[Iterable[str]] = None,
+) -> list[dict]:
+    """
+    Load the entries of a JSONL file.
+
+    The raw content of the files is cached for the whole process and only read again when the mtime or size of the file
+    changes; the entries are parsed again on every call, so callers are free to modify them.
+    If `entry_ids` is provided, only the entries with these ids are parsed and returned (in file order). Ids that are
+    not in the file are ignored.
+    """
+    cached = _read_jsonl_file(file_path, use_lock)
+
+    if entry_ids is None:
+        lines = cached.lines
+    else:
+        id_index = cached.get_id_index()
+        line_numbers = sorted(
+            {id_index[entry_id] for entry_id in entry_ids if entry_id in id_index}
+        )
+        lines = [cached.lines[line_number] for line_number in line_numbers]
+
+    result = [json_loads(line) for line in lines]
 
     if sort_by_id:
         result.sort(key=sort_key)
@@ -399,17 +519,170 @@ def sort_file_content_by_id(file_path: Path) -> None:
             write_list_of_dicts_to_file(file_path, sorted_entries, use_lock=False)
 
 
+#### Helper functions for the caches keyed on the source code ####
+
+
+@lru_cache(maxsize=None)
+def get_source_fingerprint() -> str:
+    """
+    Hash the source code of the `bfcl_eval` package.
+    Any change to a checker, a model handler, a backend or a model config invalidates everything keyed on it (the
+    cached verdicts, the ground truth executions and the turn checkpoints).
+    """
+    digest = hashlib.sha256()
+    for source_file in sorted(PACKAGE_ROOT.rglob("*.py")):
+        digest.update(str(source_file.relative_to(PACKAGE_ROOT)).encode())
+        digest.update(source_file.read_bytes())
+    return digest.hexdigest()
+
+
+#### Helper functions for the preprocessed dataset cache ####
+
+# Bump to invalidate every cached dataset, eg. when the layout of the cache files changes
+DATASET_CACHE_VERSION = 1
+
+
+@lru_cache(maxsize=None)
+def get_dataset_fingerprint() -> str:
+    """
+    Hash the dataset files along with the code that preprocesses them (this module and the constants).
+    """
+    digest = hashlib.sha256(f"v{DATASET_CACHE_VERSION}".encode())
+    source_files = [Path(__file__)] + sorted((PACKAGE_ROOT / "constants").glob("*.py"))
+    for file_path in sorted(PROMPT_PATH.rglob("*")) + source_files:
+        if file_path.is_file():
+            digest.update(str(file_path.relative_to(PACKAGE_ROOT)).encode())
+            digest.update(file_path.read_bytes())
+    return digest.hexdigest()
+
+
+def get_dataset_cache_file_path(
+    test_category: str, include_prereq: bool, include_language_specific_hint: bool
+) -> Path:
+    flags = f"{'prereq' if include_prereq else 'no_prereq'}_{'hint' if include_language_specific_hint else 'no_hint'}"
+    return DATASET_CACHE_PATH / f"{VERSION_PREFIX}_{test_category}_{flags}.pkl"
+
+
+def _load_dataset_cache(cache_file_path: Path) -> Optional[list[dict]]:
+    """
+    Return the cached entries, or None if there is no cache or it is out of date.
+    """
+    # The cache files start with the fingerprint they were built with, so stale ones are detected without unpickling the entries
+    gc_was_enabled = gc.isenabled()
+    # Unpickling creates lots of small objects; the garbage collector would otherwise spend more time than the unpickling itself
+    gc.disable()
+    try:
+        # Unpickling from memory is noticeably faster than from a buffered file
+        cache_file = io.BytesIO(cache_file_path.read_bytes())
+        if pickle.load(cache_file) != get_dataset_fingerprint():
+            return None
+        return pickle.load(cache_file)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # A corrupted or incompatible cache file is not fatal; the entries are just rebuilt
+        return None
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _save_dataset_cache(cache_file_path: Path, entries: list[dict]) -> None:
+    try:
+        cache_file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so that concurrent processes never read a partial cache file
+        temp_file_path = cache_file_path.with_name(f"{cache_file_path.name}.{os.getpid()}.tmp")
+        with open(temp_file_path, "wb") as f:
+            pickle.dump(get_dataset_fingerprint(), f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file_path, cache_file_path)
+    except OSError:
+        # The cache is an optimization only, eg. the project root might be read-only
+        pass
+
+
 def load_dataset_entry(
     test_category: str,
     include_prereq: bool = True,
     include_language_specific_hint: bool = True,
+    entry_ids: Optional[Iterable[str]] = None,
 ) -> list[dict]:
     """
     This function retrieves the dataset entry for a given test category.
     The input should not be a test category goup, but a specific test category.
     If `contain_prereq` is True, it will include the pre-requisite entries for the memory test categories.
     If `include_language_specific_hint` is True, it will include the language-specific hint for the function description (for Java, JavaScript, and Python).
+    `entry_ids` is a hint to only load the given entries. It is honored for the categories whose entries are read as-is from their dataset file, which then skip parsing the rest of the file; other categories (format sensitivity, memory, web search) still return all their entries.
+
+    The fully preprocessed entries of each (category, flags) combination are cached on disk in `DATASET_CACHE_PATH`, and
+    the cache is invalidated whenever the dataset files or the preprocessing code change (see `get_dataset_fingerprint`).
     """
+    if entry_ids is not None and is_loaded_as_is(test_category):
+        # Parsing the few requested entries is cheaper than loading the whole category from the cache
+        return _build_dataset_entry(
+            test_category, include_prereq, include_language_specific_hint, entry_ids
+        )
+
+    cache_file_path = get_dataset_cache_file_path(
+        test_category, include_prereq, include_language_specific_hint
+    )
+    all_entries = _load_dataset_cache(cache_file_path)
+    if all_entries is None:
+        all_entries = _build_dataset_entry(
+            test_category, include_prereq, include_language_specific_hint
+        )
+        _save_dataset_cache(cache_file_path, all_entries)
+
+    return all_entries
+
+
+# Number of entries of each test category, cached next to the preprocessed entries
+DATASET_ENTRY_COUNT_FILE_NAME = "entry_counts.json"
+
+
+@lru_cache(maxsize=None)
+def get_dataset_entry_count(test_category: str) -> int:
+    """
+    Return the number of entries of a test category (without the pre-requisite entries of the memory categories).
+
+    The counts are kept in `DATASET_CACHE_PATH` along with the fingerprint of the dataset, so that they are only
+    computed (by loading the category) once for each version of the dataset.
+    """
+    count_file_path = DATASET_CACHE_PATH / DATASET_ENTRY_COUNT_FILE_NAME
+    try:
+        with open(count_file_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached["fingerprint"] != get_dataset_fingerprint():
+            cached = None
+    except (OSError, ValueError, KeyError, TypeError):
+        cached = None
+    counts = cached["counts"] if cached is not None else {}
+
+    if test_category in counts:
+        return counts[test_category]
+
+    counts[test_category] = len(
+        load_dataset_entry(
+            test_category, include_prereq=False, include_language_specific_hint=False
+        )
+    )
+    try:
+        DATASET_CACHE_PATH.mkdir(parents=True, exist_ok=True)
+        temp_file_path = count_file_path.with_name(f"{count_file_path.name}.{os.getpid()}.tmp")
+        with open(temp_file_path, "w", encoding="utf-8") as f:
+            json.dump({"fingerprint": get_dataset_fingerprint(), "counts": counts}, f)
+        os.replace(temp_file_path, count_file_path)
+    except OSError:
+        pass
+    return counts[test_category]
+
+
+def _build_dataset_entry(
+    test_category: str,
+    include_prereq: bool,
+    include_language_specific_hint: bool,
+    entry_ids: Optional[Iterable[str]] = None,
+) -> list[dict]:
     if is_format_sensitivity(test_category):
         # Format sensitivity categories
         all_entries = load_format_sensitivity_test_cases()
@@ -431,7 +704,7 @@ def load_dataset_entry(
     else:
         # All other categories, we don't need any special handling
         file_name = f"{VERSION_PREFIX}_{test_category}.json"
-        all_entries = load_file(PROMPT_PATH / file_name)
+        all_entries = load_file(PROMPT_PATH / file_name, entry_ids=entry_ids)
 
     all_entries = process_agentic_test_case(all_entries)
     all_entries = populate_test_cases_with_predefined_functions(all_entries)
@@ -442,10 +715,13 @@ def load_dataset_entry(
     return all_entries
 
 
-def load_ground_truth_entry(test_category: str) -> list[dict]:
+def load_ground_truth_entry(
+    test_category: str, entry_ids: Optional[Iterable[str]] = None
+) -> list[dict]:
     """
     This function retrieves the ground truth entry for a given test category.
     The input should not be a test category goup, but a specific test category.
+    `entry_ids` is honored for the same categories as in `load_dataset_entry`, so that both stay aligned by index.
     """
     if is_format_sensitivity(test_category):
         return load_format_sensitivity_ground_truth_entry()
@@ -457,7 +733,10 @@ def load_ground_truth_entry(test_category: str) -> list[dict]:
         return load_file(POSSIBLE_ANSWER_PATH / f"{VERSION_PREFIX}_web_search.json")
 
     else:
-        return load_file(POSSIBLE_ANSWER_PATH / f"{VERSION_PREFIX}_{test_category}.json")
+        return load_file(
+            POSSIBLE_ANSWER_PATH / f"{VERSION_PREFIX}_{test_category}.json",
+            entry_ids=entry_ids,
+        )
 
 
 def write_list_of_dicts_to_file(filename, data, subdir=None, use_lock: bool = True) -> None: